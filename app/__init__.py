@@ -2,6 +2,7 @@ import os
 import pathlib
 import secrets
 from collections.abc import Callable
+from functools import partial
 from time import monotonic
 
 import jinja2
@@ -52,7 +53,7 @@ from app.extensions import antivirus_client, redis_client, zendesk_client  # noq
 from app.models.organisation import Organisation
 from app.models.service import Service
 from app.models.user import AnonymousUser, User
-from app.notify_client import InviteTokenError
+from app.notify_client import InviteTokenError, cache, run_concurrently
 from app.notify_client.api_key_api_client import api_key_api_client  # noqa
 from app.notify_client.billing_api_client import billing_api_client  # noqa
 from app.notify_client.complaint_api_client import complaint_api_client  # noqa
@@ -135,6 +136,7 @@ from app.overrides_nl.navigation import (
     OrgNavigation,
     PlatformAdminNavigation,
 )
+from app.performance import init_backend_call_tracing
 from app.s3_client.logo_client import logo_client
 from app.template_previews import template_preview_client  # noqa
 from app.url_converters import (
@@ -202,6 +204,7 @@ def create_app(application):
 
     utils_logging.init_app(application)
     webauthn_server.init_app(application)
+    init_backend_call_tracing(application)
 
     login_manager.login_view = "main.sign_in"
     login_manager.login_message_category = "default"
@@ -228,6 +231,7 @@ def init_app(application):
     # Load user first (as we want user_id to be available for all calls to API, which service+organisation might make.
     application.before_request(make_nonce_before_request)
     application.before_request(load_user_id_before_request)
+    application.before_request(prefetch_request_context_before_request)
     application.before_request(load_service_before_request)
     application.before_request(load_organisation_before_request)
 
@@ -299,18 +303,54 @@ def load_user(user_id):
     return User.from_id(user_id)
 
 
+def _get_service_id_for_request():
+    if request.view_args:
+        return request.view_args.get("service_id", session.get("service_id"))
+    return session.get("service_id")
+
+
+def prefetch_request_context_before_request():
+    """
+    Reads the cached user and service for this request from Redis in one round trip, and gets anything which isn’t
+    cached (and the organisation, which never is) from the API at the same time. The loaders which run next then
+    find everything they need already fetched.
+    """
+    # Without Redis there’s nothing to read in one go, and nowhere to keep what we get from the API for the loaders
+    if request.path.startswith("/static/") or not redis_client.active:
+        return
+
+    loaders = {}
+    if g.user_id:
+        loaders[f"user-{g.user_id}"] = partial(User.from_id, g.user_id)
+    if service_id := _get_service_id_for_request():
+        loaders[f"service-{service_id}"] = partial(Service.from_id, service_id)
+
+    calls = [loaders[key] for key in cache.prefetch(list(loaders))]
+    if org_id := (request.view_args or {}).get("org_id"):
+        calls.append(partial(Organisation.from_id, org_id))
+
+    # A single call gains nothing from being made here rather than by its loader
+    if len(calls) < 2:
+        return
+
+    try:
+        results = run_concurrently(*calls)
+    except Exception:
+        # The loaders will make these calls again and handle any errors (for example a 404 for a service which
+        # doesn’t exist) themselves
+        return
+
+    if org_id:
+        g.prefetched_organisation = results[-1]
+
+
 def load_service_before_request():
     g.current_service = None
 
     if request.path.startswith("/static/"):
         return
 
-    if request.view_args:
-        service_id = request.view_args.get("service_id", session.get("service_id"))
-    else:
-        service_id = session.get("service_id")
-
-    if service_id:
+    if service_id := _get_service_id_for_request():
         try:
             g.current_service = Service.from_id(service_id)
         except HTTPError as exc:
@@ -322,6 +362,7 @@ def load_service_before_request():
 
 
 def load_organisation_before_request():
+    prefetched_organisation = g.pop("prefetched_organisation", None)
     g.current_organisation = None
 
     if request.path.startswith("/static/"):
@@ -332,7 +373,9 @@ def load_organisation_before_request():
 
         if org_id:
             try:
-                g.current_organisation = Organisation.from_id(org_id)
+                g.current_organisation = (
+                    Organisation.from_id(org_id) if prefetched_organisation is None else prefetched_organisation
+                )
             except HTTPError as exc:
                 # if org id isn't real, then 404 rather than 500ing later because we expect org to be set
                 if exc.status_code == 404:
@@ -381,9 +424,12 @@ def useful_headers_after_request(response):
             )
         ),
     )
-    if "Cache-Control" in response.headers:
-        del response.headers["Cache-Control"]
-    response.headers.add("Cache-Control", "no-store, no-cache, private, must-revalidate")
+    # Responses with an ETag which set their own caching headers (like letter previews) keep them, so the browser
+    # can store them and revalidate them with `If-None-Match`
+    if not (response.get_etag()[0] and "Cache-Control" in response.headers):
+        if "Cache-Control" in response.headers:
+            del response.headers["Cache-Control"]
+        response.headers.add("Cache-Control", "no-store, no-cache, private, must-revalidate")
     for key, value in response.headers:
         response.headers[key] = SanitiseASCII.encode(value)
     response.headers.add("Strict-Transport-Security", "max-age=31536000; preload")
@@ -23,6 +23,8 @@ class CheckReportStatus {
     this.reportReadyStatus = 'stored';
     this.reportFailedStatus = 'failed';
     this.currentCheck = null;
+    // once we know the status, the server waits for it to change before responding
+    this.status = null;
 
   }
 
@@ -31,27 +33,32 @@ class CheckReportStatus {
   }
 
   async checkStatus() {
+    const startedAt = Date.now();
     try {
-      const response = await fetch(this.reportStatusEndpoint);
+      const response = await fetch(
+        this.status ? `${this.reportStatusEndpoint}?status=${encodeURIComponent(this.status)}` : this.reportStatusEndpoint
+      );
       if (!response.ok) {
         throw new Error('Error checking report status: no response');
       }
       const data = await response.json();
-      this.processStatus(data.status);
+      this.processStatus(data.status, startedAt);
     } catch (error) {
       console.error('Error checking report status:', error);
       setTimeout(this.runCheck.bind(this), this.fetchInterval);
     }
   }
 
-  processStatus(status) {
+  processStatus(status, startedAt = Date.now()) {
     if (status === this.reportReadyStatus || status === this.reportFailedStatus) {
       this.updatePageText();
       setTimeout(() => {
         location.replace(location.pathname);
       }, this.redirectDelay);
     } else {
-      setTimeout(this.runCheck.bind(this), this.fetchInterval);
+      this.status = status;
+      // if the server already waited for the status to change, check again straight away
+      setTimeout(this.runCheck.bind(this), Math.max(this.fetchInterval - (Date.now() - startedAt), 0));
     }
   }
 
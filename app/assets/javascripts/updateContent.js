@@ -45,6 +45,9 @@
 
   var clearQueue = queue => (queue.length = 0);
 
+  // The server can ask for a longer interval, for example if nothing has changed for a while
+  var getServerInterval = jqXHR => parseInt(jqXHR.getResponseHeader('X-Poll-Interval'), 10) || 0;
+
   var poll = function(renderer, resource, queue, form) {
     let timeout;
     let startTime = Date.now();
@@ -55,15 +58,22 @@
         resource,
         {
           'method': form ? 'post' : 'get',
-          'data': form ? $('#' + form).serialize() : {}
+          'data': form ? $('#' + form).serialize() : {},
+          // send the ETag of the last response so the server can reply with an empty 304 if nothing has changed
+          'ifModified': !form
         }
       ).done(
-        response => {
-          flushQueue(queue, response);
-          if (response.stop === 1) {
+        (response, textStatus, jqXHR) => {
+          if (textStatus === 'notmodified') {
+            clearQueue(queue); // nothing to render
+          } else {
+            flushQueue(queue, response);
+          }
+          if (response && response.stop === 1) {
             window.clearTimeout(timeout); // stop polling
           } else {
-            interval = calculateBackoff(Date.now() - startTime); // keep polling but adjust for response time
+            // keep polling but adjust for response time
+            interval = Math.max(calculateBackoff(Date.now() - startTime), getServerInterval(jqXHR));
           }
         }
       ).fail(
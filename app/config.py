@@ -63,6 +63,21 @@ class Config:
 
     REPLY_TO_EMAIL_ADDRESS_VALIDATION_TIMEOUT = int(os.environ.get("REPLY_TO_EMAIL_ADDRESS_VALIDATION_TIMEOUT", 45))
 
+    # Outbound HTTP connections (to the API and template preview) are pooled and shared across requests in each
+    # worker. HTTP_POOL_MAXSIZE is the number of kept-alive connections per host; requests beyond that open a
+    # short-lived connection, or wait for a free one if HTTP_POOL_BLOCK is set.
+    HTTP_POOL_CONNECTIONS = int(os.environ.get("HTTP_POOL_CONNECTIONS", 10))
+    HTTP_POOL_MAXSIZE = int(os.environ.get("HTTP_POOL_MAXSIZE", 100))
+    HTTP_POOL_BLOCK = os.environ.get("HTTP_POOL_BLOCK") == "1"
+    HTTP_MAX_RETRIES = int(os.environ.get("HTTP_MAX_RETRIES", 2))
+    HTTP_RETRY_BACKOFF_FACTOR = float(os.environ.get("HTTP_RETRY_BACKOFF_FACTOR", 0.1))
+    HTTP_POOL_STATS_ENABLED = os.environ.get("HTTP_POOL_STATS_ENABLED") == "1"
+
+    # A warning is logged when a request makes more calls than this to the API, S3 and template preview put together.
+    # BACKEND_CALL_BUDGETS overrides the budget for particular endpoints, for example `{"main.service_dashboard": 10}`
+    BACKEND_CALL_BUDGET = int(os.environ.get("BACKEND_CALL_BUDGET", 25))
+    BACKEND_CALL_BUDGETS = json.loads(os.environ.get("BACKEND_CALL_BUDGETS") or "{}")
+
     NOTIFY_ENVIRONMENT = os.environ.get("NOTIFY_ENVIRONMENT", "development")
     S3_BUCKET_CSV_UPLOAD = os.environ.get("S3_BUCKET_CSV_UPLOAD", "local-notifications-csv-upload")
     S3_BUCKET_CONTACT_LIST_UPLOAD = os.environ.get("S3_BUCKET_CONTACT_LIST_UPLOAD", "local-contact-list")
@@ -78,11 +93,16 @@ class Config:
     S3_BUCKET_REPORT_REQUESTS_DOWNLOAD = os.environ.get(
         "S3_BUCKET_REPORT_REQUESTS_DOWNLOAD", "local-report-requests-download"
     )
+    # Send people downloading a report to a short-lived pre-signed S3 URL, rather than streaming it through the app
+    REPORT_REQUEST_DOWNLOAD_REDIRECT = os.environ.get("REPORT_REQUEST_DOWNLOAD_REDIRECT") == "1"
+    REPORT_REQUEST_DOWNLOAD_URL_EXPIRY_IN_SECONDS = 60
     LOGO_CDN_DOMAIN = os.environ.get("LOGO_CDN_DOMAIN", "static-logos.notify.tools")
     ANTIVIRUS_ENABLED = True
 
     REDIS_URL = os.environ.get("REDIS_URL")
     REDIS_ENABLED = False if os.environ.get("REDIS_ENABLED") == "0" else True
+    # Only turn on once every instance runs a release which can read compressed cache values
+    REDIS_CACHE_COMPRESSION_ENABLED = os.environ.get("REDIS_CACHE_COMPRESSION_ENABLED") == "1"
 
     ASSET_DOMAIN = os.environ.get("ASSET_DOMAIN", "")
     ASSET_PATH = os.environ.get("ASSET_PATH", "/static/")
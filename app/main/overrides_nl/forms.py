@@ -449,20 +449,28 @@ class RadioFieldWithNoneOption(FieldWithNoneOption, RadioField):
 
 class NestedFieldMixin:
     def children(self):
+        # iterating over a field creates new options each time, so only do it once
+        options = list(self)
+
+        # group options by the folder they're in, in one pass, rather than searching every folder for every option
+        parent_ids_by_folder_id = {}
+        for folder in self.all_template_folders:
+            parent_ids_by_folder_id.setdefault(folder["id"], []).append(folder["parent_id"])
+        options_by_parent_id = {}
+        for option in options:
+            for parent_id in parent_ids_by_folder_id.get(option.data, ()):
+                options_by_parent_id.setdefault(parent_id, []).append(option)
+
         # start map with root option as a single child entry
-        child_map = {None: [option for option in self if option.data == self.NONE_OPTION_VALUE]}
+        child_map = {None: [option for option in options if option.data == self.NONE_OPTION_VALUE]}
 
         # add entries for all other children
-        for option in self:
+        for option in options:
             # assign all options with a NONE_OPTION_VALUE (not always None) to the None key
             if option.data == self.NONE_OPTION_VALUE:
-                child_ids = [folder["id"] for folder in self.all_template_folders if folder["parent_id"] is None]
-                key = self.NONE_OPTION_VALUE
+                child_map[self.NONE_OPTION_VALUE] = list(options_by_parent_id.get(None, ()))
             else:
-                child_ids = [folder["id"] for folder in self.all_template_folders if folder["parent_id"] == option.data]
-                key = option.data
-
-            child_map[key] = [option for option in self if option.data in child_ids]
+                child_map[option.data] = list(options_by_parent_id.get(option.data, ()))
 
         return child_map
 
@@ -1,4 +1,6 @@
-from flask import jsonify, redirect, render_template, request, session, url_for
+from functools import partial
+
+from flask import redirect, render_template, request, session, url_for
 from flask_login import current_user
 from notifications_python_client.errors import HTTPError
 from notifications_utils.template import SMSPreviewTemplate
@@ -9,6 +11,8 @@ from app.main import json_updates, main
 from app.main.overrides_nl.forms import SearchByNameForm
 from app.models.notification import InboundSMSMessage, InboundSMSMessages, Notifications
 from app.models.template_list import UserTemplateList
+from app.notify_client import run_concurrently
+from app.utils.polling import get_fingerprint, json_updates_response
 from app.utils.user import user_has_permissions
 
 
@@ -31,7 +35,13 @@ def conversation(service_id, notification_id):
 @json_updates.route("/services/<uuid:service_id>/conversation/<uuid:notification_id>.json")
 @user_has_permissions("view_activity")
 def conversation_updates(service_id, notification_id):
-    return jsonify(get_conversation_partials(service_id, get_user_number(service_id, notification_id)))
+    notifications, inbound_sms_messages = get_conversation_messages(
+        service_id, get_user_number(service_id, notification_id)
+    )
+    return json_updates_response(
+        get_fingerprint(notifications, inbound_sms_messages),
+        partial(render_conversation_partials, notifications, inbound_sms_messages),
+    )
 
 
 @main.route("/services/<uuid:service_id>/conversation/<uuid:notification_id>/reply-with")
@@ -92,10 +102,21 @@ def conversation_reply_with_template(
 
 
 def get_conversation_partials(service_id, user_number):
+    return render_conversation_partials(*get_conversation_messages(service_id, user_number))
+
+
+def get_conversation_messages(service_id, user_number):
+    return run_concurrently(
+        partial(Notifications, service_id, to=user_number, template_type="sms"),
+        partial(InboundSMSMessages, service_id, user_number=user_number),
+    )
+
+
+def render_conversation_partials(notifications, inbound_sms_messages):
     return {
         "messages": render_template(
             "views/conversations/messages.html",
-            conversation=get_sms_thread(service_id, user_number),
+            conversation=get_sms_thread(notifications, inbound_sms_messages),
         )
     }
 
@@ -110,11 +131,8 @@ def get_user_number(service_id, notification_id):
     return format_phone_number_human_readable(user_number)
 
 
-def get_sms_thread(service_id, user_number):
-    for notification in sorted(
-        Notifications(service_id, to=user_number, template_type="sms")
-        + InboundSMSMessages(service_id, user_number=user_number)
-    ):
+def get_sms_thread(notifications, inbound_sms_messages):
+    for notification in sorted(notifications + inbound_sms_messages):
         is_inbound = isinstance(notification, InboundSMSMessage)
 
         yield {
@@ -3,7 +3,7 @@ from datetime import datetime
 from functools import partial
 from itertools import groupby
 
-from flask import Response, abort, jsonify, render_template, request, session, url_for
+from flask import Response, abort, jsonify, render_template, request, session, stream_with_context, url_for
 from flask_login import current_user
 from werkzeug.utils import redirect
 
@@ -21,6 +21,7 @@ from app.formatters import format_date_numeric, format_datetime_numeric, format_
 from app.main import json_updates, main
 from app.main.overrides_nl.forms import SearchNotificationsForm
 from app.models.notification import InboundSMSMessages, Notifications
+from app.notify_client import run_concurrently
 from app.statistics_utils import get_formatted_percentage
 from app.utils import (
     DELIVERED_STATUSES,
@@ -32,11 +33,20 @@ from app.utils import (
     service_has_permission,
     set_status_filters,
 )
-from app.utils.csv import Spreadsheet
+from app.utils.csv import StreamingCSVWriter
 from app.utils.pagination import generate_next_dict, generate_previous_dict, get_page_from_request
+from app.utils.polling import get_fingerprint, json_updates_response
 from app.utils.time import get_current_financial_year
 from app.utils.user import user_has_permissions
 
+# The service data which the upcoming and inbox partials show, besides the statistics and usage
+DASHBOARD_SERVICE_PROPERTIES = (
+    "scheduled_job_stats",
+    "inbound_sms_summary",
+    "returned_letter_statistics",
+    "unsubscribe_requests_statistics",
+)
+
 
 @main.route("/services/<uuid:service_id>/dashboard")
 @user_has_permissions("view_activity", "send_messages")
@@ -64,7 +74,12 @@ def service_dashboard(service_id):
 @json_updates.route("/services/<uuid:service_id>/dashboard.json")
 @user_has_permissions("view_activity")
 def service_dashboard_updates(service_id):
-    return jsonify(**get_dashboard_partials(service_id))
+    dashboard_data = get_dashboard_data(service_id)
+    current_service.prefetch(*DASHBOARD_SERVICE_PROPERTIES)
+    return json_updates_response(
+        get_fingerprint(*dashboard_data, *(getattr(current_service, name) for name in DASHBOARD_SERVICE_PROPERTIES)),
+        partial(render_dashboard_partials, service_id, *dashboard_data),
+    )
 
 
 def make_cache_key(query_hash, service_id):
@@ -431,24 +446,28 @@ def inbox_updates(service_id):
 @main.route("/services/<uuid:service_id>/inbox.csv")
 @user_has_permissions("view_activity")
 def inbox_download(service_id):
-    return Response(
-        Spreadsheet.from_rows(
-            [
-                [
-                    "Phone number",
-                    "Message",
-                    "Received",
-                ]
-            ]
-            + [
+    messages = InboundSMSMessages(service_id)
+
+    def generate_inbox_csv(rows_per_chunk=1000):
+        writer = StreamingCSVWriter()
+        writer.writerows([["Phone number", "Message", "Received"]])
+        for index, message in enumerate(messages, start=1):
+            writer.writerows(
                 [
-                    format_phone_number_human_readable(message.user_number),
-                    message.content.lstrip("=+-@"),
-                    format_datetime_numeric(message.created_at),
+                    [
+                        format_phone_number_human_readable(message.user_number),
+                        message.content.lstrip("=+-@"),
+                        format_datetime_numeric(message.created_at),
+                    ]
                 ]
-                for message in InboundSMSMessages(service_id)
-            ]
-        ).as_csv_data,
+            )
+            if index % rows_per_chunk == 0:
+                yield writer.get_chunk()
+        if chunk := writer.get_chunk():
+            yield chunk
+
+    return Response(
+        stream_with_context(generate_inbox_csv()),
         mimetype="text/csv",
         headers={
             "Content-Disposition": (
@@ -525,19 +544,30 @@ def aggregate_notifications_stats(template_statistics):
 
 
 def get_dashboard_partials(service_id):
-    all_statistics = template_statistics_client.get_template_statistics_for_service(service_id, limit_days=7)
+    return render_dashboard_partials(service_id, *get_dashboard_data(service_id))
+
+
+def get_dashboard_data(service_id):
+    return run_concurrently(
+        partial(template_statistics_client.get_template_statistics_for_service, service_id, limit_days=7),
+        partial(
+            billing_api_client.get_free_sms_fragment_limit_for_year,
+            current_service.id,
+            get_current_financial_year(),
+        ),
+        partial(
+            billing_api_client.get_annual_usage_for_service,
+            service_id,
+            get_current_financial_year(),
+        ),
+    )
+
+
+def render_dashboard_partials(service_id, all_statistics, free_sms_allowance, yearly_usage):
     template_statistics = aggregate_template_usage(all_statistics)
     stats = aggregate_notifications_stats(all_statistics)
 
     dashboard_totals = (get_dashboard_totals(stats),)
-    free_sms_allowance = billing_api_client.get_free_sms_fragment_limit_for_year(
-        current_service.id,
-        get_current_financial_year(),
-    )
-    yearly_usage = billing_api_client.get_annual_usage_for_service(
-        service_id,
-        get_current_financial_year(),
-    )
     return {
         "upcoming": render_template(
             "views/dashboard/_upcoming.html",
@@ -1,11 +1,13 @@
+from functools import partial
+
 from flask import (
     Response,
     abort,
     flash,
-    jsonify,
     redirect,
     render_template,
     request,
+    stream_with_context,
     url_for,
 )
 from markupsafe import Markup
@@ -21,12 +23,15 @@ from app.formatters import get_time_left, message_count_noun
 from app.main import json_updates, main
 from app.models.job import Job
 from app.notify_client.job_api_client import JobApiClient
-from app.s3_client.s3_csv_client import s3download
+from app.s3_client.s3_csv_client import s3download, s3download_first_rows
 from app.utils import parse_filter_args, set_status_filters
-from app.utils.csv import generate_notifications_csv
+from app.utils.csv import stream_notifications_csv
 from app.utils.letters import get_letter_printing_statement, printing_today_or_tomorrow
+from app.utils.polling import get_fingerprint, json_updates_response
 from app.utils.user import user_has_permissions
 
+SCHEDULED_RECIPIENTS_SHOWN = 50
+
 
 @main.route("/services/<uuid:service_id>/jobs")
 @user_has_permissions()
@@ -54,10 +59,11 @@ def view_job(service_id, job_id):
     )
 
     if job.scheduled:
+        # Only the rows we show are downloaded, the number of rows in the file comes from `job.notification_count`
         scheduled_recipients = RecipientCSV(
-            s3download(current_service.id, job.id),
+            s3download_first_rows(current_service.id, job.id, SCHEDULED_RECIPIENTS_SHOWN),
             template=current_service.get_template(job.template_id),
-            max_initial_rows_shown=50,
+            max_initial_rows_shown=SCHEDULED_RECIPIENTS_SHOWN,
         )
     else:
         scheduled_recipients = None
@@ -86,7 +92,7 @@ def view_job_csv(service_id, job_id):
     filter_args = parse_filter_args(request.args)
     filter_args["status"] = set_status_filters(filter_args)
 
-    data = generate_notifications_csv(
+    data = stream_notifications_csv(
         service_id=service_id,
         job_id=job_id,
         status=filter_args.get("status"),
@@ -95,7 +101,7 @@ def view_job_csv(service_id, job_id):
         template_type=job.template_type,
     )
     return Response(
-        list(data),
+        stream_with_context(data),
         mimetype="text/csv",
         headers={
             "Content-Disposition": 'inline; filename="{} - {}.csv"'.format(
@@ -159,7 +165,13 @@ def cancel_letter_job(service_id, job_id):
 def view_job_updates(service_id, job_id):
     job = Job.from_id(job_id, service_id=service_id)
 
-    return jsonify(**get_job_partials(job))
+    # The job’s statistics change whenever one of its notifications does, so the notifications themselves
+    # only need to be fetched if the job has changed
+    return json_updates_response(
+        get_fingerprint(job),
+        partial(get_job_partials, job),
+        finished=job.cancelled or job.finished_processing,
+    )
 
 
 def _get_job_counts(job):
@@ -3,16 +3,17 @@ import io
 import json
 import os
 from datetime import datetime
+from functools import partial
 
 from flask import (
     Response,
     abort,
     flash,
-    jsonify,
     redirect,
     render_template,
     request,
     send_file,
+    stream_with_context,
     url_for,
 )
 from notifications_python_client.errors import APIError, HTTPError
@@ -33,8 +34,9 @@ from app.utils import (
     parse_filter_args,
     set_status_filters,
 )
-from app.utils.csv import generate_notifications_csv
+from app.utils.csv import stream_notifications_csv
 from app.utils.letters import get_letter_validation_error
+from app.utils.polling import get_fingerprint, json_updates_response
 from app.utils.templates import get_template
 from app.utils.user import user_has_permissions
 
@@ -203,7 +205,12 @@ def get_letter_file_data(service_id, notification_id, filetype, with_metadata=Fa
 @json_updates.route("/services/<uuid:service_id>/notification/<uuid:notification_id>.json")
 @user_has_permissions("view_activity", "send_messages")
 def view_notification_updates(service_id, notification_id):
-    return jsonify(**get_single_notification_partials(Notification.from_id_and_service_id(notification_id, service_id)))
+    notification = Notification.from_id_and_service_id(notification_id, service_id)
+    return json_updates_response(
+        get_fingerprint(notification),
+        partial(get_single_notification_partials, notification),
+        finished=notification.finished,
+    )
 
 
 def get_single_notification_partials(notification):
@@ -229,7 +236,7 @@ def download_notifications_csv(service_id):
 
     service_data_retention_days = current_service.get_days_of_retention(message_type)
 
-    data = generate_notifications_csv(
+    data = stream_notifications_csv(
         service_id=service_id,
         status=filter_args.get("status"),
         page=request.args.get("page", 1),
@@ -238,7 +245,7 @@ def download_notifications_csv(service_id):
         limit_days=service_data_retention_days,
     )
     return Response(
-        list(data),
+        stream_with_context(data),
         mimetype="text/csv",
         headers={
             "Content-Disposition": 'inline; filename="{} - {} - {} report.csv"'.format(
@@ -8,13 +8,15 @@ from flask import jsonify, render_template, request
 from app import performance_dashboard_api_client, status_api_client
 from app.main import main
 from app.main.views_nl.sub_navigation_dictionaries import features_nav
+from app.notify_client import cache
 
 ORGS_TO_IGNORE = ["1556fd80-a1b2-4b79-8453-f6fcb6f00d0c"]  # TODO: Move this into the database
 
 
-@main.route("/features/performance")
-@main.route("/features/performance.json", endpoint="performance_json")
-def performance():
+# The page is public, so the derived stats are cached as a whole and only ever refreshed in the background once
+# they’ve been cached for the first time
+@cache.set("performance-page-stats", ttl_in_seconds=86_400, stale_after_in_seconds=900)
+def get_performance_stats():
     stats = performance_dashboard_api_client.get_performance_dashboard_stats(
         start_date=(datetime.utcnow() - timedelta(days=7)).date(),
         end_date=datetime.utcnow().date(),
@@ -40,6 +42,13 @@ def performance():
         [row["percentage_under_10_seconds"] for row in stats["processing_time"]] or [0]
     )
     stats["count_of_live_services_and_organisations"] = status_api_client.get_count_of_live_services_and_organisations()
+    return stats
+
+
+@main.route("/features/performance")
+@main.route("/features/performance.json", endpoint="performance_json")
+def performance():
+    stats = get_performance_stats()
 
     if request.endpoint == "main.performance_json":
         return jsonify(stats)
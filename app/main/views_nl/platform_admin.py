@@ -17,7 +17,6 @@ from app import (
     service_api_client,
     user_api_client,
 )
-from app.extensions import redis_client
 from app.formatters import sentence_case
 from app.main import main
 from app.main.overrides_nl.forms import (
@@ -28,6 +27,7 @@ from app.main.overrides_nl.forms import (
     PlatformAdminUsersListForm,
     RequiredDateFilterForm,
 )
+from app.notify_client import CACHE_GROUPS, cache
 from app.notify_client.platform_admin_api_client import admin_api_client
 from app.statistics_utils import (
     get_formatted_percentage,
@@ -574,69 +574,18 @@ def platform_admin_returned_letters():
 @main.route("/platform-admin/clear-cache", methods=["GET", "POST"])
 @user_is_platform_admin
 def clear_cache():
-    # note: `service-{uuid}-templates` cache is cleared for both services and templates.
-    CACHE_KEYS = {
-        "user": [
-            "user-????????-????-????-????-????????????",
-        ],
-        "service": [
-            "has_jobs-????????-????-????-????-????????????",
-            "service-????????-????-????-????-????????????",
-            "service-????????-????-????-????-????????????-templates",
-            "service-????????-????-????-????-????????????-data-retention",
-            "service-????????-????-????-????-????????????-template-folders",
-            "service-????????-????-????-????-????????????-returned-letters-statistics",
-            "service-????????-????-????-????-????????????-returned-letters-summary",
-        ],
-        "template": [
-            "service-????????-????-????-????-????????????-templates",
-            "service-????????-????-????-????-????????????-template-????????-????-????-????-????????????-version-*",
-            "service-????????-????-????-????-????????????-template-????????-????-????-????-????????????-versions",
-            "service-????????-????-????-????-????????????-template-????????-????-????-????-????????????-page-count",
-            "service-????????-????-????-????-????????????-template-precompiled",
-        ],
-        "email_branding": [
-            "email_branding",
-            "email_branding-????????-????-????-????-????????????",
-        ],
-        "letter_branding": [
-            "letter_branding",
-            "letter_branding-????????-????-????-????-????????????",
-        ],
-        "organisation": [
-            "organisations",
-            "domains",
-            "live-service-and-organisation-counts",
-            "organisation-????????-????-????-????-????????????-name",
-            "organisation-????????-????-????-????-????????????-email-branding-pool",
-            "organisation-????????-????-????-????-????????????-letter-branding-pool",
-        ],
-        "text_message_and_letter_rates": [
-            "letter-rates",
-            "sms-rate",
-        ],
-        "unsubscribe_request_reports": [
-            "service-????????-????-????-????-????????????-unsubscribe-request-reports-summary",
-            "service-????????-????-????-????-????????????-unsubscribe-request-statistics",
-        ],
-        "service_join_request": [
-            "service-join-request-????????-????-????-????-????????????",
-        ],
-    }
-
     form = AdminClearCacheForm()
 
-    form.model_type.choices = [(key, sentence_case(key.replace("_", " "))) for key in CACHE_KEYS]
+    form.model_type.choices = [(key, sentence_case(key.replace("_", " "))) for key in CACHE_GROUPS]
 
     if form.validate_on_submit():
         group_keys = form.model_type.data
-        groups = map(CACHE_KEYS.get, group_keys)
-        patterns = list(itertools.chain(*groups))
+        key_formats = list(itertools.chain(*map(CACHE_GROUPS.get, group_keys)))
 
-        num_deleted = sum(redis_client.delete_by_pattern(pattern) for pattern in patterns)
+        num_deleted = sum(cache.clear_group(group) for group in group_keys)
         keys_deleted = ", ".join(group_keys).replace("_", " ").lower()
 
-        msg = f"Removed {num_deleted} objects across {len(patterns)} key formats for {keys_deleted}"
+        msg = f"Removed {num_deleted} objects across {len(key_formats)} key formats for {keys_deleted}"
 
         flash(msg, category="default")
 
@@ -1,11 +1,12 @@
-from flask import abort, jsonify, render_template, send_file, url_for
+from botocore.exceptions import ClientError
+from flask import Response, abort, current_app, jsonify, render_template, request, url_for
 from flask_login import current_user
 from notifications_python_client.errors import HTTPError
 from werkzeug.utils import redirect
 
 from app import current_service
 from app.constants import REPORT_REQUEST_FAILED, REPORT_REQUEST_MAX_NOTIFICATIONS, REPORT_REQUEST_STORED
-from app.main import main
+from app.main import json_updates, main
 from app.models.report_request import ReportRequest
 from app.utils.user import user_has_permissions
 
@@ -61,13 +62,8 @@ def report_request(service_id, report_request_id):
 def report_ready(service_id, report_request_id):
     validate_report_request_enabled()
 
-    if not ReportRequest.exists_in_s3(report_request_id):
-        return render_template(
-            "views/csv-report/unavailable.html",
-        )
-
     try:
-        report_request = ReportRequest.from_id(service_id, report_request_id)
+        report_request = ReportRequest.from_id_if_in_s3(service_id, report_request_id)
     except HTTPError as e:
         if e.status_code == 404:
             # if the report is no longer available, show them "No longer available page"
@@ -81,6 +77,11 @@ def report_ready(service_id, report_request_id):
         else:
             raise e
 
+    if report_request is None:
+        return render_template(
+            "views/csv-report/unavailable.html",
+        )
+
     if report_request.user_id != current_user.id:
         abort(403)
     # if they bookmarked the page and come back to it
@@ -114,20 +115,88 @@ def report_request_download(service_id, report_request_id):
     if report_request.status != REPORT_REQUEST_STORED:
         abort(404)
 
-    file_contents = ReportRequest.download(report_request_id)
+    if current_app.config["REPORT_REQUEST_DOWNLOAD_REDIRECT"]:
+        return redirect(
+            ReportRequest.get_download_url(
+                report_request_id, expires_in=current_app.config["REPORT_REQUEST_DOWNLOAD_URL_EXPIRY_IN_SECONDS"]
+            )
+        )
+
+    return _stream_report(report_request_id)
+
+
+def _get_report_object(report_request_id):
+    byte_range = request.headers.get("Range")
+    if_range = request.headers.get("If-Range")
+    if byte_range and if_range and not if_range.startswith('"'):
+        # If-Range can also be a date (or a weak ETag) which S3 can’t check for us, so send the whole report
+        byte_range = if_range = None
 
-    return send_file(
-        path_or_file=file_contents,
-        download_name=f"{report_request_id}.csv",
-        as_attachment=True,
+    try:
+        return ReportRequest.get_object(report_request_id, byte_range=byte_range, if_match=byte_range and if_range)
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "PreconditionFailed":
+            # The report has changed since the download started, so it needs to start again from the beginning
+            return ReportRequest.get_object(report_request_id)
+        if e.response["Error"]["Code"] == "NoSuchKey":
+            abort(404)
+        raise e
+
+
+def _stream_report(report_request_id):
+    """
+    Sends the report in chunks as it is read from S3, rather than reading it all into memory first. Supports a
+    single HTTP Range, so an interrupted download can be resumed.
+    """
+    try:
+        s3_object = _get_report_object(report_request_id)
+    except ClientError as e:
+        if e.response["Error"]["Code"] == "InvalidRange":
+            return Response(
+                status=416,
+                headers={"Content-Range": f"bytes */{e.response['Error'].get('ActualObjectSize', '*')}"},
+            )
+        raise e
+
+    body = s3_object["Body"]
+
+    def generate():
+        try:
+            yield from body.iter_chunks(chunk_size=ReportRequest.DOWNLOAD_CHUNK_SIZE)
+        finally:
+            body.close()
+
+    response = Response(
+        generate(),
+        status=206 if s3_object.get("ContentRange") else 200,
+        mimetype="text/csv",
+        headers={
+            "Content-Disposition": f"attachment; filename={report_request_id}.csv",
+            "Content-Length": s3_object["ContentLength"],
+            "Accept-Ranges": "bytes",
+            "ETag": s3_object["ETag"],
+        },
+        direct_passthrough=True,
     )
+    if s3_object.get("ContentRange"):
+        response.headers["Content-Range"] = s3_object["ContentRange"]
+    if s3_object.get("LastModified"):
+        response.last_modified = s3_object["LastModified"]
+    return response
 
 
-# this endpoint is used by Javascript to poll for changes every N seconds
-@main.route("/services/<uuid:service_id>/download-report/<uuid:report_request_id>/status.json")
+# this endpoint is used by Javascript to wait for the status of the report to change. If it is passed the status the
+# page already knows about, it waits for a while for a different one before responding
+@json_updates.route("/services/<uuid:service_id>/download-report/<uuid:report_request_id>/status.json")
 @user_has_permissions("view_activity")
 def report_request_status_json(service_id, report_request_id):
     validate_report_request_enabled()
 
-    report_request_status = ReportRequest.from_id(service_id, report_request_id).status
+    known_status = request.args.get("status")
+    report_request_status = ReportRequest.get_status(
+        service_id,
+        report_request_id,
+        known_status=known_status,
+        timeout=ReportRequest.STATUS_WAIT_IN_SECONDS if known_status else 0,
+    )
     return jsonify({"status": report_request_status})
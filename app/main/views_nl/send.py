@@ -1,4 +1,5 @@
 import itertools
+import json
 from string import ascii_uppercase
 from zipfile import BadZipFile
 
@@ -29,6 +30,7 @@ from app import (
     service_api_client,
     template_preview_client,
 )
+from app.extensions import redis_client
 from app.main import main, no_cookie
 from app.main.overrides_nl.forms import (
     ChooseTimeForm,
@@ -40,8 +42,8 @@ from app.main.overrides_nl.forms import (
 from app.models.contact_list import ContactList, ContactListsAlphabetical
 from app.models.user import Users
 from app.s3_client.s3_csv_client import get_csv_metadata, s3download, s3upload, set_metadata_on_csv_upload
-from app.utils import PermanentRedirect, should_skip_template_page, unicode_truncate
-from app.utils.csv import Spreadsheet, get_errors_for_csv
+from app.utils import SEVEN_DAYS_TTL, PermanentRedirect, should_skip_template_page, unicode_truncate
+from app.utils.csv import RowErrors, Spreadsheet
 from app.utils.user import user_has_permissions
 
 letter_address_columns = [column.replace("_", " ") for column in address_lines_1_to_6_keys]
@@ -660,14 +662,17 @@ def _check_messages(service_id, template_id, upload_id, preview_row, emergency_c
         template.values = recipients[preview_row - 2].recipient_and_personalisation
     elif preview_row > 2:
         abort(404)
+    row_errors = RowErrors(recipients)
+    cache_preview_rows(service_id, upload_id, template, row_errors.displayed_rows, preview_row)
     original_file_name = get_csv_metadata(service_id, upload_id).get("original_file_name", "")
     return {
         "recipients": recipients,
         "template": template,
         "errors": recipients.has_errors,
-        "row_errors": get_errors_for_csv(recipients, template.template_type),
+        "row_errors": row_errors.get_messages(template.template_type),
         "count_of_recipients": len(recipients),
-        "count_of_displayed_recipients": len(list(recipients.displayed_rows)),
+        "displayed_rows": row_errors.displayed_rows,
+        "count_of_displayed_recipients": len(row_errors.displayed_rows),
         "original_file_name": original_file_name,
         "upload_id": upload_id,
         "form": CsvUploadForm(),
@@ -691,6 +696,33 @@ def _check_messages(service_id, template_id, upload_id, preview_row, emergency_c
     }
 
 
+def get_preview_rows_cache_key(service_id, upload_id, template):
+    return (
+        f"service-{service_id}-upload-{upload_id}-template-{template.id}-version-{template.get_raw('version')}"
+        "-preview-rows"
+    )
+
+
+def cache_preview_rows(service_id, upload_id, template, displayed_rows, preview_row):
+    # Letter previews request one image per page, and each of those would otherwise download and re-validate
+    # the whole spreadsheet. Store the personalisation for the rows the check page can link to, so the preview
+    # endpoint only needs to look up a single row.
+    rows = {row.index + 2: row.recipient_and_personalisation for row in displayed_rows}
+    if template.values:
+        rows[preview_row] = template.values
+    redis_client.set(
+        get_preview_rows_cache_key(service_id, upload_id, template),
+        json.dumps(rows),
+        ex=SEVEN_DAYS_TTL,
+    )
+
+
+def get_cached_preview_row(service_id, upload_id, template, row_index):
+    if cached_rows := redis_client.get(get_preview_rows_cache_key(service_id, upload_id, template)):
+        return json.loads(cached_rows).get(str(row_index))
+    return None
+
+
 @main.route("/services/<uuid:service_id>/<uuid:template_id>/check/<uuid:upload_id>", methods=["GET"])
 @main.route(
     "/services/<uuid:service_id>/<uuid:template_id>/check/<uuid:upload_id>/row-<int:row_index>", methods=["GET"]
@@ -747,7 +779,14 @@ def check_messages_preview(service_id, template_id, upload_id, filetype, row_ind
     if filetype == "png":
         page = request.args.get("page", 1)
 
-    template = _check_messages(service_id, template_id, upload_id, row_index)["template"]
+    template = current_service.get_template_with_user_permission_or_403(template_id, current_user)
+    cached_values = get_cached_preview_row(service_id, upload_id, template, row_index)
+
+    if cached_values is None:
+        template = _check_messages(service_id, template_id, upload_id, row_index)["template"]
+    else:
+        template.values = cached_values
+
     return template_preview_client.get_preview_for_templated_letter(
         db_template=template._template,
         filetype=filetype,
@@ -82,10 +82,28 @@ THANKS_FOR_BRANDING_REQUEST_MESSAGE = (
     "Bedankt voor uw aanvraag voor branding. We nemen uiterlijk aan het einde van de volgende werkdag contact met u op."
 )
 
+# Properties of the service which the settings page shows, so they can be loaded at the same time
+SERVICE_SETTINGS_PROPERTIES = ("email_reply_to_addresses", "sms_senders", "data_retention", "organisation")
+SERVICE_SETTINGS_PROPERTIES_BY_PERMISSION = {
+    "email": ("email_branding",),
+    "letter": ("letter_contact_details", "letter_branding"),
+}
+PLATFORM_ADMIN_SERVICE_SETTINGS_PROPERTIES = ("email_branding", "letter_branding")
+
 
 @main.route("/services/<uuid:service_id>/service-settings")
 @user_has_permissions("manage_service", "manage_api_keys")
 def service_settings(service_id):
+    current_service.prefetch(
+        *SERVICE_SETTINGS_PROPERTIES,
+        *(
+            property_name
+            for permission, property_names in SERVICE_SETTINGS_PROPERTIES_BY_PERMISSION.items()
+            if current_service.has_permission(permission)
+            for property_name in property_names
+        ),
+        *(PLATFORM_ADMIN_SERVICE_SETTINGS_PROPERTIES if current_user.platform_admin else ()),
+    )
     return render_template(
         "views/service-settings.html",
         service_permissions=PLATFORM_ADMIN_SERVICE_PERMISSIONS,
@@ -40,7 +40,7 @@ from app.s3_client.s3_letter_upload_client import (
     LetterNotFoundError,
     backup_original_letter_to_s3,
     get_letter_metadata,
-    get_letter_pdf_and_metadata,
+    get_letter_pdf_page_and_metadata,
     get_transient_letter_file_location,
     upload_letter_to_s3,
 )
@@ -281,13 +281,15 @@ def view_letter_upload_as_preview(service_id, file_id):
     except ValueError:
         abort(400)
 
-    pdf_file, metadata = get_letter_pdf_and_metadata(service_id, file_id)
+    pdf_page, metadata = get_letter_pdf_page_and_metadata(service_id, file_id, page)
+    if pdf_page is None:
+        abort(404)
     invalid_pages = json.loads(metadata.get("invalid_pages", "[]"))
 
     if metadata.get("message") == "content-outside-printable-area" and page in invalid_pages:
-        return template_preview_client.get_png_for_invalid_pdf_page(pdf_file, page)
+        return template_preview_client.get_png_for_invalid_pdf_page(pdf_page, page, page_already_extracted=True)
     else:
-        return template_preview_client.get_png_for_valid_pdf_page(pdf_file, page)
+        return template_preview_client.get_png_for_valid_pdf_page(pdf_page, page, page_already_extracted=True)
 
 
 @main.route("/services/<uuid:service_id>/upload-letter/send/<uuid:file_id>", methods=["POST"])
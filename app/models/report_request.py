@@ -1,11 +1,18 @@
+import os
 from datetime import datetime
+from functools import partial
+from time import monotonic
 from typing import Any
 
+from boto3 import client
 from flask import current_app
-from notifications_utils.s3 import s3download
+from redis.exceptions import RedisError
 
 from app import report_request_api_client
+from app.constants import REPORT_REQUEST_DELETED, REPORT_REQUEST_FAILED, REPORT_REQUEST_STORED
+from app.extensions import redis_client
 from app.models import JSONModel
+from app.notify_client import run_concurrently
 from app.s3_client import check_s3_object_exists
 
 
@@ -21,24 +28,168 @@ class ReportRequest(JSONModel):
 
     __sort_attribute__ = "created_at"
 
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+    FINISHED_STATUSES = frozenset((REPORT_REQUEST_STORED, REPORT_REQUEST_FAILED, REPORT_REQUEST_DELETED))
+    STATUS_CACHE_TTL_IN_SECONDS = 60 * 60
+    # How often the API is asked for the status of a report, however many people are waiting for it
+    STATUS_POLL_INTERVAL_IN_SECONDS = 5
+    # Finished statuses aren’t polled for, but a stored report can still be deleted, so they’re only cached briefly
+    FINISHED_STATUS_CACHE_TTL_IN_SECONDS = STATUS_POLL_INTERVAL_IN_SECONDS
+    # How long a request for the status of a report waits for it to change before responding
+    STATUS_WAIT_IN_SECONDS = 25
+
     @classmethod
     def from_id(cls, service_id, report_request_id):
         return cls(report_request_api_client.get_report_request(service_id, report_request_id)["data"])
 
+    @classmethod
+    def from_id_if_in_s3(cls, service_id, report_request_id):
+        """
+        Returns the report request, or `None` if the report has been deleted from S3.
+
+        The report and its metadata are stored in different places, so they are looked up at the same time rather
+        than one after the other. Errors from the API (like a 404) are raised as they would be by `from_id`.
+        """
+        exists_in_s3, report_request = run_concurrently(
+            partial(cls.exists_in_s3, report_request_id),
+            partial(cls.from_id, service_id, report_request_id),
+        )
+        return report_request if exists_in_s3 else None
+
+    @staticmethod
+    def _get_status_cache_key(service_id, report_request_id):
+        return f"service-{service_id}-report-request-{report_request_id}-status"
+
+    @classmethod
+    def _refresh_status(cls, service_id, report_request_id):
+        """
+        Gets the status of a report from the API and caches it, telling everyone waiting for it if it has changed
+        """
+        status_cache_key = cls._get_status_cache_key(service_id, report_request_id)
+        status = cls.from_id(service_id, report_request_id).status
+        previous_status = cls._get_cached_status(status_cache_key)
+        redis_client.set(
+            status_cache_key,
+            status,
+            ex=(
+                cls.FINISHED_STATUS_CACHE_TTL_IN_SECONDS
+                if status in cls.FINISHED_STATUSES
+                else cls.STATUS_CACHE_TTL_IN_SECONDS
+            ),
+        )
+        if status != previous_status:
+            try:
+                redis_client.redis_store.publish(status_cache_key, status)
+            except RedisError:
+                current_app.logger.exception("Redis error publishing status of %s", status_cache_key)
+        return status
+
+    @classmethod
+    def _status_poll_is_due(cls, status_cache_key):
+        # Only one request across every process gets the status from the API in each interval
+        try:
+            return bool(
+                redis_client.redis_store.set(
+                    f"{status_cache_key}-poll", os.getpid(), ex=cls.STATUS_POLL_INTERVAL_IN_SECONDS, nx=True
+                )
+            )
+        except Exception:
+            current_app.logger.exception("Redis error checking if %s is due to be polled", status_cache_key)
+            return True
+
+    @staticmethod
+    def _get_cached_status(status_cache_key):
+        cached_status = redis_client.get(status_cache_key)
+        return cached_status.decode("utf-8") if cached_status else None
+
+    @classmethod
+    def get_status(cls, service_id, report_request_id, *, known_status=None, timeout=0):
+        """
+        Returns the status of a report. If it is still `known_status`, waits up to `timeout` seconds for it to change
+        first.
+
+        While people are waiting, the API is asked for the status once every `STATUS_POLL_INTERVAL_IN_SECONDS`,
+        rather than once per browser tab. Changes are published to everyone waiting for that report. Without Redis,
+        this (or if Redis stops responding) gets the status from the API straight away.
+        """
+        if not redis_client.active:
+            return cls.from_id(service_id, report_request_id).status
+
+        cache_key = cls._get_status_cache_key(service_id, report_request_id)
+        deadline = monotonic() + timeout
+        try:
+            pubsub = redis_client.redis_store.pubsub(ignore_subscribe_messages=True)
+            # Subscribe before reading the status, so a change made in between isn’t missed
+            pubsub.subscribe(cache_key)
+        except RedisError:
+            current_app.logger.exception("Redis error subscribing to %s", cache_key)
+            return cls.from_id(service_id, report_request_id).status
+        try:
+            while True:
+                status = cls._get_cached_status(cache_key)
+                if status is None or (status not in cls.FINISHED_STATUSES and cls._status_poll_is_due(cache_key)):
+                    status = cls._refresh_status(service_id, report_request_id)
+
+                remaining = deadline - monotonic()
+                if status != known_status or status in cls.FINISHED_STATUSES or remaining <= 0:
+                    return status
+
+                try:
+                    pubsub.get_message(timeout=min(remaining, cls.STATUS_POLL_INTERVAL_IN_SECONDS))
+                except RedisError:
+                    current_app.logger.exception("Redis error waiting for %s", cache_key)
+                    return cls.from_id(service_id, report_request_id).status
+        finally:
+            pubsub.close()
+
     @staticmethod
     def get_bucket_name():
         return current_app.config["S3_BUCKET_REPORT_REQUESTS_DOWNLOAD"]
 
     @staticmethod
-    def download(report_request_id):
-        return s3download(
-            bucket_name=ReportRequest.get_bucket_name(),
-            filename=f"notifications_report/{report_request_id}.csv",
+    def get_filename(report_request_id):
+        return f"notifications_report/{report_request_id}.csv"
+
+    @staticmethod
+    def get_object(report_request_id, *, byte_range=None, if_match=None):
+        """
+        Returns the S3 `GetObject` response for a report. Its `Body` is a stream, so the report isn’t read into
+        memory.
+
+        `byte_range` is the value of an HTTP `Range` header, for downloading part of the report. If `if_match` is
+        given, S3 raises a `PreconditionFailed` error unless the report’s ETag matches it.
+        """
+        kwargs = {}
+        if byte_range:
+            kwargs["Range"] = byte_range
+        if if_match:
+            kwargs["IfMatch"] = if_match
+        return client("s3").get_object(
+            Bucket=ReportRequest.get_bucket_name(),
+            Key=ReportRequest.get_filename(report_request_id),
+            **kwargs,
+        )
+
+    @staticmethod
+    def get_download_url(report_request_id, *, expires_in):
+        """
+        Returns a pre-signed URL which downloads the report straight from S3 for the next `expires_in` seconds
+        """
+        return client("s3").generate_presigned_url(
+            "get_object",
+            Params={
+                "Bucket": ReportRequest.get_bucket_name(),
+                "Key": ReportRequest.get_filename(report_request_id),
+                "ResponseContentDisposition": f"attachment; filename={report_request_id}.csv",
+                "ResponseContentType": "text/csv; charset=utf-8",
+            },
+            ExpiresIn=expires_in,
         )
 
     @staticmethod
     def exists_in_s3(report_request_id):
         return check_s3_object_exists(
             bucket_name=ReportRequest.get_bucket_name(),
-            filename=f"notifications_report/{report_request_id}.csv",
+            filename=ReportRequest.get_filename(report_request_id),
         )
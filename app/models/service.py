@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import partial
 from typing import Any
 
 from flask import abort, current_app
@@ -21,6 +22,7 @@ from app.models.job import ImmediateJobs, PaginatedJobs, PaginatedUploads, Sched
 from app.models.organisation import Organisation
 from app.models.unsubscribe_requests_report import UnsubscribeRequestsReports
 from app.models.user import InvitedUsers, User, Users
+from app.notify_client import run_concurrently
 from app.notify_client.billing_api_client import billing_api_client
 from app.notify_client.inbound_number_client import inbound_number_client
 from app.notify_client.invite_api_client import invite_api_client
@@ -28,7 +30,7 @@ from app.notify_client.job_api_client import job_api_client
 from app.notify_client.organisations_api_client import organisations_client
 from app.notify_client.service_api_client import service_api_client
 from app.notify_client.template_folder_api_client import template_folder_api_client
-from app.utils import get_default_sms_sender
+from app.utils import get_default_sms_sender, group_by_key
 from app.utils.templates import get_template as get_template_as_rich_object
 
 
@@ -80,6 +82,18 @@ class Service(JSONModel):
     def from_id(cls, service_id):
         return cls(service_api_client.get_service(service_id)["data"])
 
+    def prefetch(self, *property_names):
+        """
+        Loads several cached properties at the same time, rather than one after another as a template uses them.
+
+        Pages which use lots of properties that each need an API call should list the ones they use here before
+        rendering. Properties which have already been loaded are skipped.
+        """
+        property_names = [name for name in dict.fromkeys(property_names) if name not in self.__dict__]
+        if len(property_names) < 2:
+            return
+        run_concurrently(*(partial(getattr, self, name) for name in property_names))
+
     @property
     def _permissions(self):
         return self._dict.get("permissions", self.TEMPLATE_TYPES)
@@ -225,6 +239,10 @@ class Service(JSONModel):
     def all_template_ids(self):
         return {template["id"] for template in self.all_templates}
 
+    @cached_property
+    def templates_by_folder_id(self):
+        return group_by_key(self.all_templates, "folder")
+
     def get_template(self, template_id, version=None, **kwargs):
         template = service_api_client.get_service_template(self.id, template_id, version)["data"]
         return get_template_as_rich_object(template, service=self, **kwargs)
@@ -522,6 +540,14 @@ class Service(JSONModel):
     def all_template_folder_ids(self):
         return {folder["id"] for folder in self.all_template_folders}
 
+    @cached_property
+    def template_folders_by_id(self):
+        return {folder["id"]: folder for folder in self.all_template_folders}
+
+    @cached_property
+    def template_folders_by_parent_id(self):
+        return group_by_key(self.all_template_folders, "parent_id")
+
     def get_template_folder(self, folder_id):
         if folder_id is None:
             return {
@@ -529,7 +555,10 @@ class Service(JSONModel):
                 "name": "Templates",
                 "parent_id": None,
             }
-        return self._get_by_id(self.all_template_folders, folder_id)
+        try:
+            return self.template_folders_by_id[str(folder_id)]
+        except KeyError:
+            abort(404)
 
     def get_template_folder_path(self, template_folder_id):
         folder = self.get_template_folder(template_folder_id)
@@ -631,7 +660,7 @@ class Service(JSONModel):
     def unsubscribe_request_reports_summary(self):
         return UnsubscribeRequestsReports(self.id)
 
-    @property
+    @cached_property
     def unsubscribe_requests_statistics(self) -> dict:
         return service_api_client.get_unsubscribe_request_statistics(self.id)
 
@@ -1,6 +1,7 @@
 from werkzeug.utils import cached_property
 
 from app import format_notification_type
+from app.utils import group_by_key
 
 
 class TemplateList:
@@ -48,6 +49,18 @@ class TemplateList:
     def all_templates(self):
         return self.service.all_templates
 
+    @property
+    def templates_by_folder_id(self):
+        return self.service.templates_by_folder_id
+
+    @property
+    def template_folders_by_parent_id(self):
+        return self.service.template_folders_by_parent_id
+
+    @cached_property
+    def _folder_visibility(self):
+        return {}
+
     def _get_templates_and_folders(self, template_type, template_folder_id, ancestors):
         for item in self._get_template_folders(
             template_type,
@@ -81,8 +94,8 @@ class TemplateList:
 
         return [
             template
-            for template in self.all_templates
-            if ({template_type} & {"all", template["template_type"]}) and template.get("folder") == template_folder_id
+            for template in self.templates_by_folder_id.get(template_folder_id, [])
+            if {template_type} & {"all", template["template_type"]}
         ]
 
     def _get_template_folders(self, template_type, parent_folder_id):
@@ -91,24 +104,21 @@ class TemplateList:
 
         return [
             folder
-            for folder in self.all_template_folders
-            if (folder["parent_id"] == parent_folder_id and self._is_folder_visible(folder["id"], template_type))
+            for folder in self.template_folders_by_parent_id.get(parent_folder_id, [])
+            if self._is_folder_visible(folder["id"], template_type)
         ]
 
     def _is_folder_visible(self, template_folder_id, template_type):
         if template_type == "all":
             return True
 
-        if self._get_templates(template_type, template_folder_id):
-            return True
-
-        if any(
-            self._is_folder_visible(child_folder["id"], template_type)
-            for child_folder in self._get_template_folders(template_type, template_folder_id)
-        ):
-            return True
+        if (template_folder_id, template_type) not in self._folder_visibility:
+            self._folder_visibility[template_folder_id, template_type] = bool(
+                self._get_templates(template_type, template_folder_id)
+                or self._get_template_folders(template_type, template_folder_id)
+            )
 
-        return False
+        return self._folder_visibility[template_folder_id, template_type]
 
     @property
     def templates_to_show(self):
@@ -143,7 +153,7 @@ class UserTemplateList(TemplateList):
 
     @cached_property
     def all_templates(self):
-        all_folder_ids = [folder["id"] for folder in self.all_template_folders]
+        all_folder_ids = {folder["id"] for folder in self.all_template_folders} | {None}
 
         return [
             template
@@ -151,9 +161,19 @@ class UserTemplateList(TemplateList):
             # Check if each template is in a folder the user has
             # access to. If it's not in a folder ("None"), then
             # it's at the top level and all users have access.
-            if template["folder"] in (all_folder_ids + [None])
+            if template["folder"] in all_folder_ids
         ]
 
+    @cached_property
+    def templates_by_folder_id(self):
+        return group_by_key(self.all_templates, "folder")
+
+    @cached_property
+    def template_folders_by_parent_id(self):
+        # Folders the user can't see are flattened into their closest
+        # visible ancestor, so this can't reuse the service's index
+        return group_by_key(self.all_template_folders, "parent_id")
+
     @cached_property
     def all_template_folders(self):
         """Returns a modified list of folders a user has permission to view
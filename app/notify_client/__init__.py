@@ -1,18 +1,671 @@
-from flask import g, has_request_context, request
+import contextvars
+import json
+import os
+import secrets
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatchcase
+from functools import wraps
+from threading import Lock, Thread
+from time import monotonic, sleep, time
+
+from flask import current_app, g, has_request_context, request
 from flask_login import current_user
 from notifications_python_client import __version__
 from notifications_python_client.base import BaseAPIClient
 from notifications_utils.clients.redis import RequestCache
 
 from app.extensions import redis_client
+from app.performance import backend_call, record_cache_lookup
+from app.utils.http import get_http_session
+
+
+class LocalCache:
+    """
+    A small least-recently-used cache for values which are only needed by this process. Entries also expire after
+    `ttl_in_seconds`.
+    """
+
+    def __init__(self, maxsize, ttl_in_seconds):
+        self.maxsize = maxsize
+        self.ttl_in_seconds = ttl_in_seconds
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key):
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (monotonic() + self.ttl_in_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, pattern):
+        """
+        Removes a key, or every key matching a glob-style pattern like those passed to `delete_by_pattern`
+        """
+        with self._lock:
+            if not any(character in pattern for character in "*?["):
+                self._entries.pop(pattern, None)
+                return
+            for key in [key for key in self._entries if fnmatchcase(key, pattern)]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class JSONCacheCodec:
+    """
+    Serialises cached values as JSON.
+
+    Values longer than `compress_above_bytes` can be compressed with zlib, which makes large values like a service’s
+    list of templates roughly ten times smaller in Redis, at the cost of a little more time to read them. Compressed
+    values start with a header naming their format. JSON never starts with a null byte, so a value without a header
+    (including anything cached before compression was added) is read as plain JSON.
+
+    Releases from before compression can’t read compressed values, so unless `compress` is given, values are only
+    compressed once `REDIS_CACHE_COMPRESSION_ENABLED` is turned on. That should wait until every instance is running a
+    release which can read them.
+    """
+
+    HEADER_LENGTH = 4
+    ZLIB_JSON_HEADER = b"\x00zj1"
+    KNOWN_HEADERS = frozenset((ZLIB_JSON_HEADER,))
+    COMPRESS_ABOVE_BYTES = 16 * 1024
+    # Higher levels save little more space on JSON but take roughly twice as long
+    COMPRESSION_LEVEL = 1
+
+    def __init__(self, compress_above_bytes=COMPRESS_ABOVE_BYTES, compression_level=COMPRESSION_LEVEL, compress=None):
+        self.compress_above_bytes = compress_above_bytes
+        self.compression_level = compression_level
+        self.compress = compress
+
+    def _should_compress(self, serialised):
+        if self.compress_above_bytes is None or len(serialised) <= self.compress_above_bytes:
+            return False
+        if self.compress is None:
+            return current_app.config["REDIS_CACHE_COMPRESSION_ENABLED"]
+        return self.compress
+
+    def encode(self, value):
+        serialised = json.dumps(value)
+        if not self._should_compress(serialised):
+            return serialised
+        return self.ZLIB_JSON_HEADER + zlib.compress(serialised.encode("utf-8"), self.compression_level)
+
+    def _get_header(self, cached):
+        if isinstance(cached, bytes) and cached.startswith(b"\x00"):
+            return cached[: self.HEADER_LENGTH]
+        return None
+
+    def can_decode(self, cached):
+        """
+        Returns False for values written in a format this version doesn’t know about (for example by a newer
+        release during a deploy), which should be treated as not cached
+        """
+        header = self._get_header(cached)
+        return header is None or header in self.KNOWN_HEADERS
+
+    def decode(self, cached):
+        header = self._get_header(cached)
+        if header is None:
+            return json.loads(cached)
+        if header == self.ZLIB_JSON_HEADER:
+            return json.loads(zlib.decompress(cached[self.HEADER_LENGTH :]))
+        raise ValueError(f"Unknown cache value format {header!r}")
+
+
+class NotifyAdminRequestCache(RequestCache):
+    """
+    Adds generation-scoped keys to RequestCache.
+
+    Passing `generation` (the format of a generation key) to `set` appends the current value of that generation key
+    to the cache key. `new_generation` then invalidates every key in that generation with a single
+    write, instead of `delete_by_pattern` scanning the whole keyspace. Entries from old generations are never read
+    again and expire with their TTL.
+
+    Every key written by `set` is also added to an index for each group in `CACHE_GROUPS` that its format belongs
+    to, so `clear_group` can delete a whole group without scanning the keyspace. Each index is a sorted set scored
+    by when its keys expire, so keys which have expired are trimmed from it on every write.
+
+    When a key isn’t cached, only the caller which acquires its lease calls the API. Other callers wanting the same
+    key wait briefly for that value to be cached instead of all calling the API at once.
+
+    Keys whose format is in `local_key_formats` are also kept for a few seconds in a `LocalCache` in each process,
+    which saves a round trip to Redis for values read on almost every request. When one of these keys is deleted,
+    a message is published to every process so it can remove the key from its own local cache.
+
+    Values are serialised by `codec`, which by default is a `JSONCacheCodec`.
+    """
+
+    GROUP_INDEX_BATCH_SIZE = 500
+    LOCAL_CACHE_MAXSIZE = 1_000
+    # Also the longest a process can serve a stale value if it misses an invalidation message
+    LOCAL_CACHE_TTL_IN_SECONDS = 10
+    INVALIDATION_CHANNEL = "request-cache-invalidation"
+    # On a miss, one caller holds a lease while it gets the value from the API and the rest wait for it to be cached
+    LEASE_TTL_IN_SECONDS = 10
+    LEASE_WAIT_IN_SECONDS = 2
+    LEASE_POLL_INTERVAL_IN_SECONDS = 0.05
+
+    def __init__(self, redis_client, groups=None, local_key_formats=(), codec=None):
+        super().__init__(redis_client)
+        self.codec = codec or JSONCacheCodec()
+        self.groups_by_key_format = {}
+        for group, key_formats in (groups or {}).items():
+            for key_format in key_formats:
+                self.groups_by_key_format.setdefault(key_format, []).append(group)
+        self.local_key_formats = frozenset(local_key_formats)
+        self.local_cache = LocalCache(self.LOCAL_CACHE_MAXSIZE, self.LOCAL_CACHE_TTL_IN_SECONDS)
+        self._invalidation_listener_pid = None
+        self._invalidation_listener_lock = Lock()
+
+    def _start_invalidation_listener(self):
+        """
+        Makes sure this process is listening for keys to remove from its local cache, and returns whether it is.
+
+        Workers are forked after the app is created, so the listener (and anything cached before it started) belongs
+        to the process which started it.
+        """
+        if self._invalidation_listener_pid == os.getpid():
+            return True
+        with self._invalidation_listener_lock:
+            if self._invalidation_listener_pid == os.getpid():
+                return True
+            try:
+                pubsub = self.redis_client.redis_store.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.INVALIDATION_CHANNEL)
+            except Exception:
+                current_app.logger.exception("Redis error subscribing to %s", self.INVALIDATION_CHANNEL)
+                return False
+            self.local_cache.clear()
+            Thread(
+                target=self._listen_for_invalidations,
+                args=(pubsub, current_app._get_current_object()),
+                name="request-cache-invalidation-listener",
+                daemon=True,
+            ).start()
+            self._invalidation_listener_pid = os.getpid()
+            return True
+
+    def _listen_for_invalidations(self, pubsub, app):
+        try:
+            for message in pubsub.listen():
+                pattern = message["data"]
+                self.local_cache.invalidate(pattern.decode("utf-8") if isinstance(pattern, bytes) else pattern)
+        except Exception:
+            app.logger.exception("Redis error listening to %s", self.INVALIDATION_CHANNEL)
+        finally:
+            # We can’t tell what’s been invalidated since we stopped listening, so stop using the local cache until
+            # the next lookup starts listening again
+            self._invalidation_listener_pid = None
+            self.local_cache.clear()
+            pubsub.close()
+
+    def _use_local_cache(self, key_format):
+        # Without Redis there’d be no way to hear about keys deleted by other processes
+        return key_format in self.local_key_formats and self.redis_client.active and self._start_invalidation_listener()
+
+    def invalidate_local(self, pattern):
+        """
+        Removes a key (or every key matching a pattern) from the local cache of this and every other process
+        """
+        self.local_cache.invalidate(pattern)
+        if not self.redis_client.active:
+            return
+        try:
+            self.redis_client.redis_store.publish(self.INVALIDATION_CHANNEL, pattern)
+        except Exception:
+            current_app.logger.exception("Redis error publishing invalidation of %s", pattern)
+
+    def delete_keys(self, key_format, redis_keys):
+        """
+        Deletes several keys of the same format which aren’t covered by a `delete` decorator, in the same way the
+        decorator would: they’re also removed from this request’s prefetched values and every process’s local cache
+        """
+        if not redis_keys:
+            return
+        self.redis_client.delete(*redis_keys)
+        for redis_key in redis_keys:
+            self._forget_prefetched(redis_key)
+            if key_format in self.local_key_formats:
+                self.invalidate_local(redis_key)
+
+    @staticmethod
+    def _get_group_index_key(group):
+        return f"cache-group-{group}"
+
+    def add_to_groups(self, key_format, key, ttl_in_seconds=RequestCache.DEFAULT_TTL):
+        groups = self.groups_by_key_format.get(key_format, [])
+        if not groups or not self.redis_client.active:
+            return
+        now = time()
+        try:
+            pipe = self.redis_client.redis_store.pipeline(transaction=False)
+            for group in groups:
+                index_key = self._get_group_index_key(group)
+                pipe.zremrangebyscore(index_key, "-inf", now)
+                pipe.zadd(index_key, {key: now + ttl_in_seconds})
+                # No key is cached for longer than DEFAULT_TTL, so the index outlives everything in it
+                pipe.expire(index_key, self.DEFAULT_TTL)
+            pipe.execute()
+        except Exception:
+            # The value itself has already been cached, so don’t fail the request
+            current_app.logger.exception("Redis error adding %s to cache groups %s", key, groups)
+
+    def clear_group(self, group, batch_size=GROUP_INDEX_BATCH_SIZE):
+        """
+        Deletes every key in the group’s index, `batch_size` keys per round trip, and returns how many were deleted
+        """
+        if not self.redis_client.active:
+            return 0
+
+        index_key = self._get_group_index_key(group)
+        num_deleted = 0
+        batch = []
+
+        def delete_batch():
+            pipe = self.redis_client.redis_store.pipeline(transaction=False)
+            pipe.delete(*batch)
+            pipe.zrem(index_key, *batch)
+            deleted, _removed = pipe.execute()
+            current_app.logger.info("Deleted %s of %s keys in cache group %s", deleted, len(batch), group)
+            return deleted
+
+        try:
+            for key, _expires_at in self.redis_client.redis_store.zscan_iter(index_key, count=batch_size):
+                batch.append(key)
+                if len(batch) == batch_size:
+                    num_deleted += delete_batch()
+                    batch = []
+
+            if batch:
+                num_deleted += delete_batch()
+        except Exception:
+            current_app.logger.exception("Redis error clearing cache group %s", group)
+
+        self._forget_prefetched("*")
+        self.invalidate_local("*")
+        return num_deleted
+
+    @staticmethod
+    def _make_generation():
+        return secrets.token_hex(8)
+
+    def get_generation(self, generation_key):
+        if generation := self.redis_client.get(generation_key):
+            return generation.decode("utf-8")
+
+        # Never fall back to a fixed value here, otherwise entries cached before the generation key expired or was
+        # cleared would become readable again
+        generation = self._make_generation()
+        self.redis_client.set(generation_key, generation, ex=self.DEFAULT_TTL, nx=True)
+        # If another caller started a generation at the same time, theirs was stored instead, so everyone uses it
+        if stored_generation := self.redis_client.get(generation_key):
+            return stored_generation.decode("utf-8")
+        return generation
+
+    def get_generation_scoped_key(self, key, generation_key):
+        return f"{key}-generation-{self.get_generation(generation_key)}"
+
+    def _make_generation_scoped_key(self, key_format, generation_key_format, client_method, args, kwargs):
+        return self.get_generation_scoped_key(
+            self._make_key(key_format, client_method, args, kwargs),
+            self._make_key(generation_key_format, client_method, args, kwargs),
+        )
+
+    @staticmethod
+    def _get_lease_key(redis_key):
+        return f"{redis_key}-lease"
+
+    def _acquire_lease(self, redis_key):
+        """
+        Returns whether this caller should get the value for `redis_key` from the API.
+
+        Only one caller across every process holds the lease for a key at a time, so when a popular key expires the
+        API is called once rather than by every request which misses the cache at the same moment.
+        """
+        if not self.redis_client.active:
+            return True
+        try:
+            return bool(
+                self.redis_client.redis_store.set(
+                    self._get_lease_key(redis_key), os.getpid(), ex=self.LEASE_TTL_IN_SECONDS, nx=True
+                )
+            )
+        except Exception:
+            current_app.logger.exception("Redis error acquiring lease for %s", redis_key)
+            return True
+
+    def _release_lease(self, redis_key):
+        try:
+            self.redis_client.redis_store.delete(self._get_lease_key(redis_key))
+        except Exception:
+            # The lease will expire by itself
+            current_app.logger.exception("Redis error releasing lease for %s", redis_key)
+
+    def _wait_for_value(self, redis_key, use_local_cache):
+        deadline = monotonic() + self.LEASE_WAIT_IN_SECONDS
+        while monotonic() < deadline:
+            sleep(self.LEASE_POLL_INTERVAL_IN_SECONDS)
+            if (cached := self.redis_client.get(redis_key)) and self.codec.can_decode(cached):
+                if use_local_cache:
+                    self.local_cache.set(redis_key, cached)
+                return cached
+        return None
+
+    @staticmethod
+    def _get_prefetched():
+        return g.get("request_cache_prefetched", {}) if has_request_context() else {}
+
+    def _forget_prefetched(self, pattern):
+        prefetched = self._get_prefetched()
+        for key in [key for key in prefetched if fnmatchcase(key, pattern)]:
+            del prefetched[key]
+
+    def prefetch(self, keys):
+        """
+        Reads several keys from Redis in a single round trip, and keeps them for the rest of the request so that
+        client methods decorated with `set` don’t each read their key again. Keys which aren’t cached yet are kept
+        once a client method caches them during this request.
+
+        Keys which are in this process’s local cache are left for client methods to read from there, so they don’t
+        go to Redis at all.
+
+        Returns the keys which weren’t cached.
+        """
+        if not has_request_context() or not keys:
+            return list(keys)
+
+        if self.local_key_formats and self.redis_client.active and self._start_invalidation_listener():
+            keys = [key for key in keys if self.local_cache.get(key) is None]
+            if not keys:
+                return []
+
+        prefetched = g.setdefault("request_cache_prefetched", {})
+        values = [None] * len(keys)
+        if self.redis_client.active:
+            try:
+                values = self.redis_client.redis_store.mget(keys)
+            except Exception:
+                current_app.logger.exception("Redis error prefetching %s", keys)
+
+        values = [value if value and self.codec.can_decode(value) else None for value in values]
+        for key, value in zip(keys, values, strict=True):
+            record_cache_lookup(hit=bool(value))
+            prefetched[key] = value
+        return [key for key, value in zip(keys, values, strict=True) if not value]
+
+    def _get_cached(self, redis_key, use_local_cache):
+        prefetched = self._get_prefetched()
+        if cached := prefetched.get(redis_key):
+            return cached
+        if use_local_cache:
+            # Values are kept serialised so every caller gets its own copy to change
+            cached = self.local_cache.get(redis_key)
+            record_cache_lookup(hit=cached is not None, tier="local")
+            if cached is not None:
+                return cached
+        cached = self.redis_client.get(redis_key)
+        if cached and not self.codec.can_decode(cached):
+            cached = None
+        record_cache_lookup(hit=bool(cached))
+        if cached and use_local_cache:
+            self.local_cache.set(redis_key, cached)
+        if cached and redis_key in prefetched:
+            prefetched[redis_key] = cached
+        return cached
+
+    @staticmethod
+    def _get_fresh_key(redis_key):
+        return f"{redis_key}-fresh"
+
+    def _is_stale(self, redis_key):
+        return self.redis_client.active and not self.redis_client.get(self._get_fresh_key(redis_key))
+
+    def _cache_response(
+        self, key_format, redis_key, api_response, *, ttl_in_seconds, stale_after_in_seconds, use_local_cache
+    ):
+        serialised_response = self.codec.encode(api_response)
+        self.redis_client.set(redis_key, serialised_response, ex=int(ttl_in_seconds))
+        if stale_after_in_seconds is not None:
+            self.redis_client.set(self._get_fresh_key(redis_key), "1", ex=int(stale_after_in_seconds))
+        self.add_to_groups(key_format, redis_key, ttl_in_seconds=int(ttl_in_seconds))
+        if use_local_cache:
+            self.local_cache.set(redis_key, serialised_response)
+        if redis_key in (prefetched := self._get_prefetched()):
+            prefetched[redis_key] = serialised_response
+        return api_response
+
+    def _revalidate_in_background(self, redis_key, get_from_api):
+        if not self._acquire_lease(redis_key):
+            # Another request is already revalidating this key
+            return
+
+        app = current_app._get_current_object()
+
+        def revalidate():
+            with app.app_context():
+                try:
+                    get_from_api()
+                except Exception:
+                    app.logger.exception("Error revalidating cached value for %s", redis_key)
+                finally:
+                    self._release_lease(redis_key)
+
+        Thread(target=revalidate, name="request-cache-revalidation", daemon=True).start()
+
+    def set(self, key_format, *, ttl_in_seconds=RequestCache.DEFAULT_TTL, generation=None, stale_after_in_seconds=None):
+        """
+        Caches the return value of a client method for `ttl_in_seconds`.
+
+        If `stale_after_in_seconds` is given, a value older than that is still returned straight away, but is
+        refreshed from the API in the background (by one caller at a time). Only requests which find nothing cached
+        at all wait for the API.
+        """
 
-cache = RequestCache(redis_client)
+        def _set(client_method):
+            @wraps(client_method)
+            def new_client_method(*args, **kwargs):
+                if generation is None:
+                    redis_key = self._make_key(key_format, client_method, args, kwargs)
+                else:
+                    redis_key = self._make_generation_scoped_key(key_format, generation, client_method, args, kwargs)
+                use_local_cache = self._use_local_cache(key_format)
+
+                def get_from_api():
+                    return self._cache_response(
+                        key_format,
+                        redis_key,
+                        client_method(*args, **kwargs),
+                        ttl_in_seconds=ttl_in_seconds,
+                        stale_after_in_seconds=stale_after_in_seconds,
+                        use_local_cache=use_local_cache,
+                    )
+
+                if cached := self._get_cached(redis_key, use_local_cache):
+                    if stale_after_in_seconds is not None and self._is_stale(redis_key):
+                        self._revalidate_in_background(redis_key, get_from_api)
+                    return self.codec.decode(cached)
+                has_lease = self._acquire_lease(redis_key)
+                # If someone else is already getting this value from the API, wait for them to cache it. If they
+                # take too long we fall through and call the API ourselves.
+                if not has_lease and (cached := self._wait_for_value(redis_key, use_local_cache)):
+                    return self.codec.decode(cached)
+                try:
+                    return get_from_api()
+                finally:
+                    if has_lease:
+                        self._release_lease(redis_key)
+
+            return new_client_method
+
+        return _set
+
+    def delete(self, key_format):
+        delete_from_redis = super().delete(key_format)
+
+        def _delete(client_method):
+            delete_method = delete_from_redis(client_method)
+
+            @wraps(client_method)
+            def new_client_method(*args, **kwargs):
+                try:
+                    return delete_method(*args, **kwargs)
+                finally:
+                    redis_key = self._make_key(key_format, client_method, args, kwargs)
+                    self._forget_prefetched(redis_key)
+                    if key_format in self.local_key_formats:
+                        self.invalidate_local(redis_key)
+
+            return new_client_method
+
+        return _delete
+
+    def delete_by_pattern(self, key_format):
+        delete_from_redis = super().delete_by_pattern(key_format)
+
+        def _delete(client_method):
+            delete_method = delete_from_redis(client_method)
+
+            @wraps(client_method)
+            def new_client_method(*args, **kwargs):
+                try:
+                    return delete_method(*args, **kwargs)
+                finally:
+                    pattern = self._make_key(key_format, client_method, args, kwargs)
+                    self._forget_prefetched(pattern)
+                    self.invalidate_local(pattern)
+
+            return new_client_method
+
+        return _delete
+
+    def new_generation(self, generation_key_format):
+        def _new_generation(client_method):
+            @wraps(client_method)
+            def new_client_method(*args, **kwargs):
+                try:
+                    return client_method(*args, **kwargs)
+                finally:
+                    self.redis_client.set(
+                        self._make_key(generation_key_format, client_method, args, kwargs),
+                        self._make_generation(),
+                        ex=self.DEFAULT_TTL,
+                    )
+
+            return new_client_method
+
+        return _new_generation
+
+
+# The groups of cached keys which platform admins can clear. Each entry is the key format passed to `cache.set` (or
+# `cache.add_to_groups`). Note: `service-{service_id}-templates` is cleared for both services and templates.
+CACHE_GROUPS = {
+    "user": [
+        "user-{user_id}",
+    ],
+    "service": [
+        "has_jobs-{service_id}",
+        "service-{service_id}",
+        "service-{service_id}-templates",
+        "service-{service_id}-data-retention",
+        "service-{service_id}-template-folders",
+        "service-{service_id}-returned-letters-statistics",
+        "service-{service_id}-returned-letters-summary",
+    ],
+    "template": [
+        "service-{service_id}-templates",
+        "service-{service_id}-template-{template_id}-version-{version}",
+        "service-{service_id}-template-{template_id}-versions",
+        "service-{service_id}-template-{template_id}-version-{version}-all-page-counts",
+        "service-{service_id}-template-precompiled",
+    ],
+    "email_branding": [
+        "email_branding",
+        "email_branding-{branding_id}",
+    ],
+    "letter_branding": [
+        "letter_branding",
+        "letter_branding-{branding_id}",
+    ],
+    "organisation": [
+        "organisations",
+        "domains",
+        "live-service-and-organisation-counts",
+        "organisation-{org_id}-name",
+        "organisation-{org_id}-email-branding-pool",
+        "organisation-{org_id}-letter-branding-pool",
+    ],
+    "text_message_and_letter_rates": [
+        "letter-rates",
+        "sms-rate",
+    ],
+    "unsubscribe_request_reports": [
+        "service-{service_id}-unsubscribe-request-reports-summary",
+        "service-{service_id}-unsubscribe-request-statistics",
+    ],
+    "service_join_request": [
+        "service-join-request-{request_id}",
+    ],
+}
+
+# Keys read on almost every request, which are also kept in each process’s local cache
+LOCALLY_CACHED_KEY_FORMATS = {
+    "letter-rates",
+    "sms-rate",
+    "email_branding",
+    "letter_branding",
+    "organisations",
+    "domains",
+    "service-{service_id}",
+}
+
+cache = NotifyAdminRequestCache(redis_client, CACHE_GROUPS, LOCALLY_CACHED_KEY_FORMATS)
 
 
 def _attach_current_user(data):
     return dict(created_by=current_user.id, **data)
 
 
+def run_concurrently(*calls, timeout=None):
+    """
+    Makes several independent API calls at the same time, and returns their results in the same order as `calls`.
+
+    Each call runs in a copy of the current context, so it sees the same request, `g` and onwards request headers as
+    the caller. Under the eventlet worker these are green threads. An exception raised by any call is re-raised here,
+    as is `TimeoutError` if the calls haven’t all finished within `timeout` seconds.
+    """
+    if not calls:
+        return []
+
+    deadline = monotonic() + timeout if timeout is not None else None
+    executor = ThreadPoolExecutor(max_workers=len(calls))
+    try:
+        futures = [executor.submit(contextvars.copy_context().run, call) for call in calls]
+        return [
+            future.result(timeout=None if deadline is None else max(deadline - monotonic(), 0)) for future in futures
+        ]
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 class NotifyAdminAPIClient(BaseAPIClient):
     def __init__(self, app):
         try:
@@ -32,6 +685,7 @@ class NotifyAdminAPIClient(BaseAPIClient):
         # given it's designed for destructuring end-user api keys
         self.service_id = app.config["ADMIN_CLIENT_USER_NAME"]
         self.api_key = app.config["ADMIN_CLIENT_SECRET"]
+        self.request_session = get_http_session(app)
 
     def generate_headers(self, api_token):
         headers = {
@@ -50,6 +704,10 @@ class NotifyAdminAPIClient(BaseAPIClient):
 
         return headers
 
+    def _perform_request(self, method, url, kwargs):
+        with backend_call("api"):
+            return super()._perform_request(method, url, kwargs)
+
 
 class InviteTokenError(Exception):
     pass
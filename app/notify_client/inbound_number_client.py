@@ -19,7 +19,7 @@ class InboundNumberClient(NotifyAdminAPIClient):
         return self.get(f"/inbound-number/service/{service_id}")
 
     @cache.delete("service-{service_id}")
-    @cache.delete_by_pattern("service-{service_id}-template-*")
+    @cache.new_generation("service-{service_id}-template-generation")
     def add_inbound_number_to_service(self, service_id, inbound_number_id=None):
         data = {}
 
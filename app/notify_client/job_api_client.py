@@ -110,6 +110,7 @@ class JobApiClient(NotifyAdminAPIClient):
             b"true",
             ex=int(cache.DEFAULT_TTL),
         )
+        cache.add_to_groups("has_jobs-{service_id}", f"has_jobs-{service_id}")
 
         return job
 
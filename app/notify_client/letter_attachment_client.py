@@ -14,7 +14,7 @@ class LetterAttachmentClient(NotifyAdminAPIClient):
         return self.get(url=f"/letter-attachment/{letter_attachment_id}")
 
     @cache.delete("service-{service_id}-templates")
-    @cache.delete_by_pattern("service-{service_id}-template-*")
+    @cache.new_generation("service-{service_id}-template-generation")
     def create_letter_attachment(self, *, upload_id, original_filename, page_count, template_id, service_id):
         data = {
             "upload_id": str(upload_id),
@@ -26,7 +26,7 @@ class LetterAttachmentClient(NotifyAdminAPIClient):
         return self.post(url="/letter-attachment", data=data)
 
     @cache.delete("service-{service_id}-templates")
-    @cache.delete_by_pattern("service-{service_id}-template-*")
+    @cache.new_generation("service-{service_id}-template-generation")
     def archive_letter_attachment(self, *, letter_attachment_id, user_id, service_id):
         data = {
             "archived_by": str(user_id),
@@ -7,7 +7,6 @@ from notifications_utils.local_vars import LazyLocalGetter
 from werkzeug.local import LocalProxy
 
 from app import memo_resetters
-from app.extensions import redis_client
 from app.notify_client import NotifyAdminAPIClient, cache
 
 
@@ -61,7 +60,7 @@ class OrganisationsClient(NotifyAdminAPIClient):
         api_response = self.post(url=f"/organisations/{org_id}", data=kwargs)
 
         if cached_service_ids:
-            redis_client.delete(*map("service-{}".format, cached_service_ids))
+            cache.delete_keys("service-{service_id}", [f"service-{service_id}" for service_id in cached_service_ids])
 
         return api_response
 
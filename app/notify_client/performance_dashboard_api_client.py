@@ -9,7 +9,7 @@ from app.notify_client import NotifyAdminAPIClient, cache
 
 
 class PerformanceDashboardAPIClient(NotifyAdminAPIClient):
-    @cache.set("performance-stats-{start_date}-to-{end_date}", ttl_in_seconds=3600)
+    @cache.set("performance-stats-{start_date}-to-{end_date}", ttl_in_seconds=86_400, stale_after_in_seconds=3600)
     def get_performance_dashboard_stats(
         self,
         *,
@@ -166,10 +166,12 @@ class ServiceAPIClient(NotifyAdminAPIClient):
         )
 
     @cache.delete("service-{service_id}")
-    @cache.delete_by_pattern("service-{service_id}-template*")
+    @cache.delete("service-{service_id}-templates")
+    @cache.delete("service-{service_id}-template-folders")
+    @cache.new_generation("service-{service_id}-template-generation")
     def archive_service(self, service_id, cached_service_user_ids):
         if cached_service_user_ids:
-            redis_client.delete(*map("user-{}".format, cached_service_user_ids))
+            cache.delete_keys("user-{user_id}", [f"user-{user_id}" for user_id in cached_service_user_ids])
         return self.post(f"/service/{service_id}/archive", data=None)
 
     @cache.delete("service-{service_id}")
@@ -226,7 +228,7 @@ class ServiceAPIClient(NotifyAdminAPIClient):
         return self.post(endpoint, data)
 
     @cache.delete("service-{service_id}-templates")
-    @cache.delete_by_pattern("service-{service_id}-template-{template_id}*")
+    @cache.new_generation("service-{service_id}-template-generation")
     def update_service_template(self, service_id, template_id, **kwargs):
         """
         Update a service template.
@@ -239,7 +241,7 @@ class ServiceAPIClient(NotifyAdminAPIClient):
         return self.post(endpoint, data)
 
     @cache.delete("service-{service_id}-templates")
-    @cache.delete_by_pattern("service-{service_id}-template-{id_}*")
+    @cache.new_generation("service-{service_id}-template-generation")
     def redact_service_template(self, service_id, id_):
         return self.post(
             f"/service/{service_id}/template/{id_}",
@@ -247,7 +249,7 @@ class ServiceAPIClient(NotifyAdminAPIClient):
         )
 
     @cache.delete("service-{service_id}-templates")
-    @cache.delete_by_pattern("service-{service_id}-template-{template_id}*")
+    @cache.new_generation("service-{service_id}-template-generation")
     def update_service_template_sender(self, service_id, template_id, reply_to):
         data = {
             "reply_to": reply_to,
@@ -255,7 +257,10 @@ class ServiceAPIClient(NotifyAdminAPIClient):
         data = _attach_current_user(data)
         return self.post(f"/service/{service_id}/template/{template_id}", data)
 
-    @cache.set("service-{service_id}-template-{template_id}-version-{version}")
+    @cache.set(
+        "service-{service_id}-template-{template_id}-version-{version}",
+        generation="service-{service_id}-template-generation",
+    )
     def get_service_template(self, service_id, template_id, version=None):
         """
         Retrieve a service template.
@@ -265,7 +270,10 @@ class ServiceAPIClient(NotifyAdminAPIClient):
             endpoint = f"{endpoint}/version/{version}"
         return self.get(endpoint)
 
-    @cache.set("service-{service_id}-template-{template_id}-versions")
+    @cache.set(
+        "service-{service_id}-template-{template_id}-versions",
+        generation="service-{service_id}-template-generation",
+    )
     def get_service_template_versions(self, service_id, template_id):
         """
         Retrieve a list of versions for a template
@@ -273,7 +281,7 @@ class ServiceAPIClient(NotifyAdminAPIClient):
         endpoint = f"/service/{service_id}/template/{template_id}/versions"
         return self.get(endpoint)
 
-    @cache.set("service-{service_id}-template-precompiled")
+    @cache.set("service-{service_id}-template-precompiled", generation="service-{service_id}-template-generation")
     def get_precompiled_template(self, service_id):
         """
         Returns the precompiled template for a service, creating it if it doesn't already exist
@@ -299,7 +307,7 @@ class ServiceAPIClient(NotifyAdminAPIClient):
         )
 
     @cache.delete("service-{service_id}-templates")
-    @cache.delete_by_pattern("service-{service_id}-template-{template_id}*")
+    @cache.new_generation("service-{service_id}-template-generation")
     def delete_service_template(self, service_id, template_id):
         """
         Set a service template's archived flag to True
@@ -349,7 +357,7 @@ class ServiceAPIClient(NotifyAdminAPIClient):
         return self.get(f"/service/{service_id}/inbound-sms/summary")
 
     @cache.delete("service-{service_id}")
-    @cache.delete_by_pattern("service-{service_id}-template-*")
+    @cache.new_generation("service-{service_id}-template-generation")
     def remove_service_inbound_sms(self, service_id, archive: bool):
         return self.post(f"/service/{service_id}/inbound-sms/remove", data={"archive": archive})
 
@@ -368,7 +376,7 @@ class ServiceAPIClient(NotifyAdminAPIClient):
         return self.post(f"/service/{service_id}/email-reply-to/verify", data={"email": email_address})
 
     @cache.delete("service-{service_id}")
-    @cache.delete_by_pattern("service-{service_id}-template-*")
+    @cache.new_generation("service-{service_id}-template-generation")
     def add_reply_to_email_address(self, service_id, email_address, is_default=False):
         return self.post(
             f"/service/{service_id}/email-reply-to",
@@ -376,7 +384,7 @@ class ServiceAPIClient(NotifyAdminAPIClient):
         )
 
     @cache.delete("service-{service_id}")
-    @cache.delete_by_pattern("service-{service_id}-template-*")
+    @cache.new_generation("service-{service_id}-template-generation")
     def update_reply_to_email_address(self, service_id, reply_to_email_id, email_address, is_default=False):
         return self.post(
             f"/service/{service_id}/email-reply-to/{reply_to_email_id}",
@@ -384,7 +392,7 @@ class ServiceAPIClient(NotifyAdminAPIClient):
         )
 
     @cache.delete("service-{service_id}")
-    @cache.delete_by_pattern("service-{service_id}-template-*")
+    @cache.new_generation("service-{service_id}-template-generation")
     def delete_reply_to_email_address(self, service_id, reply_to_email_id):
         return self.post(f"/service/{service_id}/email-reply-to/{reply_to_email_id}/archive", data=None)
 
@@ -395,7 +403,7 @@ class ServiceAPIClient(NotifyAdminAPIClient):
         return self.get(f"/service/{service_id}/letter-contact/{letter_contact_id}")
 
     @cache.delete("service-{service_id}")
-    @cache.delete_by_pattern("service-{service_id}-template-*")
+    @cache.new_generation("service-{service_id}-template-generation")
     def add_letter_contact(self, service_id, contact_block, is_default=False):
         return self.post(
             f"/service/{service_id}/letter-contact",
@@ -403,7 +411,7 @@ class ServiceAPIClient(NotifyAdminAPIClient):
         )
 
     @cache.delete("service-{service_id}")
-    @cache.delete_by_pattern("service-{service_id}-template-*")
+    @cache.new_generation("service-{service_id}-template-generation")
     def update_letter_contact(self, service_id, letter_contact_id, contact_block, is_default=False):
         return self.post(
             f"/service/{service_id}/letter-contact/{letter_contact_id}",
@@ -411,7 +419,7 @@ class ServiceAPIClient(NotifyAdminAPIClient):
         )
 
     @cache.delete("service-{service_id}")
-    @cache.delete_by_pattern("service-{service_id}-template-*")
+    @cache.new_generation("service-{service_id}-template-generation")
     def delete_letter_contact(self, service_id, letter_contact_id):
         return self.post(f"/service/{service_id}/letter-contact/{letter_contact_id}/archive", data=None)
 
@@ -422,14 +430,14 @@ class ServiceAPIClient(NotifyAdminAPIClient):
         return self.get(f"/service/{service_id}/sms-sender/{sms_sender_id}")
 
     @cache.delete("service-{service_id}")
-    @cache.delete_by_pattern("service-{service_id}-template-*")
+    @cache.new_generation("service-{service_id}-template-generation")
     def add_sms_sender(self, service_id, sms_sender, is_default=False):
         data = {"sms_sender": sms_sender, "is_default": is_default}
 
         return self.post(f"/service/{service_id}/sms-sender", data=data)
 
     @cache.delete("service-{service_id}")
-    @cache.delete_by_pattern("service-{service_id}-template-*")
+    @cache.new_generation("service-{service_id}-template-generation")
     def update_sms_sender(self, service_id, sms_sender_id, sms_sender, is_default=False):
         return self.post(
             f"/service/{service_id}/sms-sender/{sms_sender_id}",
@@ -437,7 +445,7 @@ class ServiceAPIClient(NotifyAdminAPIClient):
         )
 
     @cache.delete("service-{service_id}")
-    @cache.delete_by_pattern("service-{service_id}-template-*")
+    @cache.new_generation("service-{service_id}-template-generation")
     def delete_sms_sender(self, service_id, sms_sender_id):
         return self.post(f"/service/{service_id}/sms-sender/{sms_sender_id}/archive", data=None)
 
@@ -12,7 +12,7 @@ class StatusApiClient(NotifyAdminAPIClient):
     def get_status(self, *params):
         return self.get("/_status", *params)
 
-    @cache.set("live-service-and-organisation-counts", ttl_in_seconds=3600)
+    @cache.set("live-service-and-organisation-counts", ttl_in_seconds=86_400, stale_after_in_seconds=3600)
     def get_count_of_live_services_and_organisations(self):
         return self.get("/_status/live-service-and-organisation-counts")
 
@@ -5,7 +5,6 @@ from notifications_utils.local_vars import LazyLocalGetter
 from werkzeug.local import LocalProxy
 
 from app import memo_resetters
-from app.extensions import redis_client
 from app.notify_client import NotifyAdminAPIClient, cache
 
 
@@ -31,6 +30,7 @@ class TemplateFolderAPIClient(NotifyAdminAPIClient):
 
     @cache.delete("service-{service_id}-template-folders")
     @cache.delete("service-{service_id}-templates")
+    @cache.new_generation("service-{service_id}-template-generation")
     def move_to_folder(self, service_id, folder_id, template_ids, folder_ids):
         if folder_id:
             url = f"/service/{service_id}/template-folder/{folder_id}/contents"
@@ -45,9 +45,6 @@ class TemplateFolderAPIClient(NotifyAdminAPIClient):
             },
         )
 
-        if template_ids:
-            redis_client.delete(*(f"service-{service_id}-template-{id}-version-None" for id in template_ids))
-
     @cache.delete("service-{service_id}-template-folders")
     def update_template_folder(self, service_id, template_folder_id, name, users_with_permission=None):
         data = {"name": name}
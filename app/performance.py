@@ -1,7 +1,31 @@
 import os
+from collections import Counter as CallCounter
+from contextlib import contextmanager
 from functools import partial
+from time import monotonic
 from urllib.parse import parse_qs
 
+import boto3
+from flask import current_app, g, has_request_context, request
+from gds_metrics.metrics import Counter, Histogram
+
+BACKEND_CALL_DURATION_SECONDS = Histogram(
+    "admin_backend_call_duration_seconds",
+    "Time taken by calls from the admin app to backend services",
+    ["endpoint", "backend"],
+)
+BACKEND_CALLS_PER_REQUEST = Histogram(
+    "admin_backend_calls_per_request",
+    "Number of calls to each backend service made while handling a single request",
+    ["endpoint", "backend"],
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100, float("inf")),
+)
+CACHE_LOOKUPS = Counter(
+    "admin_cache_lookups_total",
+    "Number of lookups in the request cache, by tier (`local` or `redis`) and whether the value was cached",
+    ["endpoint", "tier", "result"],
+)
+
 
 def sentry_sampler(sampling_context, sample_rate: float = 0.0):
     if sampling_context["parent_sampled"]:
@@ -52,3 +76,72 @@ def init_performance_monitoring():
             traces_sampler=traces_sampler,
             release=release,
         )
+
+
+def _get_endpoint():
+    return (request.endpoint or "none") if has_request_context() else "none"
+
+
+def _record_backend_call(backend, duration):
+    BACKEND_CALL_DURATION_SECONDS.labels(endpoint=_get_endpoint(), backend=backend).observe(duration)
+    if has_request_context():
+        g.setdefault("backend_calls", CallCounter())[backend] += 1
+
+
+@contextmanager
+def backend_call(backend):
+    """
+    Times a call to a backend service (for example `api` or `template-preview`) and counts it against the current
+    request. Can also be used as a decorator.
+    """
+    start = monotonic()
+    try:
+        yield
+    finally:
+        _record_backend_call(backend, monotonic() - start)
+
+
+def record_cache_lookup(hit, tier="redis"):
+    CACHE_LOOKUPS.labels(endpoint=_get_endpoint(), tier=tier, result="hit" if hit else "miss").inc()
+
+
+def _before_s3_call(context, **kwargs):
+    context["admin_backend_call_start"] = monotonic()
+
+
+def _after_s3_call(context, **kwargs):
+    if start := context.get("admin_backend_call_start"):
+        _record_backend_call("s3", monotonic() - start)
+
+
+def check_backend_call_budget(response):
+    backend_calls = g.get("backend_calls", CallCounter())
+    endpoint = _get_endpoint()
+
+    for backend in ("api", "s3", "template-preview"):
+        BACKEND_CALLS_PER_REQUEST.labels(endpoint=endpoint, backend=backend).observe(backend_calls[backend])
+
+    budget = current_app.config["BACKEND_CALL_BUDGETS"].get(endpoint, current_app.config["BACKEND_CALL_BUDGET"])
+    if (total := sum(backend_calls.values())) > budget:
+        current_app.logger.warning(
+            "%s made %s backend calls, more than its budget of %s (%s)",
+            endpoint,
+            total,
+            budget,
+            ", ".join(f"{backend}: {count}" for backend, count in sorted(backend_calls.items())),
+            extra={"endpoint": endpoint, "backend_calls": total, "backend_call_budget": budget},
+        )
+
+    return response
+
+
+def init_backend_call_tracing(application):
+    application.after_request(check_backend_call_budget)
+
+    # boto3 resources and clients are created from the default session, so hooking into its events covers every
+    # S3 operation (including ones made by notifications_utils)
+    if boto3.DEFAULT_SESSION is None:
+        boto3.setup_default_session()
+    events = boto3.DEFAULT_SESSION.events
+    events.register("before-call.s3", _before_s3_call, unique_id="admin-before-s3-call")
+    events.register("after-call.s3", _after_s3_call, unique_id="admin-after-s3-call")
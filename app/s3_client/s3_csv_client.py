@@ -1,12 +1,16 @@
+import codecs
+import csv
 import uuid
+from io import StringIO
 
 import botocore
-from flask import current_app
+from flask import current_app, g, has_app_context
 from notifications_utils.s3 import s3upload as utils_s3upload
 
 from app.s3_client import get_s3_object
 
 FILE_LOCATION_STRUCTURE = "service-{}-notify/{}.csv"
+PARTIAL_DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
 
 def get_csv_location(service_id, upload_id, bucket=None):
@@ -43,19 +47,96 @@ def s3download(service_id, upload_id, bucket=None):
     return contents
 
 
+def _get_first_rows(contents, number_of_rows, *, complete):
+    """
+    Returns the header and first `number_of_rows` rows from the start of a file, or `None` if `contents` doesn’t
+    have them all yet.
+
+    Rows are counted with a CSV reader, like `OriginalUploadRows`, because a quoted cell can contain line breaks.
+    Until the whole file has been downloaded, a row is only counted once something comes after it, because the
+    last row in `contents` could be cut off part way through.
+    """
+    position = 0
+
+    def lines():
+        nonlocal position
+        for line in StringIO(contents):
+            position += len(line)
+            yield line
+
+    rows = csv.reader(lines(), skipinitialspace=True)
+    for _ in range(number_of_rows + 1):
+        if next(rows, None) is None or (position == len(contents) and not complete):
+            break
+        end_of_rows = position
+    else:
+        return contents[:end_of_rows]
+
+    return contents if complete else None
+
+
+def s3download_first_rows(service_id, upload_id, number_of_rows, bucket=None, chunk_size=PARTIAL_DOWNLOAD_CHUNK_SIZE):
+    """
+    Downloads only the header and the first `number_of_rows` rows of a file.
+
+    The file is read in `chunk_size` ranges until we have enough rows (or the whole file), so how long this takes
+    doesn’t depend on how big the file is.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    contents = ""
+    bytes_downloaded = 0
+    try:
+        key = get_csv_upload(service_id, upload_id, bucket)
+        while True:
+            try:
+                response = key.get(Range=f"bytes={bytes_downloaded}-{bytes_downloaded + chunk_size - 1}")
+            except botocore.exceptions.ClientError as e:
+                # Asking for a range which starts at the end of the file (for example if the file is empty)
+                if e.response["Error"]["Code"] == "InvalidRange":
+                    return _get_first_rows(contents + decoder.decode(b"", final=True), number_of_rows, complete=True)
+                raise
+            chunk = response["Body"].read()
+            bytes_downloaded += len(chunk)
+            complete = bytes_downloaded >= int(response["ContentRange"].rsplit("/", 1)[1])
+            # A character can be split between two ranges, so the decoder keeps hold of any partial character
+            contents += decoder.decode(chunk, final=complete)
+            if (first_rows := _get_first_rows(contents, number_of_rows, complete=complete)) is not None:
+                return first_rows
+    except botocore.exceptions.ClientError as e:
+        current_app.logger.error("Unable to download s3 file %s", FILE_LOCATION_STRUCTURE.format(service_id, upload_id))
+        raise e
+
+
+def _get_metadata_memo():
+    # Metadata is memoised for the lifetime of the request (or app context) so that views which check it
+    # more than once only make a single round trip to S3
+    if not has_app_context():
+        return {}
+    return g.setdefault("csv_upload_metadata", {})
+
+
 def set_metadata_on_csv_upload(service_id, upload_id, bucket=None, **kwargs):
+    metadata = {key: str(value) for key, value in kwargs.items()}
+    # S3 metadata can’t be changed in place, so the object is copied over itself with the new metadata
     get_csv_upload(service_id, upload_id, bucket=bucket).copy_from(
         CopySource="{}/{}".format(*get_csv_location(service_id, upload_id, bucket=bucket)),
         ServerSideEncryption="AES256",
-        Metadata={key: str(value) for key, value in kwargs.items()},
+        Metadata=metadata,
         MetadataDirective="REPLACE",
     )
+    _get_metadata_memo()[get_csv_location(service_id, upload_id, bucket)] = metadata
 
 
 def get_csv_metadata(service_id, upload_id, bucket=None):
-    try:
-        key = get_csv_upload(service_id, upload_id, bucket)
-        return key.get()["Metadata"]
-    except botocore.exceptions.ClientError as e:
-        current_app.logger.error("Unable to download s3 file %s", FILE_LOCATION_STRUCTURE.format(service_id, upload_id))
-        raise e
+    memo = _get_metadata_memo()
+    location = get_csv_location(service_id, upload_id, bucket)
+    if location not in memo:
+        try:
+            # Reading `metadata` makes a HEAD request, so we don’t start downloading the file itself
+            memo[location] = get_csv_upload(service_id, upload_id, bucket).metadata
+        except botocore.exceptions.ClientError as e:
+            current_app.logger.error(
+                "Unable to download s3 file %s", FILE_LOCATION_STRUCTURE.format(service_id, upload_id)
+            )
+            raise e
+    return dict(memo[location])
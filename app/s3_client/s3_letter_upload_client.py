@@ -6,6 +6,12 @@ from boto3 import resource
 from flask import current_app
 from notifications_utils.s3 import s3upload as utils_s3upload
 
+from app.extensions import redis_client
+from app.utils.letters import split_pdf_into_pages
+
+# Long enough to cover someone checking and sending their letter, short enough not to keep every upload around
+UPLOADED_LETTER_PAGES_CACHE_TTL_IN_SECONDS = 24 * 60 * 60
+
 
 class LetterNotFoundError(Exception):
     pass
@@ -84,6 +90,58 @@ def get_letter_pdf_and_metadata(service_id, file_id):
     return pdf, LetterMetadata(s3_object["Metadata"])
 
 
+def _get_letter_page_cache_key(service_id, file_id, page):
+    return f"service-{service_id}-uploaded-letter-{file_id}-page-{page}"
+
+
+def _get_letter_metadata_cache_key(service_id, file_id):
+    return f"service-{service_id}-uploaded-letter-{file_id}-metadata"
+
+
+def _cache_letter_pages_and_metadata(service_id, file_id, pages, metadata):
+    if not redis_client.active:
+        return
+    try:
+        pipe = redis_client.redis_store.pipeline(transaction=False)
+        for page, pdf_page in enumerate(pages, start=1):
+            pipe.set(
+                _get_letter_page_cache_key(service_id, file_id, page),
+                pdf_page,
+                ex=UPLOADED_LETTER_PAGES_CACHE_TTL_IN_SECONDS,
+            )
+        pipe.set(
+            _get_letter_metadata_cache_key(service_id, file_id),
+            json.dumps(metadata._metadata),
+            ex=UPLOADED_LETTER_PAGES_CACHE_TTL_IN_SECONDS,
+        )
+        pipe.execute()
+    except Exception:
+        # We’ve already got the page we need, so don’t fail the request
+        current_app.logger.exception("Redis error caching pages of letter %s for service %s", file_id, service_id)
+
+
+def get_letter_pdf_page_and_metadata(service_id, file_id, page):
+    """
+    Returns one page of an uploaded letter, as a single page PDF, and the letter’s metadata.
+
+    The first time a page is asked for, the letter is split into pages which are cached along with its metadata.
+    Previewing the rest of the letter then reads one small page from the cache, instead of downloading and parsing
+    the whole PDF again for every page. Returns `None` for the page if the letter doesn’t have that many pages.
+    """
+    cached_metadata = redis_client.get(_get_letter_metadata_cache_key(service_id, file_id))
+    if cached_metadata:
+        if cached_page := redis_client.get(_get_letter_page_cache_key(service_id, file_id, page)):
+            return cached_page, LetterMetadata(json.loads(cached_metadata))
+
+    pdf, metadata = get_letter_pdf_and_metadata(service_id, file_id)
+    pages = split_pdf_into_pages(pdf)
+    _cache_letter_pages_and_metadata(service_id, file_id, pages, metadata)
+
+    if not 1 <= page <= len(pages):
+        return None, metadata
+    return pages[page - 1], metadata
+
+
 def get_letter_metadata(service_id, file_id):
     s3_object = get_letter_s3_object(service_id, file_id)
     return LetterMetadata(s3_object["Metadata"])
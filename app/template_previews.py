@@ -1,4 +1,5 @@
 import base64
+import hashlib
 from contextvars import ContextVar
 from io import BytesIO
 
@@ -10,6 +11,9 @@ from notifications_utils.pdf import extract_page_from_pdf
 from werkzeug.local import LocalProxy
 
 from app import memo_resetters
+from app.extensions import redis_client
+from app.performance import backend_call
+from app.utils.http import get_http_session
 
 
 class TemplatePreviewClient:
@@ -17,8 +21,13 @@ class TemplatePreviewClient:
     api_key: str
     api_host: str
 
+    # Previews are cached by a hash of everything sent to template preview, so a cached preview never goes stale
+    PREVIEW_CACHE_TTL_IN_SECONDS = 24 * 60 * 60
+    PREVIEW_CACHE_MAX_SIZE_IN_BYTES = 512 * 1024
+    PREVIEW_MIMETYPES = {"png": "image/png", "pdf": "application/pdf"}
+
     def __init__(self, app):
-        self.requests_session = requests.Session()
+        self.requests_session = get_http_session(app)
         self.api_key = app.config["TEMPLATE_PREVIEW_API_KEY"]
         self.api_host = app.config["TEMPLATE_PREVIEW_API_HOST"]
 
@@ -28,6 +37,49 @@ class TemplatePreviewClient:
         allowed_headers = {header: value for header, value in headers.items() if header.lower() in header_allowlist}
         return allowed_headers.items()
 
+    @staticmethod
+    def _get_preview_digest(*parts):
+        return hashlib.sha256(
+            json.dumps(parts, sort_keys=True, default=str).encode("utf-8"),
+            usedforsecurity=False,
+        ).hexdigest()
+
+    def _get_cached_preview(self, digest, filetype, get_preview):
+        """
+        Returns a preview from the cache, or from `get_preview` if it isn’t cached yet.
+
+        The digest is also used as the preview’s ETag. If the browser already has this preview we return
+        `304 Not Modified` without looking it up at all. Browsers must still check with us before using a preview
+        they’ve kept, because previews of uploaded letters contain people’s names and addresses.
+
+        Only PNG pages are kept in Redis. Whole PDFs, and any page bigger than `PREVIEW_CACHE_MAX_SIZE_IN_BYTES`,
+        are fetched from template preview every time.
+        """
+        headers = {
+            "Content-Type": self.PREVIEW_MIMETYPES[filetype],
+            "ETag": f'"{digest}"',
+            "Cache-Control": "private, no-cache",
+        }.items()
+
+        if has_request_context() and digest in request.if_none_match:
+            return b"", 304, headers
+
+        cache_key = f"letter-preview-{digest}"
+        if filetype == "png" and (cached_preview := redis_client.get(cache_key)):
+            return cached_preview, 200, headers
+
+        content, status_code, preview_headers = get_preview()
+        if status_code != 200:
+            return content, status_code, preview_headers
+
+        if filetype == "png" and len(content) <= self.PREVIEW_CACHE_MAX_SIZE_IN_BYTES:
+            redis_client.set(cache_key, content, ex=self.PREVIEW_CACHE_TTL_IN_SECONDS)
+        return content, status_code, headers
+
+    def _post(self, *args, **kwargs):
+        with backend_call("template-preview"):
+            return self.requests_session.post(*args, **kwargs)
+
     def _get_outbound_headers(self):
         headers = {"Authorization": f"Token {self.api_key}"}
         if has_request_context() and hasattr(request, "get_onwards_request_headers"):
@@ -55,46 +107,76 @@ class TemplatePreviewClient:
             "values": values,
             "filename": branding_filename or (service.letter_branding.filename if service else None),
         }
-        response = self.requests_session.post(
-            "{}/preview.{}{}".format(
-                self.api_host,
-                filetype,
-                f"?page={page}" if page else "",
-            ),
-            json=data,
-            headers=self._get_outbound_headers(),
-        )
-        return response.content, response.status_code, self.get_allowed_headers(response.headers)
-
-    def get_png_for_valid_pdf_page(self, pdf_file, page):
-        pdf_page = extract_page_from_pdf(BytesIO(pdf_file), int(page) - 1)
 
-        response = self.requests_session.post(
-            "{}/precompiled-preview.png{}".format(self.api_host, "?hide_notify=true" if page == "1" else ""),
-            data=base64.b64encode(pdf_page).decode("utf-8"),
-            headers=self._get_outbound_headers(),
+        def get_preview():
+            response = self._post(
+                "{}/preview.{}{}".format(
+                    self.api_host,
+                    filetype,
+                    f"?page={page}" if page else "",
+                ),
+                json=data,
+                headers=self._get_outbound_headers(),
+            )
+            return response.content, response.status_code, self.get_allowed_headers(response.headers)
+
+        return self._get_cached_preview(
+            self._get_preview_digest("preview", filetype, page, data),
+            filetype,
+            get_preview,
         )
-        return response.content, response.status_code, self.get_allowed_headers(response.headers)
 
-    def get_png_for_invalid_pdf_page(self, pdf_file, page, is_an_attachment=False):
-        pdf_page = extract_page_from_pdf(BytesIO(pdf_file), int(page) - 1)
+    @staticmethod
+    def _get_pdf_page(pdf_file, page, page_already_extracted):
+        if page_already_extracted:
+            return pdf_file
+        return extract_page_from_pdf(BytesIO(pdf_file), int(page) - 1)
+
+    def get_png_for_valid_pdf_page(self, pdf_file, page, page_already_extracted=False):
+        def get_preview():
+            pdf_page = self._get_pdf_page(pdf_file, page, page_already_extracted)
+
+            response = self._post(
+                "{}/precompiled-preview.png{}".format(self.api_host, "?hide_notify=true" if page == "1" else ""),
+                data=base64.b64encode(pdf_page).decode("utf-8"),
+                headers=self._get_outbound_headers(),
+            )
+            return response.content, response.status_code, self.get_allowed_headers(response.headers)
+
+        return self._get_cached_preview(
+            self._get_preview_digest("precompiled-preview", page, hashlib.sha256(pdf_file).hexdigest()),
+            "png",
+            get_preview,
+        )
 
-        response = self.requests_session.post(
-            "{}/precompiled/overlay.png{}".format(
-                self.api_host,
-                f"?page_number={page}&is_an_attachment={is_an_attachment}",
+    def get_png_for_invalid_pdf_page(self, pdf_file, page, is_an_attachment=False, page_already_extracted=False):
+        def get_preview():
+            pdf_page = self._get_pdf_page(pdf_file, page, page_already_extracted)
+
+            response = self._post(
+                "{}/precompiled/overlay.png{}".format(
+                    self.api_host,
+                    f"?page_number={page}&is_an_attachment={is_an_attachment}",
+                ),
+                data=pdf_page,
+                headers=self._get_outbound_headers(),
+            )
+            return response.content, response.status_code, self.get_allowed_headers(response.headers)
+
+        return self._get_cached_preview(
+            self._get_preview_digest(
+                "precompiled-overlay", page, is_an_attachment, hashlib.sha256(pdf_file).hexdigest()
             ),
-            data=pdf_page,
-            headers=self._get_outbound_headers(),
+            "png",
+            get_preview,
         )
-        return response.content, response.status_code, self.get_allowed_headers(response.headers)
 
     def get_png_for_letter_attachment_page(self, attachment_id, service, page=None):
         data = {
             "letter_attachment_id": attachment_id,
             "service_id": service.id,
         }
-        response = self.requests_session.post(
+        response = self._post(
             "{}/letter_attachment_preview.png{}".format(
                 self.api_host,
                 f"?page={page}" if page else "",
@@ -118,7 +200,7 @@ class TemplatePreviewClient:
             "values": values,
             "filename": service.letter_branding.filename,
         }
-        response = self.requests_session.post(
+        response = self._post(
             f"{self.api_host}/get-page-count",
             json=data,
             headers=self._get_outbound_headers(),
@@ -136,7 +218,7 @@ class TemplatePreviewClient:
         )
         if is_an_attachment:
             url = url + "&is_an_attachment=true"
-        return self.requests_session.post(
+        return self._post(
             url,
             data=pdf_file,
             headers=self._get_outbound_headers(),
@@ -173,3 +173,13 @@ def format_provider(provider):
 
 def get_sha512_hashed(str):
     return hashlib.sha512(str.encode()).hexdigest()
+
+
+def group_by_key(items, key):
+    """
+    Groups a list of dicts into lists keyed by the value of `key` in each one, preserving their original order
+    """
+    groups = {}
+    for item in items:
+        groups.setdefault(item.get(key), []).append(item)
+    return groups
@@ -1,48 +1,173 @@
+import csv
+from array import array
+from io import StringIO
+from itertools import islice
+
+from flask import current_app
 from notifications_python_client.errors import HTTPError
+from notifications_utils.formatters import strip_and_remove_obscure_whitespace
+from notifications_utils.insensitive_dict import InsensitiveDict
 from notifications_utils.recipients import RecipientCSV
+from werkzeug.utils import cached_property
 
 from app.formatters import recipient_count
 from app.models.notification import NotificationsForCSV
-from app.models.spreadsheet import Spreadsheet
+from app.models.spreadsheet import Spreadsheet  # noqa: F401
 from app.utils.templates import get_sample_template
 
 
-def get_errors_for_csv(recipients, template_type):
-    errors = []
+class RowErrors:
+    """
+    Works out which rows of a RecipientCSV have errors in a single pass over
+    the rows, counting the rows with each kind of error and keeping the rows
+    we’ll show to the user.
+    """
 
-    if any(recipients.rows_with_bad_recipients):
-        number_of_bad_recipients = len(list(recipients.rows_with_bad_recipients))
-        errors.append(f"fix {recipient_count(number_of_bad_recipients, template_type)}")
+    CATEGORIES = (
+        "has_bad_recipient",
+        "has_missing_data",
+        "message_too_long",
+        "message_empty",
+        "qr_code_too_long",
+    )
 
-    if any(recipients.rows_with_missing_data):
-        number_of_rows_with_missing_data = len(list(recipients.rows_with_missing_data))
-        if 1 == number_of_rows_with_missing_data:
-            errors.append("enter missing data in 1 row")
-        else:
-            errors.append(f"enter missing data in {number_of_rows_with_missing_data} rows")
+    def __init__(self, recipients):
+        self.counts = dict.fromkeys(self.CATEGORIES, 0)
+        rows_with_errors = []
 
-    if any(recipients.rows_with_message_too_long):
-        number_of_rows_with_message_too_long = len(list(recipients.rows_with_message_too_long))
-        if 1 == number_of_rows_with_message_too_long:
-            errors.append("shorten the message in 1 row")
-        else:
-            errors.append(f"shorten the messages in {number_of_rows_with_message_too_long} rows")
+        for row in recipients.rows:
+            # Rows past `max_rows` are `None`, and RecipientCSV leaves them out in the same way
+            if not row:
+                continue
+            for category in self.CATEGORIES:
+                if getattr(row, category):
+                    self.counts[category] += 1
+            if row.has_error and len(rows_with_errors) < recipients.max_errors_shown:
+                rows_with_errors.append(row)
 
-    if any(recipients.rows_with_empty_message):
-        number_of_rows_with_empty_message = len(list(recipients.rows_with_empty_message))
-        if 1 == number_of_rows_with_empty_message:
-            errors.append("check you have content for the empty message in 1 row")
+        # Matches RecipientCSV.displayed_rows without going through the rows again
+        if rows_with_errors and not recipients.missing_column_headers:
+            self.displayed_rows = rows_with_errors
         else:
-            errors.append(f"check you have content for the empty messages in {number_of_rows_with_empty_message} rows")
+            self.displayed_rows = list(recipients.initial_rows)
 
-    if any(recipients.rows_with_bad_qr_codes):
-        number_of_rows_with_bad_qr_codes = len(list(recipients.rows_with_bad_qr_codes))
-        if 1 == number_of_rows_with_bad_qr_codes:
-            errors.append("enter fewer characters for the QR code links in 1 row")
-        else:
-            errors.append(f"enter fewer characters for the QR code links in {number_of_rows_with_bad_qr_codes} rows")
+    def get_messages(self, template_type):
+        errors = []
+
+        if number_of_bad_recipients := self.counts["has_bad_recipient"]:
+            errors.append(f"fix {recipient_count(number_of_bad_recipients, template_type)}")
+
+        if number_of_rows_with_missing_data := self.counts["has_missing_data"]:
+            if 1 == number_of_rows_with_missing_data:
+                errors.append("enter missing data in 1 row")
+            else:
+                errors.append(f"enter missing data in {number_of_rows_with_missing_data} rows")
+
+        if number_of_rows_with_message_too_long := self.counts["message_too_long"]:
+            if 1 == number_of_rows_with_message_too_long:
+                errors.append("shorten the message in 1 row")
+            else:
+                errors.append(f"shorten the messages in {number_of_rows_with_message_too_long} rows")
+
+        if number_of_rows_with_empty_message := self.counts["message_empty"]:
+            if 1 == number_of_rows_with_empty_message:
+                errors.append("check you have content for the empty message in 1 row")
+            else:
+                errors.append(
+                    f"check you have content for the empty messages in {number_of_rows_with_empty_message} rows"
+                )
+
+        if number_of_rows_with_bad_qr_codes := self.counts["qr_code_too_long"]:
+            if 1 == number_of_rows_with_bad_qr_codes:
+                errors.append("enter fewer characters for the QR code links in 1 row")
+            else:
+                errors.append(
+                    f"enter fewer characters for the QR code links in {number_of_rows_with_bad_qr_codes} rows"
+                )
+
+        return errors
+
+
+def get_errors_for_csv(recipients, template_type):
+    return RowErrors(recipients).get_messages(template_type)
+
+
+class StreamingCSVWriter:
+    """
+    Writes rows to a single reusable buffer, and hands back everything written
+    since the last chunk. This means a large CSV can be streamed a page at a
+    time without creating a new buffer and writer for every row.
+    """
+
+    def __init__(self):
+        self._buffer = StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def writerows(self, rows):
+        self._writer.writerows(rows)
+
+    def get_chunk(self):
+        chunk = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return chunk
 
-    return errors
+
+class OriginalUploadRows:
+    """
+    Looks up the values from an uploaded spreadsheet by row, without parsing
+    and validating every row into a RecipientCSV up front.
+
+    The file is read once to record where each row starts, then each row is
+    only parsed when it’s asked for. Rows are numbered and cleaned up the same
+    way as RecipientCSV, so they match the row numbers of a job’s notifications.
+    """
+
+    def __init__(self, file_contents, template_type):
+        recipients = RecipientCSV(file_contents, template=get_sample_template(template_type))
+        self._file_data = recipients.file_data
+        self.column_headers = recipients.column_headers
+
+        raw_column_headers = next(self._reader(self._file_data), [])
+        # Like RecipientCSV, the last of any repeated column wins
+        column_indexes = {InsensitiveDict.make_key(header): index for index, header in enumerate(raw_column_headers)}
+        self._column_indexes = [column_indexes[InsensitiveDict.make_key(header)] for header in self.column_headers]
+
+    @staticmethod
+    def _reader(lines):
+        return csv.reader(StringIO(lines) if isinstance(lines, str) else lines, skipinitialspace=True)
+
+    @cached_property
+    def _row_offsets(self):
+        position = 0
+
+        def lines():
+            nonlocal position
+            for line in StringIO(self._file_data):
+                position += len(line)
+                yield line
+
+        rows = self._reader(lines())
+        next(rows, None)  # skip the header row
+
+        offsets = array("q", [position])
+        for _row in rows:
+            offsets.append(position)
+        return offsets
+
+    def __len__(self):
+        return len(self._row_offsets) - 1
+
+    def __getitem__(self, index):
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+
+        row = next(self._reader(self._file_data[self._row_offsets[index] : self._row_offsets[index + 1]]), [])
+
+        return [
+            (strip_and_remove_obscure_whitespace(row[column_index]) or None) if column_index < len(row) else None
+            for column_index in self._column_indexes
+        ]
 
 
 def generate_notifications_csv(**kwargs):
@@ -52,10 +177,9 @@ def generate_notifications_csv(**kwargs):
         kwargs["page"] = 1
 
     if kwargs.get("job_id"):
-        original_file_contents = s3download(kwargs["service_id"], kwargs["job_id"])
-        original_upload = RecipientCSV(
-            original_file_contents,
-            template=get_sample_template(kwargs["template_type"]),
+        original_upload = OriginalUploadRows(
+            s3download(kwargs["service_id"], kwargs["job_id"]),
+            kwargs["template_type"],
         )
         original_column_headers = original_upload.column_headers
         fieldnames = ["Row number"] + original_column_headers + ["Template", "Type", "Job", "Status", "Time"]
@@ -75,6 +199,8 @@ def generate_notifications_csv(**kwargs):
 
     yield ",".join(fieldnames) + "\n"
 
+    writer = StreamingCSVWriter()
+
     while True:
         try:
             notifications_batch = NotificationsForCSV(**kwargs)
@@ -91,10 +217,7 @@ def generate_notifications_csv(**kwargs):
                     [
                         notification.row_number,
                     ]
-                    + [
-                        original_upload[notification.row_number - 1].get(header).data
-                        for header in original_column_headers
-                    ]
+                    + original_upload[notification.row_number - 1]
                     + [
                         notification.template_name,
                         notification.template_type,
@@ -117,7 +240,10 @@ def generate_notifications_csv(**kwargs):
                     notification.created_at,
                     notification.api_key_name or "",
                 ]
-            yield Spreadsheet.from_rows([map(str, values)]).as_csv_data
+            writer.writerows([map(str, values)])
+
+        if chunk := writer.get_chunk():
+            yield chunk
 
         if len(notifications_batch) == kwargs["page_size"]:
             kwargs["page"] += 1
@@ -125,3 +251,26 @@ def generate_notifications_csv(**kwargs):
         else:
             return
     raise Exception("Should never reach here")
+
+
+def stream_notifications_csv(**kwargs):
+    """
+    Returns the chunks of `generate_notifications_csv` for a streamed response.
+
+    The first page of notifications is fetched before the response starts, so if the API fails straight away the
+    user gets the usual error page rather than an empty file. A failure after that can only cut the file short, so
+    it’s logged.
+    """
+    chunks = generate_notifications_csv(**kwargs)
+    # The column headers, then the first page
+    first_chunks = list(islice(chunks, 2))
+
+    def generate():
+        yield from first_chunks
+        try:
+            yield from chunks
+        except Exception:
+            current_app.logger.exception("Error generating notifications CSV, so the file sent was incomplete")
+            raise
+
+    return generate()
@@ -1,7 +1,7 @@
 import copy
 from abc import ABC, abstractmethod
 
-from flask import render_template_string
+from flask import current_app
 from markupsafe import Markup
 
 from app.utils import merge_jsonlike
@@ -96,45 +96,40 @@ class GovukFrontendWidgetMixin(ABC):
         return render_govuk_frontend_macro(self.govuk_frontend_component_name, params)
 
 
-def render_govuk_frontend_macro(component, params):
+GOVUK_FRONTEND_COMPONENTS = {
+    "radios": {"path": "govuk_frontend_jinja/components/radios/macro.html", "macro": "govukRadios"},
+    "radios-with-images": {
+        "path": "govuk_frontend_jinja_overrides/templates/components/radios-with-images/macro.html",
+        "macro": "govukRadiosWithImages",
+    },
+    "nested-radios": {
+        "path": "govuk_frontend_jinja_overrides/templates/components/nested-radios/macro.html",
+        "macro": "govukNestedRadios",
+    },
+    "text-input": {"path": "govuk_frontend_jinja/components/input/macro.html", "macro": "govukInput"},
+    "textarea": {"path": "govuk_frontend_jinja/components/textarea/macro.html", "macro": "govukTextarea"},
+    "checkbox": {
+        "path": "govuk_frontend_jinja_overrides/templates/components/checkboxes/macro.html",
+        "macro": "govukCheckboxes",
+    },
+}
+
+
+def get_govuk_frontend_macro(component):
     """
-    jinja needs a template to render but govuk_frontend_jinja only provides macros
-
-    This function creates a template string that just calls the macro for `component` and returns the result.
+    Returns the macro for `component` (a key in `GOVUK_FRONTEND_COMPONENTS`) so it can be called directly from Python.
 
-    ```
-    {%- from <path> import <macro> -%}
+    The Jinja environment compiles each macro file once and caches it (recompiling it if it changes and templates are
+    being auto-reloaded), and each compiled template keeps the module holding its macros. So this doesn’t compile
+    anything after the first time a component is used, however many fields are rendered.
+    """
+    component = GOVUK_FRONTEND_COMPONENTS[component]
+    return getattr(current_app.jinja_env.get_template(component["path"]).module, component["macro"])
 
-    {{ macro(params) }}
-    ```
 
-    This function dynamically fills in the path and macro based on the GOVUK_FRONTEND_MACROS dictionary.
-    Then we render that template with any params to produce just the output of that macro.
+def render_govuk_frontend_macro(component, params):
     """
-    govuk_frontend_components = {
-        "radios": {"path": "govuk_frontend_jinja/components/radios/macro.html", "macro": "govukRadios"},
-        "radios-with-images": {
-            "path": "govuk_frontend_jinja_overrides/templates/components/radios-with-images/macro.html",
-            "macro": "govukRadiosWithImages",
-        },
-        "nested-radios": {
-            "path": "govuk_frontend_jinja_overrides/templates/components/nested-radios/macro.html",
-            "macro": "govukNestedRadios",
-        },
-        "text-input": {"path": "govuk_frontend_jinja/components/input/macro.html", "macro": "govukInput"},
-        "textarea": {"path": "govuk_frontend_jinja/components/textarea/macro.html", "macro": "govukTextarea"},
-        "checkbox": {
-            "path": "govuk_frontend_jinja_overrides/templates/components/checkboxes/macro.html",
-            "macro": "govukCheckboxes",
-        },
-    }
-
-    # we need to duplicate all curly braces to escape them from the f string so jinja still sees them
-    template_string = f"""
-        {{%- from '{govuk_frontend_components[component]["path"]}'
-        import {govuk_frontend_components[component]["macro"]} -%}}
-
-        {{{{ {govuk_frontend_components[component]["macro"]}(params) }}}}
+    Renders the GOV.UK Frontend macro for `component` with `params`, the same as `{{ macro(params) }}` would in a
+    template.
     """
-
-    return Markup(render_template_string(template_string, params=params))
+    return Markup(get_govuk_frontend_macro(component)(params))
@@ -0,0 +1,99 @@
+from http.cookiejar import DefaultCookiePolicy
+from time import monotonic
+
+import requests
+from gds_metrics.metrics import Counter, Histogram
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+HTTP_POOL_WAIT_DURATION_SECONDS = Histogram(
+    "http_pool_wait_duration_seconds",
+    "Time spent waiting for a connection from the pool for outbound HTTP requests",
+    ["host"],
+)
+HTTP_POOL_CONNECTIONS_REQUESTED = Counter(
+    "http_pool_connections_requested_total",
+    "Number of connections taken from the pool for outbound HTTP requests",
+    ["host"],
+)
+HTTP_POOL_CONNECTIONS_CREATED = Counter(
+    "http_pool_connections_created_total",
+    "Number of new connections opened for outbound HTTP requests (the rest reused a kept-alive connection)",
+    ["host"],
+)
+
+
+class _InstrumentedPoolMixin:
+    def _get_conn(self, timeout=None):
+        start = monotonic()
+        try:
+            return super()._get_conn(timeout=timeout)
+        finally:
+            HTTP_POOL_WAIT_DURATION_SECONDS.labels(host=self.host).observe(monotonic() - start)
+            HTTP_POOL_CONNECTIONS_REQUESTED.labels(host=self.host).inc()
+
+    def _new_conn(self):
+        HTTP_POOL_CONNECTIONS_CREATED.labels(host=self.host).inc()
+        return super()._new_conn()
+
+
+class InstrumentedHTTPConnectionPool(_InstrumentedPoolMixin, HTTPConnectionPool):
+    pass
+
+
+class InstrumentedHTTPSConnectionPool(_InstrumentedPoolMixin, HTTPSConnectionPool):
+    pass
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter which can record how long requests wait for a connection, and how often connections are reused
+    """
+
+    def __init__(self, *args, record_pool_stats=False, **kwargs):
+        self.record_pool_stats = record_pool_stats
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        if self.record_pool_stats:
+            self.poolmanager.pool_classes_by_scheme = {
+                "http": InstrumentedHTTPConnectionPool,
+                "https": InstrumentedHTTPSConnectionPool,
+            }
+
+
+def get_http_session(app):
+    """
+    Returns a `requests.Session` shared by every outbound API client in this process.
+
+    API clients are created once per request context, so giving each one its own session would mean opening a
+    new connection for almost every request. Sharing one session lets connections to the API be kept alive and
+    reused between requests, up to `HTTP_POOL_MAXSIZE` connections per host.
+
+    The session only shares connections. It doesn’t keep any cookies, because they would otherwise be sent on
+    every request made by this process, whichever user it was for.
+    """
+    if "http_session" not in app.extensions:
+        adapter = PooledHTTPAdapter(
+            pool_connections=app.config["HTTP_POOL_CONNECTIONS"],
+            pool_maxsize=app.config["HTTP_POOL_MAXSIZE"],
+            pool_block=app.config["HTTP_POOL_BLOCK"],
+            max_retries=Retry(
+                total=app.config["HTTP_MAX_RETRIES"],
+                backoff_factor=app.config["HTTP_RETRY_BACKOFF_FACTOR"],
+                status_forcelist=(502, 503, 504),
+                # Only idempotent methods (not POST) are retried
+                allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+                raise_on_status=False,
+            ),
+            record_pool_stats=app.config["HTTP_POOL_STATS_ENABLED"],
+        )
+        session = requests.Session()
+        # A policy which allows no domains at all, so cookies set by a response are never stored
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        app.extensions["http_session"] = session
+    return app.extensions["http_session"]
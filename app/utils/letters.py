@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta
+from io import BytesIO
 
 import pytz
 from dateutil import parser
@@ -12,6 +13,7 @@ from notifications_utils.timezones import (
     convert_utc_to_bst,
     utc_string_to_aware_gmt_datetime,
 )
+from pypdf import PdfReader, PdfWriter
 
 
 def printing_today_or_tomorrow(created_at):
@@ -213,3 +215,17 @@ def get_error_from_upload_form(form_errors):
     error["detail"] = form_errors
 
     return error
+
+
+def split_pdf_into_pages(pdf_file):
+    """
+    Splits a PDF into a list of single page PDFs, parsing the document only once
+    """
+    pages = []
+    for page in PdfReader(BytesIO(pdf_file)).pages:
+        writer = PdfWriter()
+        writer.add_page(page)
+        buffer = BytesIO()
+        writer.write(buffer)
+        pages.append(buffer.getvalue())
+    return pages
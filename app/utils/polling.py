@@ -0,0 +1,62 @@
+import hashlib
+import json
+from datetime import UTC, datetime
+
+from flask import current_app, jsonify, request
+from notifications_utils.serialised_model import SerialisedModel, SerialisedModelCollection
+
+POLL_INTERVAL_IN_SECONDS = 2
+IDLE_POLL_INTERVAL_IN_SECONDS = 10
+FINISHED_POLL_INTERVAL_IN_SECONDS = 30
+
+
+def _serialise(obj):
+    if isinstance(obj, SerialisedModelCollection):
+        return obj.items
+    if isinstance(obj, SerialisedModel):
+        return obj._dict
+    return str(obj)
+
+
+def get_fingerprint(*data):
+    """
+    Returns a short, stable hash of the API data a set of partials is rendered from.
+
+    The current minute is part of the hash, so partials which show relative times (‘2 minutes ago’) are still
+    re-rendered as time passes, even if the data itself hasn’t changed.
+    """
+    return hashlib.sha256(
+        json.dumps(
+            [datetime.now(UTC).strftime("%Y-%m-%dT%H:%M"), *data],
+            sort_keys=True,
+            default=_serialise,
+        ).encode()
+    ).hexdigest()[:32]
+
+
+def get_poll_interval(*, unchanged=False, finished=False):
+    if finished:
+        return FINISHED_POLL_INTERVAL_IN_SECONDS
+    if unchanged:
+        return IDLE_POLL_INTERVAL_IN_SECONDS
+    return POLL_INTERVAL_IN_SECONDS
+
+
+def json_updates_response(fingerprint, get_partials, *, finished=False):
+    """
+    Returns the partials from `get_partials` as JSON, unless the browser already has the version matching
+    `fingerprint`, in which case it gets an empty `304 Not Modified` without anything being rendered.
+
+    The `X-Poll-Interval` header (in milliseconds) tells the browser how long to wait before asking again. Pages
+    which haven’t changed since the last poll, or which won’t change much more (`finished`), are polled less often.
+    """
+    unchanged = request.if_none_match.contains(fingerprint)
+
+    if unchanged:
+        response = current_app.response_class(status=304)
+    else:
+        response = jsonify(**get_partials())
+
+    response.set_etag(fingerprint)
+    response.headers["X-Poll-Interval"] = str(get_poll_interval(unchanged=unchanged, finished=finished) * 1000)
+    return response
@@ -157,8 +157,9 @@ class TemplatedLetterImageTemplate(BaseLetterImageTemplate):
             )
             return self._all_page_counts
 
-        cache_key = (
-            f"service-{self.get_raw('service')}-template-{self.id}-version-{self.get_raw('version')}-all-page-counts"
+        cache_key = cache.get_generation_scoped_key(
+            f"service-{self.get_raw('service')}-template-{self.id}-version-{self.get_raw('version')}-all-page-counts",
+            f"service-{self.get_raw('service')}-template-generation",
         )
         if cached_value := redis_client.get(cache_key):
             self._all_page_counts = json.loads(cached_value)
@@ -170,6 +171,10 @@ class TemplatedLetterImageTemplate(BaseLetterImageTemplate):
             values=self.values,
         )
         redis_client.set(cache_key, json.dumps(self._all_page_counts), ex=cache.DEFAULT_TTL)
+        cache.add_to_groups(
+            "service-{service_id}-template-{template_id}-version-{version}-all-page-counts",
+            cache_key,
+        )
 
         return self._all_page_counts
 
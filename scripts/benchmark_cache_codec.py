@@ -0,0 +1,105 @@
+"""
+Compares how many bytes cached template lists take up in Redis, and how long they take to read back, as plain JSON
+and compressed by the request cache’s codec. If Redis is enabled, also times reading each value from Redis.
+
+Run from the root of the repo:
+
+    python -m scripts.benchmark_cache_codec --number-of-templates 1000 --number-of-templates 5000
+"""
+
+import argparse
+import timeit
+import uuid
+
+from flask import Flask
+
+from app import create_app
+from app.extensions import redis_client
+from app.notify_client import JSONCacheCodec
+
+
+def make_template_list(number_of_templates):
+    return {
+        "data": [
+            {
+                "id": str(uuid.UUID(int=index)),
+                "name": f"Appointment reminder {index}",
+                "template_type": ("email", "sms", "letter")[index % 3],
+                "subject": "Your appointment on ((date))",
+                "content": "Dear ((name)),\n\nYour appointment on ((date)) at ((time)) is confirmed. " * 8,
+                "folder": str(uuid.UUID(int=index // 20)),
+                "created_at": "2024-01-01T12:00:00.000000Z",
+                "updated_at": None,
+                "version": 3,
+                "archived": False,
+                "hidden": False,
+                "is_precompiled_letter": False,
+                "postage": "second" if index % 3 == 2 else None,
+                "process_type": "normal",
+                "redact_personalisation": False,
+                "reply_to": None,
+                "reply_to_text": None,
+                "service": str(uuid.UUID(int=0)),
+                "created_by": str(uuid.UUID(int=1)),
+                "letter_attachment": None,
+                "letter_languages": "english" if index % 3 == 2 else None,
+            }
+            for index in range(number_of_templates)
+        ]
+    }
+
+
+def time_in_milliseconds(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def benchmark_cache_codec(sizes, *, repeat):
+    plain_codec = JSONCacheCodec(compress_above_bytes=None)
+    compressing_codec = JSONCacheCodec(compress=True)
+
+    for number_of_templates in sizes:
+        value = make_template_list(number_of_templates)
+        as_json = plain_codec.encode(value)
+        encoded = compressing_codec.encode(value)
+        row = {
+            "number_of_templates": number_of_templates,
+            "json_bytes": len(as_json.encode("utf-8")),
+            "encoded_bytes": len(encoded.encode("utf-8") if isinstance(encoded, str) else encoded),
+            "json_decode_ms": time_in_milliseconds(lambda as_json=as_json: plain_codec.decode(as_json), repeat),
+            "decode_ms": time_in_milliseconds(lambda encoded=encoded: compressing_codec.decode(encoded), repeat),
+        }
+        if redis_client.active:
+            key = f"benchmark-cache-codec-{uuid.uuid4()}"
+            try:
+                for name, serialised in (("json_redis_get_ms", as_json), ("redis_get_ms", encoded)):
+                    redis_client.redis_store.set(key, serialised, ex=60)
+                    row[name] = time_in_milliseconds(lambda key=key: redis_client.redis_store.get(key), repeat)
+            finally:
+                redis_client.redis_store.delete(key)
+        yield row
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number-of-templates", "-n", action="append", type=int)
+    parser.add_argument("--repeat", type=int, default=20, help="Number of times to time each decode and Redis GET")
+    args = parser.parse_args()
+
+    application = Flask("app")
+    create_app(application)
+
+    with application.app_context():
+        for row in benchmark_cache_codec(args.number_of_templates or (10, 100, 1_000, 5_000), repeat=args.repeat):
+            print(  # noqa: T201
+                "{number_of_templates:>6} templates: "
+                "{json_bytes:>10,} bytes as JSON, {encoded_bytes:>10,} bytes compressed; "
+                "decode {json_decode_ms:.2f}ms as JSON, {decode_ms:.2f}ms compressed"
+                "{redis_timings}".format(
+                    **row,
+                    redis_timings=(
+                        f"; Redis GET {row['json_redis_get_ms']:.2f}ms as JSON, {row['redis_get_ms']:.2f}ms compressed"
+                        if "redis_get_ms" in row
+                        else ""
+                    ),
+                )
+            )
@@ -0,0 +1,81 @@
+"""
+Times rendering the forms with the most options: choosing templates and a folder to move them to, and choosing which
+folders a team member can see.
+
+Run from the root of the repo:
+
+    python -m scripts.benchmark_form_rendering --number-of-folders 100 --number-of-folders 1000
+"""
+
+import argparse
+import timeit
+import uuid
+from types import SimpleNamespace
+
+from flask import Flask
+
+from app import create_app
+
+
+def make_template_folders(number_of_folders, *, children_per_folder=4):
+    return [
+        {
+            "id": str(uuid.UUID(int=index + 1)),
+            "name": f"Folder {index}",
+            "parent_id": (str(uuid.UUID(int=index // children_per_folder)) if index >= children_per_folder else None),
+        }
+        for index in range(number_of_folders)
+    ]
+
+
+def time_in_milliseconds(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def benchmark_form_rendering(application, sizes, *, repeat):
+    from app.main.overrides_nl.forms import PermissionsForm, TemplateAndFoldersSelectionForm
+
+    for number_of_folders in sizes:
+        folders = make_template_folders(number_of_folders)
+        template_list = [SimpleNamespace(id=folder["id"], name=folder["name"]) for folder in folders] + [
+            SimpleNamespace(id=str(uuid.uuid4()), name=f"Template {index}") for index in range(number_of_folders)
+        ]
+
+        with application.test_request_context():
+
+            def render_templates_and_folders_form(folders=folders, template_list=template_list):
+                form = TemplateAndFoldersSelectionForm(
+                    all_template_folders=folders,
+                    template_list=template_list,
+                    available_template_types=("email", "sms", "letter"),
+                    allow_adding_copy_of_template=True,
+                    option_hints={},
+                )
+                return form.templates_and_folders() + form.move_to()
+
+            def render_permissions_form(folders=folders):
+                return PermissionsForm(all_template_folders=folders).folder_permissions()
+
+            yield (
+                number_of_folders,
+                time_in_milliseconds(render_templates_and_folders_form, repeat),
+                time_in_milliseconds(render_permissions_form, repeat),
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number-of-folders", "-n", action="append", type=int)
+    parser.add_argument("--repeat", type=int, default=5, help="Number of times to time rendering each form")
+    args = parser.parse_args()
+
+    application = Flask("app")
+    create_app(application)
+
+    for number_of_folders, templates_and_folders_ms, permissions_ms in benchmark_form_rendering(
+        application, args.number_of_folders or (10, 100, 1_000), repeat=args.repeat
+    ):
+        print(  # noqa: T201
+            f"{number_of_folders:>6} folders: "
+            f"move templates {templates_and_folders_ms:.1f}ms, folder permissions {permissions_ms:.1f}ms"
+        )
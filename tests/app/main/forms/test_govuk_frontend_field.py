@@ -1,9 +1,16 @@
 from unittest.mock import ANY
 
+import pytest
+from flask import render_template_string
 from flask_wtf import FlaskForm as Form
 from wtforms import StringField
 
-from app.utils.govuk_frontend_field import GovukFrontendWidgetMixin
+from app.utils.govuk_frontend_field import (
+    GOVUK_FRONTEND_COMPONENTS,
+    GovukFrontendWidgetMixin,
+    get_govuk_frontend_macro,
+    render_govuk_frontend_macro,
+)
 
 
 def test_govuk_frontend_widget_mixin_separates_params_properly(client_request):
@@ -83,3 +90,31 @@ def test_govuk_frontend_widget_mixin_constructs_errors(client_request):
     assert ret == {
         "html": "some error message",
     }
+
+
+@pytest.mark.parametrize("component", GOVUK_FRONTEND_COMPONENTS)
+def test_get_govuk_frontend_macro_only_compiles_each_component_once(notify_admin, mocker, component):
+    with notify_admin.test_request_context():
+        macro = get_govuk_frontend_macro(component)
+        mock_compile = mocker.spy(notify_admin.jinja_env, "compile")
+
+        assert get_govuk_frontend_macro(component) is macro
+        assert mock_compile.called is False
+
+
+def test_render_govuk_frontend_macro_matches_calling_macro_in_template(notify_admin):
+    params = {
+        "name": "folder",
+        "items": [{"value": "1", "text": "Folder <1>"}, {"value": "2", "text": "Folder 2", "checked": True}],
+    }
+
+    with notify_admin.test_request_context():
+        rendered = render_govuk_frontend_macro("radios", params)
+        expected = render_template_string(
+            "{%- from 'govuk_frontend_jinja/components/radios/macro.html' import govukRadios -%}"
+            "{{ govukRadios(params) }}",
+            params=params,
+        )
+
+    assert rendered == expected
+    assert "Folder &lt;1&gt;" in rendered
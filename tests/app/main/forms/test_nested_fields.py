@@ -0,0 +1,62 @@
+import timeit
+
+import pytest
+
+from app.main.overrides_nl.forms import PermissionsForm, TemplateAndFoldersSelectionForm
+
+
+def _make_folders(number_of_folders, children_per_folder=4):
+    # A tree where the first `children_per_folder` folders are at the top level, and each folder after that is in the
+    # folder `children_per_folder` places before it divided by `children_per_folder`
+    return [
+        {
+            "id": f"folder-{index}",
+            "name": f"Folder {index}",
+            "parent_id": f"folder-{index // children_per_folder - 1}" if index >= children_per_folder else None,
+        }
+        for index in range(number_of_folders)
+    ]
+
+
+def _get_move_to_field(folders):
+    return TemplateAndFoldersSelectionForm(
+        all_template_folders=folders,
+        template_list=[],
+        available_template_types=["email"],
+        allow_adding_copy_of_template=False,
+        option_hints={},
+    ).move_to
+
+
+def test_nested_radios_children(client_request):
+    children = _get_move_to_field(_make_folders(7, children_per_folder=2)).children()
+
+    assert {key: [option.data for option in options] for key, options in children.items()} == {
+        None: ["__NONE__"],
+        "__NONE__": ["folder-0", "folder-1"],
+        "folder-0": ["folder-2", "folder-3"],
+        "folder-1": ["folder-4", "folder-5"],
+        "folder-2": ["folder-6"],
+        "folder-3": [],
+        "folder-4": [],
+        "folder-5": [],
+        "folder-6": [],
+    }
+
+
+def test_nested_checkboxes_children(client_request):
+    form = PermissionsForm(all_template_folders=_make_folders(3, children_per_folder=2))
+    children = form.folder_permissions.children()
+
+    assert [option.data for option in children[None]] == ["folder-0", "folder-1"]
+    assert [option.data for option in children["folder-0"]] == ["folder-2"]
+
+
+@pytest.mark.parametrize("get_field", (_get_move_to_field, lambda folders: PermissionsForm(folders).folder_permissions))
+def test_nested_field_children_scales_linearly_with_number_of_folders(client_request, get_field):
+    def time_children(number_of_folders):
+        field = get_field(_make_folders(number_of_folders))
+        return min(timeit.repeat(field.children, number=1, repeat=3))
+
+    # Four times as many folders would take sixteen times as long if every option was compared with every folder
+    assert time_children(4_000) < time_children(1_000) * 8
@@ -3,10 +3,14 @@ from io import BytesIO
 
 import pytest
 import requests
-from flask import Response, current_app, g, url_for
+from flask import Response, current_app, g, request, url_for
 from flask_wtf.csrf import CSRFError
 from notifications_python_client.errors import HTTPError
 
+from app import prefetch_request_context_before_request
+from app.extensions import redis_client
+from app.models.organisation import Organisation
+from app.models.service import Service
 from tests.conftest import set_config_values
 
 
@@ -66,6 +70,49 @@ def test_load_organisation_before_request_ignores_static_appropriately(
         assert g.current_organisation is not None
 
 
+def test_prefetch_request_context_before_request_loads_anything_not_cached_concurrently(notify_admin, mocker):
+    mocker.patch.object(redis_client, "active", True)
+    mock_prefetch = mocker.patch("app.cache.prefetch", return_value=["service-1234"])
+    mock_run_concurrently = mocker.patch("app.run_concurrently", return_value=["service", "organisation"])
+
+    with notify_admin.test_request_context():
+        request.view_args = {"service_id": "1234", "org_id": "5678"}
+        g.user_id = "abcd"
+
+        prefetch_request_context_before_request()
+
+        mock_prefetch.assert_called_once_with(["user-abcd", "service-1234"])
+        assert [(call.func, call.args) for call in mock_run_concurrently.call_args.args] == [
+            (Service.from_id, ("1234",)),
+            (Organisation.from_id, ("5678",)),
+        ]
+        assert g.prefetched_organisation == "organisation"
+
+
+@pytest.mark.parametrize(
+    "redis_active, uncached_keys",
+    (
+        (True, []),
+        (True, ["user-abcd"]),
+        (False, ["user-abcd", "service-1234"]),
+    ),
+)
+def test_prefetch_request_context_before_request_leaves_single_calls_to_loaders(
+    notify_admin, mocker, redis_active, uncached_keys
+):
+    mocker.patch.object(redis_client, "active", redis_active)
+    mocker.patch("app.cache.prefetch", return_value=uncached_keys)
+    mock_run_concurrently = mocker.patch("app.run_concurrently")
+
+    with notify_admin.test_request_context():
+        request.view_args = {"service_id": "1234"}
+        g.user_id = "abcd"
+
+        prefetch_request_context_before_request()
+
+    assert mock_run_concurrently.called is False
+
+
 @pytest.mark.skip(reason="[NOTIFYNL] Translation issue")
 @pytest.mark.parametrize(
     "url",
@@ -185,8 +185,9 @@ def test_view_conversation_updates(
         "app.main.views_nl.conversation.service_api_client.get_inbound_sms_by_id",
         side_effect=HTTPError(response=Mock(status_code=404)),
     )
-    mock_get_partials = mocker.patch(
-        "app.main.views_nl.conversation.get_conversation_partials", return_value={"messages": "foo"}
+    mock_get_messages = mocker.patch("app.main.views_nl.conversation.get_conversation_messages", return_value=([], []))
+    mock_render_partials = mocker.patch(
+        "app.main.views_nl.conversation.render_conversation_partials", return_value={"messages": "foo"}
     )
 
     response = client_request.get_response(
@@ -197,7 +198,8 @@ def test_view_conversation_updates(
 
     assert json.loads(response.get_data(as_text=True)) == {"messages": "foo"}
 
-    mock_get_partials.assert_called_once_with(SERVICE_ONE_ID, "07123 456789")
+    mock_get_messages.assert_called_once_with(SERVICE_ONE_ID, "07123 456789")
+    mock_render_partials.assert_called_once_with([], [])
 
 
 @freeze_time("2012-01-01 00:00:00")
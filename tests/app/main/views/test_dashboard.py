@@ -5,8 +5,10 @@ from datetime import datetime
 import pytest
 from flask import url_for
 from freezegun import freeze_time
+from werkzeug.utils import cached_property
 
 from app.main.views_nl.dashboard import (
+    DASHBOARD_SERVICE_PROPERTIES,
     aggregate_notifications_stats,
     aggregate_status_types,
     aggregate_template_usage,
@@ -14,6 +16,7 @@ from app.main.views_nl.dashboard import (
     get_dashboard_totals,
     get_tuples_of_financial_years,
 )
+from app.models.service import Service
 from tests import (
     organisation_json,
     service_json,
@@ -1634,6 +1637,12 @@ def test_service_dashboard_totals_link_to_view_notifications(
     )
 
 
+@pytest.mark.parametrize("property_name", DASHBOARD_SERVICE_PROPERTIES)
+def test_dashboard_service_properties_are_cached(property_name):
+    # Prefetching a plain property would make the API call and throw the result away
+    assert isinstance(getattr(Service, property_name), cached_property)
+
+
 def test_get_dashboard_totals_adds_percentages():
     stats = {
         "sms": {"requested": 3, "delivered": 0, "failed": 2},
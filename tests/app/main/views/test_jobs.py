@@ -5,9 +5,11 @@ from datetime import UTC, datetime
 import pytest
 from flask import url_for
 from freezegun import freeze_time
+from notifications_python_client.errors import HTTPError
 
 from app.main.views_nl.jobs import get_time_left
 from tests import NotifyBeautifulSoup, job_json, notification_json, user_json
+from tests.app.utils.test_csv import _get_notifications_csv
 from tests.conftest import (
     SERVICE_ONE_ID,
     create_active_caseworking_user,
@@ -454,7 +456,7 @@ def test_should_show_scheduled_job(
     mocker,
 ):
     mocker.patch(
-        "app.main.views_nl.jobs.s3download",
+        "app.main.views_nl.jobs.s3download_first_rows",
         return_value="""
             phone number,name
             +447700900986,John
@@ -827,6 +829,37 @@ def test_should_show_updates_for_upcoming_scheduled_job_as_json(
     assert form.select_one("button")
 
 
+@freeze_time("2016-01-01 00:00:00")
+def test_should_not_render_updates_for_job_which_has_not_changed(
+    client_request,
+    service_one,
+    mock_get_notifications,
+    mock_get_service_template,
+    mock_get_job,
+    mock_get_service_data_retention,
+    fake_uuid,
+):
+    response = client_request.get_response(
+        "json_updates.view_job_updates",
+        service_id=service_one["id"],
+        job_id=fake_uuid,
+    )
+    assert response.headers["X-Poll-Interval"] == "2000"
+
+    response = client_request.get_response(
+        "json_updates.view_job_updates",
+        service_id=service_one["id"],
+        job_id=fake_uuid,
+        _expected_status=304,
+        _headers={"If-None-Match": response.headers["ETag"]},
+    )
+
+    assert response.get_data() == b""
+    assert response.headers["X-Poll-Interval"] == "10000"
+    assert mock_get_job.call_count == 2
+    assert mock_get_notifications.call_count == 1
+
+
 @pytest.mark.parametrize(
     "job_created_at, expected_message",
     [
@@ -886,3 +919,57 @@ def test_should_show_letter_job_with_first_class_if_no_notifications(
     )
 
     assert normalize_spaces(page.select(".keyline-block")[1].text) == "5 January Estimated delivery date"
+
+
+def test_view_job_csv_streams_each_page_and_stops_when_client_disconnects(
+    client_request,
+    mock_get_service_template,
+    mock_get_job,
+    mocker,
+    fake_uuid,
+):
+    mocker.patch(
+        "app.s3_client.s3_csv_client.s3download",
+        return_value="phone_number\n" + "\n".join(["07700900001"] * 5000),
+    )
+    # Every page is full, so the download would keep fetching pages until the client goes away
+    mock_get_notifications = mocker.patch(
+        "app.models.notification.NotificationsForCSV._get_items",
+        side_effect=lambda *args, **kwargs: _get_notifications_csv(rows=5000)(SERVICE_ONE_ID),
+    )
+
+    response = client_request.get_response("main.view_job_csv", service_id=SERVICE_ONE_ID, job_id=fake_uuid)
+
+    assert response.is_streamed
+    # The first page is fetched before the response starts, so an API error gets an error page
+    assert mock_get_notifications.call_count == 1
+
+    chunks = response.iter_encoded()
+    assert next(chunks).startswith(b"Row number,phone_number,Template,Type,Job,Status,Time\n")
+    assert next(chunks).count(b"\r\n") == 5000
+    assert next(chunks).count(b"\r\n") == 5000
+    assert mock_get_notifications.call_count == 2
+
+    response.close()
+
+    assert mock_get_notifications.call_count == 2
+
+
+def test_view_job_csv_shows_error_page_if_first_page_of_notifications_fails(
+    client_request,
+    mock_get_service_template,
+    mock_get_job,
+    mocker,
+    fake_uuid,
+):
+    mocker.patch("app.s3_client.s3_csv_client.s3download", return_value="phone_number\n07700900001")
+    mocker.patch(
+        "app.models.notification.NotificationsForCSV._get_items",
+        side_effect=HTTPError(response=mocker.Mock(status_code=500, json={}), message="Internal server error"),
+    )
+
+    response = client_request.get_response(
+        "main.view_job_csv", service_id=SERVICE_ONE_ID, job_id=fake_uuid, _expected_status=500
+    )
+
+    assert not response.is_streamed
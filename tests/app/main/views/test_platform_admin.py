@@ -281,12 +281,12 @@ def test_clear_cache_shows_form(
     platform_admin_user,
     mocker,
 ):
-    redis = mocker.patch("app.main.views_nl.platform_admin.redis_client")
+    mock_clear_group = mocker.patch("app.main.views_nl.platform_admin.cache.clear_group")
     client_request.login(platform_admin_user)
 
     page = client_request.get("main.clear_cache")
 
-    assert not redis.delete_by_pattern.called
+    assert not mock_clear_group.called
     radios = {el["value"] for el in page.select("input[type=checkbox]")}
 
     assert radios == {
@@ -308,61 +308,27 @@ def test_clear_cache_shows_form(
     (
         (
             "template",
-            [
-                call("service-????????-????-????-????-????????????-templates"),
-                call(
-                    "service-????????-????-????-????-????????????-template-????????-????-????-????-????????????-version-*"
-                ),
-                call(
-                    "service-????????-????-????-????-????????????-template-????????-????-????-????-????????????-versions"
-                ),
-                call(
-                    "service-????????-????-????-????-????????????-template-????????-????-????-????-????????????-page-count"
-                ),
-                call("service-????????-????-????-????-????????????-template-precompiled"),
-            ],
-            "Removed 10 objects across 5 key formats for template",
+            [call("template")],
+            "Removed 2 objects across 5 key formats for template",
         ),
         (
             ["service", "organisation"],
-            [
-                call("has_jobs-????????-????-????-????-????????????"),
-                call("service-????????-????-????-????-????????????"),
-                call("service-????????-????-????-????-????????????-templates"),
-                call("service-????????-????-????-????-????????????-data-retention"),
-                call("service-????????-????-????-????-????????????-template-folders"),
-                call("service-????????-????-????-????-????????????-returned-letters-statistics"),
-                call("service-????????-????-????-????-????????????-returned-letters-summary"),
-                call("organisations"),
-                call("domains"),
-                call("live-service-and-organisation-counts"),
-                call("organisation-????????-????-????-????-????????????-name"),
-                call("organisation-????????-????-????-????-????????????-email-branding-pool"),
-                call("organisation-????????-????-????-????-????????????-letter-branding-pool"),
-            ],
-            "Removed 26 objects across 13 key formats for service, organisation",
+            [call("service"), call("organisation")],
+            "Removed 4 objects across 13 key formats for service, organisation",
         ),
         (
             ["text_message_and_letter_rates"],
-            [
-                call("letter-rates"),
-                call("sms-rate"),
-            ],
-            "Removed 4 objects across 2 key formats for text message and letter rates",
+            [call("text_message_and_letter_rates")],
+            "Removed 2 objects across 2 key formats for text message and letter rates",
         ),
         (
             ["unsubscribe_request_reports"],
-            [
-                call("service-????????-????-????-????-????????????-unsubscribe-request-reports-summary"),
-                call("service-????????-????-????-????-????????????-unsubscribe-request-statistics"),
-            ],
-            "Removed 4 objects across 2 key formats for unsubscribe request reports",
+            [call("unsubscribe_request_reports")],
+            "Removed 2 objects across 2 key formats for unsubscribe request reports",
         ),
         (
             ["service_join_request"],
-            [
-                call("service-join-request-????????-????-????-????-????????????"),
-            ],
+            [call("service_join_request")],
             "Removed 2 objects across 1 key formats for service join request",
         ),
     ),
@@ -375,13 +341,12 @@ def test_clear_cache_submits_and_tells_you_how_many_things_were_deleted(
     expected_confirmation,
     mocker,
 ):
-    redis = mocker.patch("app.main.views_nl.platform_admin.redis_client")
-    redis.delete_by_pattern.return_value = 2
+    mock_clear_group = mocker.patch("app.main.views_nl.platform_admin.cache.clear_group", return_value=2)
     client_request.login(platform_admin_user)
 
     page = client_request.post("main.clear_cache", _data={"model_type": model_type}, _expected_status=200)
 
-    assert redis.delete_by_pattern.call_args_list == expected_calls
+    assert mock_clear_group.call_args_list == expected_calls
 
     flash_banner = page.select_one("div.banner-default")
     assert flash_banner.text.strip() == expected_confirmation
@@ -393,13 +358,13 @@ def test_clear_cache_requires_option(
     platform_admin_user,
     mocker,
 ):
-    redis = mocker.patch("app.main.views_nl.platform_admin.redis_client")
+    mock_clear_group = mocker.patch("app.main.views_nl.platform_admin.cache.clear_group")
     client_request.login(platform_admin_user)
 
     page = client_request.post("main.clear_cache", _data={}, _expected_status=200)
 
     assert normalize_spaces(page.select_one(".govuk-error-message").text) == "Error: Select at least one type of cache"
-    assert not redis.delete_by_pattern.called
+    assert not mock_clear_group.called
 
 
 @pytest.mark.skip(reason="[NOTIFYNL] Translation issue")
@@ -3,6 +3,8 @@ import uuid
 from io import BytesIO
 
 import pytest
+from botocore.exceptions import ClientError
+from botocore.response import StreamingBody
 from flask import url_for
 from notifications_python_client.errors import HTTPError
 
@@ -10,10 +12,25 @@ from app.main.views_nl.report_requests import ReportRequest
 from tests.conftest import SERVICE_ONE_ID, create_report_request
 
 
+def _s3_object(contents, content_range=None):
+    return {
+        "Body": StreamingBody(BytesIO(contents), len(contents)),
+        "ContentLength": len(contents),
+        "ContentRange": content_range,
+        "ETag": '"abc123"',
+    }
+
+
+def _s3_error(code, **error):
+    return ClientError({"Error": {"Code": code, **error}}, "GetObject")
+
+
 def test_report_request_download_gets_file_from_s3(client_request, fake_uuid, mocker):
     report_request = create_report_request(id="5bf2a1f9-0e6b-4d5e-b409-3509bf7a37b0", user_id=fake_uuid)
     mocker.patch("app.report_request_api_client.get_report_request", return_value={"data": report_request})
-    mocker.patch.object(ReportRequest, "download", return_value=BytesIO(b"my notifications file"))
+    mock_get_object = mocker.patch.object(
+        ReportRequest, "get_object", return_value=_s3_object(b"my notifications file")
+    )
 
     response = client_request.get_response(
         "main.report_request_download",
@@ -24,6 +41,109 @@ def test_report_request_download_gets_file_from_s3(client_request, fake_uuid, mo
     assert response.get_data() == b"my notifications file"
     assert response.headers["Content-Type"] == "text/csv; charset=utf-8"
     assert response.headers["Content-Disposition"] == (f"attachment; filename={report_request['id']}.csv")
+    assert response.headers["Content-Length"] == "21"
+    assert response.headers["Accept-Ranges"] == "bytes"
+    assert response.headers["ETag"] == '"abc123"'
+    mock_get_object.assert_called_once_with(report_request["id"], byte_range=None, if_match=None)
+
+
+@pytest.mark.parametrize(
+    "request_headers, expected_byte_range, expected_if_match",
+    (
+        ({"Range": "bytes=3-"}, "bytes=3-", None),
+        ({"Range": "bytes=3-", "If-Range": '"abc123"'}, "bytes=3-", '"abc123"'),
+        # S3 can only check an ETag, so a date means sending the whole file
+        ({"Range": "bytes=3-", "If-Range": "Wed, 21 Oct 2015 07:28:00 GMT"}, None, None),
+    ),
+)
+def test_report_request_download_resumes_from_range(
+    client_request, fake_uuid, mocker, request_headers, expected_byte_range, expected_if_match
+):
+    report_request = create_report_request(user_id=fake_uuid)
+    mocker.patch("app.report_request_api_client.get_report_request", return_value={"data": report_request})
+    mock_get_object = mocker.patch.object(
+        ReportRequest, "get_object", return_value=_s3_object(b"notifications file", content_range="bytes 3-20/21")
+    )
+
+    response = client_request.get_response(
+        "main.report_request_download",
+        service_id=SERVICE_ONE_ID,
+        report_request_id=report_request["id"],
+        _expected_status=206,
+        _headers=request_headers,
+    )
+
+    assert response.get_data() == b"notifications file"
+    assert response.headers["Content-Range"] == "bytes 3-20/21"
+    mock_get_object.assert_called_once_with(
+        report_request["id"], byte_range=expected_byte_range, if_match=expected_if_match
+    )
+
+
+def test_report_request_download_starts_again_if_report_has_changed(client_request, fake_uuid, mocker):
+    report_request = create_report_request(user_id=fake_uuid)
+    mocker.patch("app.report_request_api_client.get_report_request", return_value={"data": report_request})
+    mock_get_object = mocker.patch.object(
+        ReportRequest,
+        "get_object",
+        side_effect=[_s3_error("PreconditionFailed"), _s3_object(b"my notifications file")],
+    )
+
+    response = client_request.get_response(
+        "main.report_request_download",
+        service_id=SERVICE_ONE_ID,
+        report_request_id=report_request["id"],
+        _headers={"Range": "bytes=3-", "If-Range": '"old-etag"'},
+    )
+
+    assert response.get_data() == b"my notifications file"
+    assert "Content-Range" not in response.headers
+    assert mock_get_object.call_args_list[1] == mocker.call(report_request["id"])
+
+
+@pytest.mark.parametrize(
+    "error, expected_status",
+    (
+        (_s3_error("InvalidRange", ActualObjectSize="21"), 416),
+        (_s3_error("NoSuchKey"), 404),
+    ),
+)
+def test_report_request_download_s3_errors(client_request, fake_uuid, mocker, error, expected_status):
+    report_request = create_report_request(user_id=fake_uuid)
+    mocker.patch("app.report_request_api_client.get_report_request", return_value={"data": report_request})
+    mocker.patch.object(ReportRequest, "get_object", side_effect=error)
+
+    response = client_request.get_response(
+        "main.report_request_download",
+        service_id=SERVICE_ONE_ID,
+        report_request_id=report_request["id"],
+        _expected_status=expected_status,
+        _headers={"Range": "bytes=100-"},
+    )
+
+    if expected_status == 416:
+        assert response.headers["Content-Range"] == "bytes */21"
+
+
+def test_report_request_download_redirects_to_pre_signed_url(notify_admin, client_request, fake_uuid, mocker):
+    report_request = create_report_request(user_id=fake_uuid)
+    mocker.patch("app.report_request_api_client.get_report_request", return_value={"data": report_request})
+    mocker.patch.dict(notify_admin.config, {"REPORT_REQUEST_DOWNLOAD_REDIRECT": True})
+    mock_get_download_url = mocker.patch.object(
+        ReportRequest, "get_download_url", return_value="https://s3.example.com/report.csv?signature=abc"
+    )
+    mock_get_object = mocker.patch.object(ReportRequest, "get_object")
+
+    response = client_request.get_response(
+        "main.report_request_download",
+        service_id=SERVICE_ONE_ID,
+        report_request_id=report_request["id"],
+        _expected_status=302,
+    )
+
+    assert response.location == "https://s3.example.com/report.csv?signature=abc"
+    mock_get_download_url.assert_called_once_with(report_request["id"], expires_in=60)
+    assert mock_get_object.called is False
 
 
 def test_report_request_download_when_report_does_not_exist(client_request, fake_uuid, mocker):
@@ -268,9 +388,34 @@ def test_report_request_status_json_returns_status(client_request, fake_uuid, mo
     request = create_report_request(user_id=fake_uuid, status="stored")
     mocker.patch("app.report_request_api_client.get_report_request", return_value={"data": request})
     response = client_request.get_response(
-        "main.report_request_status_json",
+        "json_updates.report_request_status_json",
         service_id=SERVICE_ONE_ID,
         report_request_id=request["id"],
     )
 
     assert json.loads(response.get_data(as_text=True)) == {"status": "stored"}
+
+
+@pytest.mark.parametrize(
+    "query_args, expected_known_status, expected_timeout",
+    (
+        ({}, None, 0),
+        ({"status": "pending"}, "pending", 25),
+    ),
+)
+def test_report_request_status_json_waits_for_status_to_change(
+    client_request, fake_uuid, mocker, query_args, expected_known_status, expected_timeout
+):
+    mock_get_status = mocker.patch.object(ReportRequest, "get_status", return_value="in progress")
+
+    response = client_request.get_response(
+        "json_updates.report_request_status_json",
+        service_id=SERVICE_ONE_ID,
+        report_request_id=fake_uuid,
+        **query_args,
+    )
+
+    assert json.loads(response.get_data(as_text=True)) == {"status": "in progress"}
+    mock_get_status.assert_called_once_with(
+        SERVICE_ONE_ID, uuid.UUID(fake_uuid), known_status=expected_known_status, timeout=expected_timeout
+    )
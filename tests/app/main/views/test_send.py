@@ -1,3 +1,4 @@
+import json
 import uuid
 from functools import partial
 from glob import glob
@@ -3110,6 +3111,77 @@ def test_should_show_preview_letter_message(
     assert mocked_preview.call_args_list[0].kwargs["service"].id == service_id
 
 
+def test_should_cache_preview_rows_when_checking_messages(
+    client_request,
+    mock_get_service_letter_template,
+    mock_get_users_by_service,
+    mock_get_service_statistics,
+    mock_get_job_doesnt_exist,
+    mock_get_jobs,
+    service_one,
+    fake_uuid,
+    mocker,
+):
+    service_one["permissions"] = ["letter"]
+    mocker.patch("app.service_api_client.get_service", return_value={"data": service_one})
+    mocker.patch(
+        "app.main.views_nl.send.s3download",
+        return_value="\n".join(
+            ["address line 1, postcode, result"] + ["123 street, abc123, pass"] + ["321 avenue, cba321, fail"]
+        ),
+    )
+    mocker.patch("app.main.views_nl.send.get_csv_metadata", return_value={"original_file_name": "example.csv"})
+    mocker.patch("app.template_preview_client.get_preview_for_templated_letter", return_value="foo")
+    mock_redis_set = mocker.patch("app.main.views_nl.send.redis_client.set")
+
+    client_request.get_response(
+        "no_cookie.check_messages_preview",
+        service_id=SERVICE_ONE_ID,
+        template_id=fake_uuid,
+        upload_id=fake_uuid,
+        filetype="png",
+        row_index=3,
+    )
+
+    cache_key = f"service-{SERVICE_ONE_ID}-upload-{fake_uuid}-template-{fake_uuid}-version-1-preview-rows"
+    [cached_rows] = [json.loads(call.args[1]) for call in mock_redis_set.call_args_list if call.args[0] == cache_key]
+    assert set(cached_rows) == {"2", "3"}
+    assert cached_rows["3"]["postcode"] == "cba321"
+
+
+def test_should_show_preview_letter_message_from_cached_row(
+    client_request,
+    mock_get_service_letter_template,
+    service_one,
+    fake_uuid,
+    mocker,
+):
+    service_one["permissions"] = ["letter"]
+    mocker.patch("app.service_api_client.get_service", return_value={"data": service_one})
+    cache_key = f"service-{SERVICE_ONE_ID}-upload-{fake_uuid}-template-{fake_uuid}-version-1-preview-rows"
+    cached_values = {cache_key: json.dumps({"3": {"address line 1": "321 avenue", "postcode": "cba321"}}).encode()}
+    mocker.patch("app.main.views_nl.send.redis_client.get", side_effect=cached_values.get)
+    mock_s3download = mocker.patch("app.main.views_nl.send.s3download")
+    mock_get_metadata = mocker.patch("app.main.views_nl.send.get_csv_metadata")
+    mocked_preview = mocker.patch("app.template_preview_client.get_preview_for_templated_letter", return_value="foo")
+
+    response = client_request.get_response(
+        "no_cookie.check_messages_preview",
+        service_id=SERVICE_ONE_ID,
+        template_id=fake_uuid,
+        upload_id=fake_uuid,
+        filetype="png",
+        row_index=3,
+        page=2,
+    )
+
+    assert response.get_data(as_text=True) == "foo"
+    assert mock_s3download.called is False
+    assert mock_get_metadata.called is False
+    assert mocked_preview.call_args_list[0].kwargs["values"] == {"addressline1": "321 avenue", "postcode": "cba321"}
+    assert mocked_preview.call_args_list[0].kwargs["page"] == "2"
+
+
 def test_dont_show_preview_letter_templates_for_bad_filetype(
     client_request, mock_get_service_template, service_one, fake_uuid
 ):
@@ -3966,6 +4038,39 @@ def test_check_messages_shows_over_max_row_error(
     )
 
 
+def test_check_messages_shows_too_many_rows_page_for_rows_past_the_limit(
+    client_request,
+    mock_get_users_by_service,
+    mock_get_service_template_with_placeholders,
+    mock_get_service_statistics,
+    mock_get_job_doesnt_exist,
+    mock_get_jobs,
+    mock_s3_get_metadata,
+    mock_s3_download,
+    fake_uuid,
+    mocker,
+):
+    # Rows past `max_rows` come back as `None`
+    mocker.patch("app.main.views_nl.send.RecipientCSV", partial(RecipientCSV, max_rows=1))
+
+    with client_request.session_transaction() as session:
+        session["file_uploads"] = {
+            fake_uuid: {
+                "template_id": fake_uuid,
+            }
+        }
+
+    page = client_request.get(
+        "main.check_messages",
+        service_id=SERVICE_ONE_ID,
+        template_id=fake_uuid,
+        upload_id=fake_uuid,
+        _test_page_title=False,
+    )
+
+    assert normalize_spaces(page.select_one(".banner-title").text) == "Uw bestand bevat te veel rijen"
+
+
 @pytest.mark.parametrize("existing_session_items", [{}, {"recipient": "07700900001"}, {"name": "Jo"}])
 def test_check_notification_redirects_if_session_not_populated(
     client_request, service_one, fake_uuid, existing_session_items, mock_get_service_template_with_placeholders
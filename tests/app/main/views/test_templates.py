@@ -2160,6 +2160,23 @@ def test_letter_branding_preview_image(
     assert response.get_data(as_text=True) == "foo"
 
 
+def test_letter_branding_preview_image_is_revalidated_by_the_browser(
+    client_request,
+    mocker,
+):
+    mocker.patch(
+        "app.template_preview_client.requests_session.post",
+        return_value=Mock(content=b"foo", status_code=200, headers={}),
+    )
+    response = client_request.get_response(
+        "no_cookie.letter_branding_preview_image",
+        filename="example",
+    )
+
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    assert response.headers["ETag"]
+
+
 @pytest.mark.parametrize("filename", [None, FieldWithNoneOption.NONE_OPTION_VALUE])
 @pytest.mark.parametrize("branding_style", [None, FieldWithNoneOption.NONE_OPTION_VALUE])
 def test_letter_template_preview_handles_no_branding_style_or_filename_correctly(
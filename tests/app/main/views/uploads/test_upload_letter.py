@@ -700,9 +700,9 @@ def test_uploaded_letter_preview_image_shows_overlay_when_content_outside_printa
     mocker,
 ):
     mocker.patch(
-        "app.main.views_nl.uploads.get_letter_pdf_and_metadata",
+        "app.main.views_nl.uploads.get_letter_pdf_page_and_metadata",
         return_value=(
-            "pdf_file",
+            "pdf_page",
             {
                 "message": "content-outside-printable-area",
                 "invalid_pages": invalid_pages,
@@ -726,10 +726,10 @@ def test_uploaded_letter_preview_image_shows_overlay_when_content_outside_printa
     )
 
     if overlay_expected:
-        template_preview_mock_invalid.assert_called_once_with("pdf_file", page_requested)
+        template_preview_mock_invalid.assert_called_once_with("pdf_page", page_requested, page_already_extracted=True)
         assert template_preview_mock_valid.called is False
     else:
-        template_preview_mock_valid.assert_called_once_with("pdf_file", page_requested)
+        template_preview_mock_valid.assert_called_once_with("pdf_page", page_requested, page_already_extracted=True)
         assert template_preview_mock_invalid.called is False
 
 
@@ -747,7 +747,7 @@ def test_uploaded_letter_preview_image_does_not_show_overlay_if_no_content_outsi
     fake_uuid,
     mocker,
 ):
-    mocker.patch("app.main.views_nl.uploads.get_letter_pdf_and_metadata", return_value=("pdf_file", metadata))
+    mocker.patch("app.main.views_nl.uploads.get_letter_pdf_page_and_metadata", return_value=("pdf_page", metadata))
     template_preview_mock = mocker.patch(
         "app.template_preview_client.get_png_for_valid_pdf_page",
         return_value=make_response("page.html", 200),
@@ -760,7 +760,24 @@ def test_uploaded_letter_preview_image_does_not_show_overlay_if_no_content_outsi
         page=1,
     )
 
-    template_preview_mock.assert_called_once_with("pdf_file", 1)
+    template_preview_mock.assert_called_once_with("pdf_page", 1, page_already_extracted=True)
+
+
+def test_uploaded_letter_preview_image_404s_for_page_outside_letter(
+    client_request,
+    fake_uuid,
+    mocker,
+):
+    mocker.patch("app.main.views_nl.uploads.get_letter_pdf_page_and_metadata", return_value=(None, {}))
+
+    client_request.get(
+        "main.view_letter_upload_as_preview",
+        file_id=fake_uuid,
+        service_id=SERVICE_ONE_ID,
+        page=3,
+        _test_page_title=False,
+        _expected_status=404,
+    )
 
 
 def test_uploaded_letter_preview_image_400s_for_bad_page_type(
@@ -896,7 +913,6 @@ def test_send_uploaded_letter_sends_letter_and_redirects_to_notification_page(
         }
     )
 
-    mocker.patch("app.main.views_nl.uploads.get_letter_pdf_and_metadata", return_value=("file", metadata))
     mock_send = mocker.patch("app.main.views_nl.uploads.notification_api_client.send_precompiled_letter")
     mocker.patch("app.main.views_nl.uploads.get_letter_metadata", return_value=metadata)
 
@@ -959,7 +975,7 @@ def test_send_uploaded_letter_when_service_does_not_have_correct_permissions(
     fake_uuid,
     mocker,
 ):
-    mocker.patch("app.main.views_nl.uploads.get_letter_pdf_and_metadata", return_value=("file", {"status": "valid"}))
+    mocker.patch("app.main.views_nl.uploads.get_letter_metadata", return_value=LetterMetadata({"status": "valid"}))
     mock_send = mocker.patch("app.main.views_nl.uploads.notification_api_client.send_precompiled_letter")
 
     service_one["permissions"] = permissions
@@ -1,19 +1,50 @@
 import boto3
+import pytest
+from botocore.exceptions import ClientError
 from moto import mock_aws
+from redis.exceptions import ConnectionError as RedisConnectionError
 
 from app.models.report_request import ReportRequest
 
 
 @mock_aws
-def test_report_request_download(notify_admin):
+def test_report_request_get_object(notify_admin):
     bucket_name = ReportRequest.get_bucket_name()
     s3 = boto3.client("s3", region_name="eu-west-1")
     s3.create_bucket(Bucket=bucket_name, CreateBucketConfiguration={"LocationConstraint": "eu-west-1"})
     s3.put_object(Bucket=bucket_name, Key="notifications_report/abcd.csv", Body=b"csv_content")
 
-    csv_file = ReportRequest.download("abcd")
+    s3_object = ReportRequest.get_object("abcd")
 
-    assert csv_file.read().decode("utf-8") == "csv_content"
+    assert s3_object["Body"].read().decode("utf-8") == "csv_content"
+    assert s3_object["ContentLength"] == 11
+
+
+@mock_aws
+def test_report_request_get_object_with_range(notify_admin):
+    bucket_name = ReportRequest.get_bucket_name()
+    s3 = boto3.client("s3", region_name="eu-west-1")
+    s3.create_bucket(Bucket=bucket_name, CreateBucketConfiguration={"LocationConstraint": "eu-west-1"})
+    s3.put_object(Bucket=bucket_name, Key="notifications_report/abcd.csv", Body=b"csv_content")
+    etag = s3.head_object(Bucket=bucket_name, Key="notifications_report/abcd.csv")["ETag"]
+
+    s3_object = ReportRequest.get_object("abcd", byte_range="bytes=4-", if_match=etag)
+
+    assert s3_object["Body"].read() == b"content"
+    assert s3_object["ContentRange"] == "bytes 4-10/11"
+
+    with pytest.raises(ClientError) as exception:
+        ReportRequest.get_object("abcd", byte_range="bytes=4-", if_match='"another-etag"')
+    assert exception.value.response["Error"]["Code"] == "PreconditionFailed"
+
+
+@mock_aws
+def test_report_request_get_download_url(notify_admin):
+    url = ReportRequest.get_download_url("abcd", expires_in=60)
+
+    assert ReportRequest.get_bucket_name() in url
+    assert "notifications_report/abcd.csv" in url
+    assert "Expires=" in url or "X-Amz-Expires=60" in url
 
 
 @mock_aws
@@ -33,3 +64,122 @@ def test_exists_in_s3_should_return_false_when_report_does_not_exist(notify_admi
     s3.create_bucket(Bucket=bucket_name, CreateBucketConfiguration={"LocationConstraint": "eu-west-1"})
 
     assert ReportRequest.exists_in_s3("abcd") is False
+
+
+@pytest.mark.parametrize("exists_in_s3", (True, False))
+def test_from_id_if_in_s3_looks_up_the_report_and_its_metadata(notify_admin, mocker, fake_uuid, exists_in_s3):
+    mock_exists_in_s3 = mocker.patch.object(ReportRequest, "exists_in_s3", return_value=exists_in_s3)
+    mock_get_report_request = mocker.patch(
+        "app.report_request_api_client.get_report_request", return_value={"data": {"id": fake_uuid}}
+    )
+
+    report_request = ReportRequest.from_id_if_in_s3("1234", fake_uuid)
+
+    if exists_in_s3:
+        assert report_request.id == fake_uuid
+    else:
+        assert report_request is None
+    mock_exists_in_s3.assert_called_once_with(fake_uuid)
+    mock_get_report_request.assert_called_once_with("1234", fake_uuid)
+
+
+@pytest.fixture
+def mock_redis_client(mocker):
+    return mocker.patch("app.models.report_request.redis_client", active=True)
+
+
+def _mock_from_id(mocker, status):
+    return mocker.patch.object(ReportRequest, "from_id", return_value=ReportRequest({"status": status}))
+
+
+def test_get_status_without_redis_asks_api(notify_admin, mocker):
+    mock_from_id = _mock_from_id(mocker, "pending")
+
+    assert ReportRequest.get_status("1234", "abcd", known_status="pending", timeout=25) == "pending"
+    mock_from_id.assert_called_once_with("1234", "abcd")
+
+
+def test_get_status_caches_status_and_publishes_change(notify_admin, mocker, mock_redis_client):
+    mock_redis_client.get.return_value = None
+    mock_from_id = _mock_from_id(mocker, "pending")
+
+    assert ReportRequest.get_status("1234", "abcd") == "pending"
+
+    mock_from_id.assert_called_once_with("1234", "abcd")
+    mock_redis_client.set.assert_called_once_with("service-1234-report-request-abcd-status", "pending", ex=3600)
+    mock_redis_client.redis_store.publish.assert_called_once_with("service-1234-report-request-abcd-status", "pending")
+    mock_redis_client.redis_store.pubsub.return_value.close.assert_called_once_with()
+
+
+def test_get_status_only_caches_finished_status_briefly(notify_admin, mocker, mock_redis_client):
+    mock_redis_client.get.return_value = None
+    _mock_from_id(mocker, "stored")
+
+    assert ReportRequest.get_status("1234", "abcd") == "stored"
+
+    # so if the report is deleted, the next request after this gets the new status from the API
+    mock_redis_client.set.assert_called_once_with("service-1234-report-request-abcd-status", "stored", ex=5)
+
+
+def test_get_status_waits_for_status_to_change(notify_admin, mocker, mock_redis_client):
+    mock_redis_client.get.side_effect = [b"pending", b"stored"]
+    # Someone else is already polling the API for this report
+    mock_redis_client.redis_store.set.return_value = None
+    mock_from_id = _mock_from_id(mocker, "pending")
+
+    assert ReportRequest.get_status("1234", "abcd", known_status="pending", timeout=25) == "stored"
+
+    assert mock_from_id.called is False
+    mock_pubsub = mock_redis_client.redis_store.pubsub.return_value
+    mock_pubsub.subscribe.assert_called_once_with("service-1234-report-request-abcd-status")
+    mock_pubsub.get_message.assert_called_once_with(timeout=5)
+
+
+def test_get_status_only_polls_api_when_due(notify_admin, mocker, mock_redis_client):
+    mock_redis_client.get.side_effect = [b"pending", b"pending", b"pending"]
+    mock_redis_client.redis_store.set.side_effect = [True, None]
+    mock_from_id = _mock_from_id(mocker, "in progress")
+
+    assert ReportRequest.get_status("1234", "abcd", known_status="pending", timeout=25) == "in progress"
+
+    mock_from_id.assert_called_once_with("1234", "abcd")
+    mock_redis_client.redis_store.set.assert_called_once_with(
+        "service-1234-report-request-abcd-status-poll", mocker.ANY, ex=5, nx=True
+    )
+    mock_redis_client.redis_store.publish.assert_called_once_with(
+        "service-1234-report-request-abcd-status", "in progress"
+    )
+
+
+def test_get_status_stops_waiting_after_timeout(notify_admin, mocker, mock_redis_client):
+    mock_redis_client.get.return_value = b"pending"
+    mock_redis_client.redis_store.set.return_value = None
+    mock_from_id = _mock_from_id(mocker, "pending")
+
+    assert ReportRequest.get_status("1234", "abcd", known_status="pending", timeout=0) == "pending"
+
+    assert mock_from_id.called is False
+    assert mock_redis_client.redis_store.pubsub.return_value.get_message.called is False
+
+
+def test_get_status_asks_api_if_redis_cannot_subscribe(notify_admin, mocker, mock_redis_client):
+    mock_redis_client.redis_store.pubsub.return_value.subscribe.side_effect = RedisConnectionError
+    mock_from_id = _mock_from_id(mocker, "pending")
+
+    assert ReportRequest.get_status("1234", "abcd", known_status="pending", timeout=25) == "pending"
+
+    mock_from_id.assert_called_once_with("1234", "abcd")
+    assert mock_redis_client.get.called is False
+
+
+def test_get_status_asks_api_if_redis_stops_responding_while_waiting(notify_admin, mocker, mock_redis_client):
+    mock_redis_client.get.return_value = b"pending"
+    mock_redis_client.redis_store.set.return_value = None
+    mock_pubsub = mock_redis_client.redis_store.pubsub.return_value
+    mock_pubsub.get_message.side_effect = RedisConnectionError
+    mock_from_id = _mock_from_id(mocker, "stored")
+
+    assert ReportRequest.get_status("1234", "abcd", known_status="pending", timeout=25) == "stored"
+
+    mock_from_id.assert_called_once_with("1234", "abcd")
+    mock_pubsub.close.assert_called_once_with()
@@ -2,6 +2,7 @@ import pytest
 
 from app.models.organisation import Organisation
 from app.models.service import Service
+from app.notify_client import run_concurrently
 from tests import organisation_json, service_json
 from tests.conftest import ORGANISATION_ID, create_folder, create_template
 
@@ -130,3 +131,46 @@ def test_get_consistent_data_retention_period(
     )
 
     assert Service(service_one).get_consistent_data_retention_period() == expected_value
+
+
+def test_prefetch_loads_properties_at_the_same_time(notify_admin, mocker, service_one):
+    mock_run_concurrently = mocker.patch("app.models.service.run_concurrently", wraps=run_concurrently)
+    mock_get_reply_to = mocker.patch(
+        "app.service_api_client.get_reply_to_email_addresses", return_value=[{"email_address": "a@example.com"}]
+    )
+    mock_get_sms_senders = mocker.patch("app.service_api_client.get_sms_senders", return_value=[])
+    service = Service(service_one)
+
+    with notify_admin.test_request_context():
+        service.prefetch("email_reply_to_addresses", "sms_senders", "email_reply_to_addresses")
+
+    assert mock_run_concurrently.call_count == 1
+    assert len(mock_run_concurrently.call_args.args) == 2
+    assert service.email_reply_to_addresses == [{"email_address": "a@example.com"}]
+    assert service.sms_senders == []
+    mock_get_reply_to.assert_called_once_with(service.id)
+    mock_get_sms_senders.assert_called_once_with(service.id)
+
+
+def test_prefetch_skips_properties_already_loaded(notify_admin, mocker, service_one):
+    mock_run_concurrently = mocker.patch("app.models.service.run_concurrently")
+    mocker.patch("app.service_api_client.get_sms_senders", return_value=[])
+    service = Service(service_one)
+    assert service.sms_senders == []
+
+    service.prefetch("sms_senders")
+    service.prefetch("sms_senders", "data_retention")
+
+    assert mock_run_concurrently.called is False
+
+
+def test_unsubscribe_requests_statistics_are_only_fetched_once(notify_admin, mocker, service_one):
+    mock_get_statistics = mocker.patch(
+        "app.service_api_client.get_unsubscribe_request_statistics",
+        return_value={"unsubscribe_requests_count": 2, "datetime_of_latest_unsubscribe_request": None},
+    )
+    service = Service(service_one)
+
+    assert service.unsubscribe_requests_count == 2
+    assert service.datetime_of_latest_unsubscribe_request is None
+    mock_get_statistics.assert_called_once_with(service.id)
@@ -104,3 +104,57 @@ def test_template_list_yields_all_folders_without_user(
         "2's Visible grandchild",
         "2's Visible child",
     )
+
+
+def _create_nested_folders_and_templates(*, depth, children_per_folder, number_of_templates):
+    folders, parent_ids = [], [None]
+    for level in range(depth):
+        level_ids = []
+        for parent_id in parent_ids:
+            for index in range(children_per_folder):
+                folder_id = str(uuid.uuid4())
+                folders.append(
+                    {
+                        "name": f"Folder {level}-{index}",
+                        "id": folder_id,
+                        "parent_id": parent_id,
+                        "users_with_permission": [],
+                    }
+                )
+                level_ids.append(folder_id)
+        parent_ids = level_ids
+
+    # Text message templates only live in the deepest folders, so filtering by
+    # template type has to look all the way down the tree for every folder
+    templates = [
+        {
+            "id": str(uuid.uuid4()),
+            "name": f"Template {index}",
+            "template_type": "sms" if index % 2 else "email",
+            "folder": parent_ids[index // 2 % len(parent_ids)] if index % 2 else folders[index % len(folders)]["id"],
+            "content": "",
+        }
+        for index in range(number_of_templates)
+    ]
+    return folders, templates
+
+
+def test_template_list_scales_to_large_nested_trees(notify_admin, mocker, service_one):
+    folders, templates = _create_nested_folders_and_templates(
+        depth=5, children_per_folder=4, number_of_templates=10_000
+    )
+    mocker.patch("app.template_folder_api_client.get_template_folders", return_value=folders)
+    mock_get_templates = mocker.patch("app.service_api_client.get_service_templates", return_value={"data": templates})
+    service = Service(service_one)
+
+    all_items = list(TemplateList(service=service))
+    sms_template_list = TemplateList(service=service, template_type="sms")
+    sms_items = list(sms_template_list)
+
+    assert len(all_items) == len(folders) + len(templates)
+    assert len([item for item in sms_items if not item.is_folder]) == len(templates) // 2
+    # Every folder is an ancestor of at least one of the deepest folders
+    assert len([item for item in sms_items if item.is_folder]) == len(folders)
+    # Visibility is worked out once per folder, not once per ancestor
+    assert len(sms_template_list._folder_visibility) == len(folders)
+    assert mock_get_templates.call_count == 1
@@ -12,10 +12,9 @@ from tests.utils import RedisClientMock
     ],
 )
 def test_add_inbound_number_to_service(mocker, notify_admin, inbound_number_id, data):
+    mocker.patch("app.notify_client.NotifyAdminRequestCache._make_generation", return_value="new-generation")
     mock_redis_delete = mocker.patch("app.extensions.RedisClient.delete", new_callable=RedisClientMock)
-    mock_redis_delete_by_pattern = mocker.patch(
-        "app.extensions.RedisClient.delete_by_pattern", new_callable=RedisClientMock
-    )
+    mock_redis_set = mocker.patch("app.extensions.RedisClient.set", new_callable=RedisClientMock)
     mock_post = mocker.patch("app.notify_client.inbound_number_client.InboundNumberClient.post")
 
     inbound_number_client.add_inbound_number_to_service("abcd", inbound_number_id=inbound_number_id)
@@ -23,4 +22,4 @@ def test_add_inbound_number_to_service(mocker, notify_admin, inbound_number_id,
     mock_post.assert_called_once_with("inbound-number/service/abcd", data=data)
 
     mock_redis_delete.assert_called_with_args("service-abcd")
-    mock_redis_delete_by_pattern.assert_called_with_args("service-abcd-template-*")
+    mock_redis_set.assert_called_with_args("service-abcd-template-generation", "new-generation")
@@ -1,6 +1,22 @@
+import json
+import uuid
 from datetime import date
+from functools import partial
+from threading import Event, Lock
+from time import sleep
+from unittest.mock import call
 
-from app.notify_client import NotifyAdminAPIClient
+import pytest
+from flask import g
+
+from app.extensions import redis_client
+from app.notify_client import (
+    JSONCacheCodec,
+    LocalCache,
+    NotifyAdminAPIClient,
+    NotifyAdminRequestCache,
+    run_concurrently,
+)
 from app.notify_client.notification_api_client import notification_api_client
 
 
@@ -42,3 +58,655 @@ def test_get_notification_status_by_service(notify_admin, mocker):
     mock_get.assert_called_once_with(
         url="service/monthly-data-by-service", params={"start_date": "2019-04-01", "end_date": "2019-04-30"}
     )
+
+
+def test_get_generation_returns_existing_generation(mocker):
+    mock_redis_get = mocker.patch("app.extensions.RedisClient.get", return_value=b"abc123")
+    mock_redis_set = mocker.patch("app.extensions.RedisClient.set")
+
+    assert NotifyAdminRequestCache(redis_client).get_generation("service-1234-template-generation") == "abc123"
+
+    mock_redis_get.assert_called_once_with("service-1234-template-generation")
+    assert mock_redis_set.called is False
+
+
+def test_get_generation_starts_new_generation_if_none_exists(mocker):
+    mocker.patch("app.extensions.RedisClient.get", side_effect=[None, b"new-generation"])
+    mocker.patch("app.notify_client.NotifyAdminRequestCache._make_generation", return_value="new-generation")
+    mock_redis_set = mocker.patch("app.extensions.RedisClient.set")
+
+    assert NotifyAdminRequestCache(redis_client).get_generation("service-1234-template-generation") == "new-generation"
+
+    mock_redis_set.assert_called_once_with("service-1234-template-generation", "new-generation", ex=2_419_200, nx=True)
+
+
+def test_get_generation_uses_generation_stored_by_another_caller(mocker):
+    # Someone else stores their generation between us finding none and trying to store ours
+    mocker.patch("app.extensions.RedisClient.get", side_effect=[None, b"their-generation"])
+    mocker.patch("app.notify_client.NotifyAdminRequestCache._make_generation", return_value="our-generation")
+    mocker.patch("app.extensions.RedisClient.set")
+
+    assert NotifyAdminRequestCache(redis_client).get_generation("service-1234-template-generation") == (
+        "their-generation"
+    )
+
+
+def test_get_generation_uses_new_generation_if_redis_has_nothing(mocker):
+    mocker.patch("app.extensions.RedisClient.get", return_value=None)
+    mocker.patch("app.notify_client.NotifyAdminRequestCache._make_generation", return_value="new-generation")
+    mocker.patch("app.extensions.RedisClient.set")
+
+    assert NotifyAdminRequestCache(redis_client).get_generation("service-1234-template-generation") == "new-generation"
+
+
+def test_set_with_generation_scopes_key_to_current_generation(mocker):
+    cache = NotifyAdminRequestCache(redis_client)
+
+    @cache.set("service-{service_id}-thing-{thing_id}", generation="service-{service_id}-generation")
+    def get_thing(service_id, thing_id):
+        return {"data_from": "api"}
+
+    mock_redis_get = mocker.patch("app.extensions.RedisClient.get", side_effect=[b"abc123", None])
+    mock_redis_set = mocker.patch("app.extensions.RedisClient.set")
+
+    assert get_thing("1234", thing_id="5678") == {"data_from": "api"}
+
+    assert mock_redis_get.call_args_list == [
+        call("service-1234-generation"),
+        call("service-1234-thing-5678-generation-abc123"),
+    ]
+    mock_redis_set.assert_called_once_with(
+        "service-1234-thing-5678-generation-abc123", '{"data_from": "api"}', ex=2_419_200
+    )
+
+
+def test_new_generation_replaces_generation_after_calling_method(mocker):
+    cache = NotifyAdminRequestCache(redis_client)
+    mock_api_call = mocker.Mock()
+
+    @cache.new_generation("service-{service_id}-generation")
+    def update_thing(service_id, thing_id):
+        mock_api_call()
+
+    mocker.patch("app.notify_client.NotifyAdminRequestCache._make_generation", return_value="new-generation")
+    mock_redis_set = mocker.patch("app.extensions.RedisClient.set")
+
+    update_thing("1234", "5678")
+
+    mock_api_call.assert_called_once_with()
+    mock_redis_set.assert_called_once_with("service-1234-generation", "new-generation", ex=2_419_200)
+
+
+def test_set_adds_key_to_indexes_for_its_groups(notify_admin, mocker):
+    mocker.patch("app.notify_client.time", return_value=1_000)
+    mock_redis_client = mocker.Mock(active=True)
+    mock_redis_client.get.return_value = None
+    cache = NotifyAdminRequestCache(
+        mock_redis_client,
+        {"service": ["service-{service_id}-thing"], "thing": ["service-{service_id}-thing"]},
+    )
+
+    @cache.set("service-{service_id}-thing")
+    def get_thing(service_id):
+        return {"data_from": "api"}
+
+    get_thing("1234")
+
+    pipe = mock_redis_client.redis_store.pipeline.return_value
+    assert pipe.zadd.call_args_list == [
+        call("cache-group-service", {"service-1234-thing": 1_000 + 2_419_200}),
+        call("cache-group-thing", {"service-1234-thing": 1_000 + 2_419_200}),
+    ]
+    # Keys which have expired are trimmed from the index on every write
+    assert pipe.zremrangebyscore.call_args_list == [
+        call("cache-group-service", "-inf", 1_000),
+        call("cache-group-thing", "-inf", 1_000),
+    ]
+    pipe.execute.assert_called_once_with()
+
+
+def test_set_does_not_index_keys_which_are_not_in_a_group(notify_admin, mocker):
+    mock_redis_client = mocker.Mock(active=True)
+    mock_redis_client.get.return_value = None
+    cache = NotifyAdminRequestCache(mock_redis_client, {"service": ["service-{service_id}"]})
+
+    @cache.set("service-{service_id}-thing")
+    def get_thing(service_id):
+        return {"data_from": "api"}
+
+    get_thing("1234")
+
+    assert mock_redis_client.set.called
+    assert not mock_redis_client.redis_store.pipeline.called
+
+
+def test_clear_group_deletes_indexed_keys_in_batches(notify_admin, mocker):
+    mock_redis_client = mocker.Mock(active=True)
+    mock_redis_client.redis_store.zscan_iter.return_value = iter([("key-1", 1.0), ("key-2", 2.0), ("key-3", 3.0)])
+    pipe = mock_redis_client.redis_store.pipeline.return_value
+    pipe.execute.side_effect = [(2, 2), (1, 1)]
+
+    assert NotifyAdminRequestCache(mock_redis_client).clear_group("service", batch_size=2) == 3
+
+    mock_redis_client.redis_store.zscan_iter.assert_called_once_with("cache-group-service", count=2)
+    assert pipe.delete.call_args_list == [call("key-1", "key-2"), call("key-3")]
+    assert pipe.zrem.call_args_list == [
+        call("cache-group-service", "key-1", "key-2"),
+        call("cache-group-service", "key-3"),
+    ]
+
+
+def test_clear_group_does_nothing_if_redis_is_not_enabled(notify_admin, mocker):
+    mock_redis_client = mocker.Mock(active=False)
+
+    assert NotifyAdminRequestCache(mock_redis_client).clear_group("service") == 0
+
+    assert not mock_redis_client.redis_store.zscan_iter.called
+
+
+def test_clear_group_logs_redis_errors(notify_admin, mocker, caplog):
+    mock_redis_client = mocker.Mock(active=True)
+    mock_redis_client.redis_store.zscan_iter.side_effect = ConnectionError
+
+    with caplog.at_level("ERROR"):
+        assert NotifyAdminRequestCache(mock_redis_client).clear_group("service") == 0
+
+    assert [record.message for record in caplog.records] == ["Redis error clearing cache group service"]
+
+
+def test_local_cache_evicts_least_recently_used_keys():
+    local_cache = LocalCache(maxsize=2, ttl_in_seconds=10)
+    local_cache.set("a", "1")
+    local_cache.set("b", "2")
+    assert local_cache.get("a") == "1"
+
+    local_cache.set("c", "3")
+
+    assert (local_cache.get("a"), local_cache.get("b"), local_cache.get("c")) == ("1", None, "3")
+
+
+def test_local_cache_entries_expire(mocker):
+    mock_monotonic = mocker.patch("app.notify_client.monotonic", return_value=100)
+    local_cache = LocalCache(maxsize=2, ttl_in_seconds=10)
+    local_cache.set("a", "1")
+
+    mock_monotonic.return_value = 109
+    assert local_cache.get("a") == "1"
+
+    mock_monotonic.return_value = 110
+    assert local_cache.get("a") is None
+    assert len(local_cache) == 0
+
+
+@pytest.mark.parametrize(
+    "pattern, expected_keys_left",
+    (
+        ("service-1234", {"service-5678", "organisation-1234-name"}),
+        ("service-*", {"organisation-1234-name"}),
+        ("*", set()),
+    ),
+)
+def test_local_cache_invalidate(pattern, expected_keys_left):
+    local_cache = LocalCache(maxsize=10, ttl_in_seconds=10)
+    for key in ("service-1234", "service-5678", "organisation-1234-name"):
+        local_cache.set(key, "value")
+
+    local_cache.invalidate(pattern)
+
+    assert {key for key in ("service-1234", "service-5678", "organisation-1234-name") if local_cache.get(key)} == (
+        expected_keys_left
+    )
+
+
+def test_set_keeps_local_keys_in_local_cache(notify_admin, mocker):
+    mock_redis_client = mocker.Mock(active=True)
+    mock_redis_client.get.return_value = None
+    cache = NotifyAdminRequestCache(mock_redis_client, local_key_formats={"service-{service_id}"})
+    mocker.patch.object(cache, "_start_invalidation_listener", return_value=True)
+    mock_api_call = mocker.Mock(return_value={"data_from": "api"})
+
+    @cache.set("service-{service_id}")
+    def get_service(service_id):
+        return mock_api_call()
+
+    assert get_service("1234") == {"data_from": "api"}
+    assert get_service("1234") == {"data_from": "api"}
+    assert get_service("1234") is not get_service("1234")
+
+    mock_api_call.assert_called_once_with()
+    mock_redis_client.get.assert_called_once_with("service-1234")
+
+
+def test_set_does_not_use_local_cache_without_redis(notify_admin, mocker):
+    mock_redis_client = mocker.Mock(active=False)
+    mock_redis_client.get.return_value = None
+    cache = NotifyAdminRequestCache(mock_redis_client, local_key_formats={"service-{service_id}"})
+
+    @cache.set("service-{service_id}")
+    def get_service(service_id):
+        return {"data_from": "api"}
+
+    get_service("1234")
+    get_service("1234")
+
+    assert mock_redis_client.get.call_count == 2
+    assert len(cache.local_cache) == 0
+
+
+def test_delete_invalidates_local_keys_in_every_process(notify_admin, mocker):
+    mock_redis_client = mocker.Mock(active=True)
+    cache = NotifyAdminRequestCache(mock_redis_client, local_key_formats={"service-{service_id}"})
+    cache.local_cache.set("service-1234", '{"data_from": "api"}')
+
+    @cache.delete("service-{service_id}")
+    def update_service(service_id):
+        pass
+
+    update_service("1234")
+
+    mock_redis_client.delete.assert_called_once_with("service-1234")
+    mock_redis_client.redis_store.publish.assert_called_once_with("request-cache-invalidation", "service-1234")
+    assert cache.local_cache.get("service-1234") is None
+
+
+def test_delete_does_not_publish_keys_which_are_not_local(notify_admin, mocker):
+    mock_redis_client = mocker.Mock(active=True)
+    cache = NotifyAdminRequestCache(mock_redis_client, local_key_formats={"service-{service_id}"})
+
+    @cache.delete("service-{service_id}-templates")
+    def update_templates(service_id):
+        pass
+
+    update_templates("1234")
+
+    mock_redis_client.delete.assert_called_once_with("service-1234-templates")
+    assert not mock_redis_client.redis_store.publish.called
+
+
+def test_delete_keys_invalidates_local_keys_in_every_process(notify_admin, mocker):
+    mock_redis_client = mocker.Mock(active=True)
+    cache = NotifyAdminRequestCache(mock_redis_client, local_key_formats={"service-{service_id}"})
+    cache.local_cache.set("service-1234", '{"data_from": "api"}')
+    cache.local_cache.set("service-5678", '{"data_from": "api"}')
+
+    cache.delete_keys("service-{service_id}", ["service-1234", "service-5678"])
+
+    mock_redis_client.delete.assert_called_once_with("service-1234", "service-5678")
+    assert mock_redis_client.redis_store.publish.call_args_list == [
+        call("request-cache-invalidation", "service-1234"),
+        call("request-cache-invalidation", "service-5678"),
+    ]
+    assert len(cache.local_cache) == 0
+
+
+def test_delete_keys_does_not_publish_keys_which_are_not_local(notify_admin, mocker):
+    mock_redis_client = mocker.Mock(active=True)
+    cache = NotifyAdminRequestCache(mock_redis_client, local_key_formats={"service-{service_id}"})
+
+    cache.delete_keys("user-{user_id}", ["user-1234"])
+
+    mock_redis_client.delete.assert_called_once_with("user-1234")
+    assert not mock_redis_client.redis_store.publish.called
+
+
+def test_invalidation_listener_removes_keys_from_local_cache(notify_admin, mocker):
+    cache = NotifyAdminRequestCache(mocker.Mock(active=True), local_key_formats={"service-{service_id}"})
+    cache.local_cache.set("service-1234", "1")
+    cache.local_cache.set("service-5678", "2")
+    cache._invalidation_listener_pid = 1
+    keys_left_after_message = []
+
+    def listen():
+        yield {"data": b"service-1234"}
+        keys_left_after_message.extend(key for key in ("service-1234", "service-5678") if cache.local_cache.get(key))
+        raise ConnectionError
+
+    mock_pubsub = mocker.Mock()
+    mock_pubsub.listen.return_value = listen()
+
+    cache._listen_for_invalidations(mock_pubsub, notify_admin)
+
+    assert keys_left_after_message == ["service-5678"]
+    # Once the listener stops, the local cache can’t be trusted
+    assert cache._invalidation_listener_pid is None
+    assert len(cache.local_cache) == 0
+    mock_pubsub.close.assert_called_once_with()
+
+
+class FakeRedisStore:
+    def __init__(self):
+        self.values = {}
+        self.lock = Lock()
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None, nx=False):
+        with self.lock:
+            if nx and key in self.values:
+                return None
+            self.values[key] = value if isinstance(value, bytes) else str(value).encode("utf-8")
+            return True
+
+    def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+
+@pytest.fixture
+def fake_redis_client(mocker):
+    redis_store = FakeRedisStore()
+    mock_redis_client = mocker.Mock(active=True, redis_store=redis_store, get=redis_store.get)
+    mock_redis_client.set.side_effect = lambda key, value, ex=None: redis_store.set(key, value, ex=ex)
+    return mock_redis_client
+
+
+@pytest.fixture
+def cache_stampede(notify_admin, fake_redis_client):
+    """
+    Calls a cached client method from lots of threads at the same time, before anything is cached, and returns how
+    many of them called the API
+    """
+    cache = NotifyAdminRequestCache(fake_redis_client)
+
+    def stampede(concurrent_requests=50, api_response_time=0.1):
+        api_calls = []
+
+        @cache.set("service-{service_id}-templates")
+        def get_service_templates(service_id):
+            api_calls.append(service_id)
+            sleep(api_response_time)
+            return {"data": ["template"]}
+
+        results = run_concurrently(*[partial(get_service_templates, "1234")] * concurrent_requests)
+
+        assert results == [{"data": ["template"]}] * concurrent_requests
+        assert fake_redis_client.redis_store.get("service-1234-templates-lease") is None
+        return len(api_calls)
+
+    return stampede
+
+
+def test_set_only_calls_api_once_when_many_requests_miss_the_cache(cache_stampede):
+    assert cache_stampede(concurrent_requests=50) == 1
+
+
+def test_set_calls_api_if_lease_holder_takes_too_long(cache_stampede, mocker):
+    mocker.patch.object(NotifyAdminRequestCache, "LEASE_WAIT_IN_SECONDS", 0.1)
+
+    assert cache_stampede(concurrent_requests=5, api_response_time=0.5) == 5
+
+
+def test_set_calls_api_without_lease_if_redis_is_not_enabled(notify_admin, mocker):
+    mock_redis_client = mocker.Mock(active=False)
+    mock_redis_client.get.return_value = None
+    cache = NotifyAdminRequestCache(mock_redis_client)
+
+    @cache.set("service-{service_id}-templates")
+    def get_service_templates(service_id):
+        return {"data": []}
+
+    assert get_service_templates("1234") == {"data": []}
+    assert not mock_redis_client.redis_store.set.called
+
+
+def test_set_with_stale_after_returns_stale_value_and_revalidates_in_background(
+    notify_admin, mocker, fake_redis_client
+):
+    mock_thread = mocker.patch("app.notify_client.Thread")
+    cache = NotifyAdminRequestCache(fake_redis_client)
+    fake_redis_client.redis_store.set("performance-stats", '{"data_from": "cache"}')
+    mock_api_call = mocker.Mock(return_value={"data_from": "api"})
+
+    @cache.set("performance-stats", ttl_in_seconds=86_400, stale_after_in_seconds=3600)
+    def get_stats():
+        return mock_api_call()
+
+    assert get_stats() == {"data_from": "cache"}
+    assert get_stats() == {"data_from": "cache"}
+
+    # Only one revalidation is started while the first is still running
+    mock_thread.assert_called_once()
+    assert mock_api_call.called is False
+
+    mock_thread.call_args.kwargs["target"]()
+
+    mock_api_call.assert_called_once_with()
+    assert fake_redis_client.redis_store.get("performance-stats") == b'{"data_from": "api"}'
+    assert fake_redis_client.redis_store.get("performance-stats-fresh") == b"1"
+    assert fake_redis_client.redis_store.get("performance-stats-lease") is None
+    assert get_stats() == {"data_from": "api"}
+    mock_thread.assert_called_once()
+
+
+def test_set_with_stale_after_does_not_revalidate_fresh_values(notify_admin, mocker, fake_redis_client):
+    mock_thread = mocker.patch("app.notify_client.Thread")
+    cache = NotifyAdminRequestCache(fake_redis_client)
+
+    @cache.set("performance-stats", ttl_in_seconds=86_400, stale_after_in_seconds=3600)
+    def get_stats():
+        return {"data_from": "api"}
+
+    assert get_stats() == {"data_from": "api"}
+    assert get_stats() == {"data_from": "api"}
+
+    assert fake_redis_client.redis_store.get("performance-stats-fresh") == b"1"
+    assert mock_thread.called is False
+
+
+def test_prefetch_reads_keys_in_one_round_trip_for_the_rest_of_the_request(notify_admin, mocker, fake_redis_client):
+    fake_redis_client.redis_store.set("user-1234", '{"data": "cached user"}')
+    fake_redis_client.redis_store.mget = mocker.Mock(return_value=[b'{"data": "cached user"}', None])
+    fake_redis_client.get = mocker.Mock(wraps=fake_redis_client.redis_store.get)
+    cache = NotifyAdminRequestCache(fake_redis_client)
+
+    @cache.set("user-{user_id}")
+    def get_user(user_id):
+        return {"data": "user from api"}
+
+    @cache.set("service-{service_id}")
+    def get_service(service_id):
+        return {"data": "service from api"}
+
+    with notify_admin.test_request_context():
+        assert cache.prefetch(["user-1234", "service-5678"]) == ["service-5678"]
+        fake_redis_client.redis_store.mget.assert_called_once_with(["user-1234", "service-5678"])
+
+        assert get_user("1234") == {"data": "cached user"}
+        assert fake_redis_client.get.called is False
+
+        assert get_service("5678") == {"data": "service from api"}
+        fake_redis_client.get.reset_mock()
+        assert get_service("5678") == {"data": "service from api"}
+        assert fake_redis_client.get.called is False
+
+
+def test_prefetch_leaves_keys_in_local_cache_to_be_read_from_there(notify_admin, mocker):
+    mock_redis_client = mocker.Mock(active=True)
+    mock_redis_client.redis_store.mget.return_value = [None]
+    cache = NotifyAdminRequestCache(mock_redis_client, local_key_formats={"service-{service_id}"})
+    mocker.patch.object(cache, "_start_invalidation_listener", return_value=True)
+    cache.local_cache.set("service-5678", '{"data": "local service"}')
+
+    @cache.set("service-{service_id}")
+    def get_service(service_id):
+        return {"data": "service from api"}
+
+    with notify_admin.test_request_context():
+        assert cache.prefetch(["user-1234", "service-5678"]) == ["user-1234"]
+        mock_redis_client.redis_store.mget.assert_called_once_with(["user-1234"])
+
+        assert get_service("5678") == {"data": "local service"}
+        assert mock_redis_client.get.called is False
+
+
+def test_delete_forgets_prefetched_keys(notify_admin, mocker):
+    mock_redis_client = mocker.Mock(active=True)
+    mock_redis_client.redis_store.mget.return_value = [b'{"data": "cached service"}']
+    mock_redis_client.get.return_value = None
+    cache = NotifyAdminRequestCache(mock_redis_client)
+
+    @cache.set("service-{service_id}")
+    def get_service(service_id):
+        return {"data": "service from api"}
+
+    @cache.delete("service-{service_id}")
+    def update_service(service_id):
+        pass
+
+    with notify_admin.test_request_context():
+        cache.prefetch(["service-1234"])
+        assert get_service("1234") == {"data": "cached service"}
+
+        update_service("1234")
+
+        assert get_service("1234") == {"data": "service from api"}
+
+
+@pytest.mark.parametrize(
+    "value, compress_above_bytes, expected_type",
+    (
+        ({"data": "short"}, 100, str),
+        ({"data": "long" * 100}, 100, bytes),
+        ({"data": "long" * 100}, None, str),
+    ),
+)
+def test_json_cache_codec_round_trip(value, compress_above_bytes, expected_type):
+    codec = JSONCacheCodec(compress_above_bytes=compress_above_bytes, compress=True)
+
+    encoded = codec.encode(value)
+
+    assert type(encoded) is expected_type
+    assert codec.can_decode(encoded)
+    assert codec.decode(encoded) == value
+
+
+def test_json_cache_codec_compresses_with_versioned_header():
+    encoded = JSONCacheCodec(compress_above_bytes=100, compress=True).encode({"data": "long" * 100})
+
+    assert encoded.startswith(b"\x00zj1")
+    assert len(encoded) < 100
+
+
+def test_json_cache_codec_makes_large_template_lists_much_smaller():
+    templates = {
+        "data": [
+            {
+                "id": str(uuid.UUID(int=index)),
+                "name": f"Appointment reminder {index}",
+                "template_type": ("email", "sms", "letter")[index % 3],
+                "content": "Dear ((name)),\n\nYour appointment on ((date)) at ((time)) is confirmed. " * 8,
+                "folder": str(uuid.UUID(int=index // 20)),
+                "version": 3,
+                "archived": False,
+            }
+            for index in range(1_000)
+        ]
+    }
+    codec = JSONCacheCodec(compress=True)
+
+    encoded = codec.encode(templates)
+
+    assert len(encoded) < len(json.dumps(templates)) / 5
+    assert codec.decode(encoded) == templates
+
+
+@pytest.mark.parametrize("compression_enabled, expected_type", ((False, str), (True, bytes)))
+def test_json_cache_codec_only_compresses_if_enabled(notify_admin, mocker, compression_enabled, expected_type):
+    mocker.patch.dict(notify_admin.config, {"REDIS_CACHE_COMPRESSION_ENABLED": compression_enabled})
+
+    with notify_admin.app_context():
+        encoded = JSONCacheCodec(compress_above_bytes=100).encode({"data": "long" * 100})
+
+    assert type(encoded) is expected_type
+
+
+@pytest.mark.parametrize("cached", ('{"data": "old"}', b'{"data": "old"}'))
+def test_json_cache_codec_reads_values_cached_before_compression(cached):
+    codec = JSONCacheCodec()
+
+    assert codec.can_decode(cached)
+    assert codec.decode(cached) == {"data": "old"}
+
+
+def test_json_cache_codec_does_not_read_unknown_formats():
+    codec = JSONCacheCodec()
+
+    assert codec.can_decode(b"\x00zj9whatever") is False
+    with pytest.raises(ValueError):
+        codec.decode(b"\x00zj9whatever")
+
+
+def test_set_compresses_large_values(notify_admin, fake_redis_client):
+    cache = NotifyAdminRequestCache(fake_redis_client, codec=JSONCacheCodec(compress_above_bytes=100, compress=True))
+    templates = {"data": [{"name": f"Template {index}"} for index in range(100)]}
+
+    @cache.set("service-{service_id}-templates")
+    def get_service_templates(service_id):
+        return templates
+
+    assert get_service_templates("1234") == templates
+
+    assert fake_redis_client.redis_store.get("service-1234-templates").startswith(b"\x00zj1")
+    assert get_service_templates("1234") == templates
+
+
+def test_set_treats_values_in_unknown_formats_as_not_cached(notify_admin, fake_redis_client):
+    fake_redis_client.redis_store.set("service-1234-templates", b"\x00zj9whatever")
+    cache = NotifyAdminRequestCache(fake_redis_client)
+
+    @cache.set("service-{service_id}-templates")
+    def get_service_templates(service_id):
+        return {"data": "from api"}
+
+    assert get_service_templates("1234") == {"data": "from api"}
+    assert fake_redis_client.redis_store.get("service-1234-templates") == b'{"data": "from api"}'
+
+
+def test_run_concurrently_returns_results_in_order():
+    assert run_concurrently(lambda: 1, lambda: 2, lambda: 3) == [1, 2, 3]
+
+
+def test_run_concurrently_with_no_calls():
+    assert run_concurrently() == []
+
+
+def test_run_concurrently_keeps_request_context(notify_admin, mock_onwards_request_headers):
+    api_client = NotifyAdminAPIClient(notify_admin)
+
+    with notify_admin.test_request_context():
+        notify_admin.preprocess_request()
+        g.user_id = "1234"
+        [headers] = run_concurrently(lambda: api_client.generate_headers("api_token"))
+
+    assert headers["some-onwards"] == "request-headers"
+    assert headers["X-Notify-User-Id"] == "1234"
+
+
+def test_run_concurrently_makes_calls_at_the_same_time():
+    first_call_started = Event()
+
+    def first_call():
+        first_call_started.set()
+        return "first"
+
+    def second_call():
+        # Would time out if the calls were made one after the other in reverse order
+        return first_call_started.wait(timeout=1) and "second"
+
+    assert run_concurrently(second_call, first_call) == ["second", "first"]
+
+
+def test_run_concurrently_raises_errors_from_calls():
+    def failing_call():
+        raise ValueError("API error")
+
+    with pytest.raises(ValueError, match="API error"):
+        run_concurrently(lambda: 1, failing_call)
+
+
+def test_run_concurrently_raises_if_calls_take_too_long():
+    never_set = Event()
+
+    with pytest.raises(TimeoutError):
+        run_concurrently(lambda: never_set.wait(timeout=1), timeout=0.01)
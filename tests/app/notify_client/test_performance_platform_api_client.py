@@ -1,4 +1,5 @@
 from datetime import date
+from unittest.mock import call
 
 from app.notify_client.performance_dashboard_api_client import (
     PerformanceDashboardAPIClient,
@@ -44,11 +45,10 @@ def test_sets_value_in_cache(mocker):
     mock_api_get.assert_called_once_with(
         "/performance-dashboard", params={"start_date": "2021-01-01", "end_date": "2022-02-02"}
     )
-    mock_redis_set.assert_called_once_with(
-        "performance-stats-2021-01-01-to-2022-02-02",
-        '{"data_from": "api"}',
-        ex=3600,
-    )
+    assert mock_redis_set.call_args_list == [
+        call("performance-stats-2021-01-01-to-2022-02-02", '{"data_from": "api"}', ex=86_400),
+        call("performance-stats-2021-01-01-to-2022-02-02-fresh", "1", ex=3600),
+    ]
 
 
 def test_returns_value_from_cache(mocker):
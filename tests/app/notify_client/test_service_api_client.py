@@ -13,9 +13,8 @@ FAKE_TEMPLATE_ID = uuid4()
 
 def test_client_posts_archived_true_when_deleting_template(mocker):
     mocker.patch("app.notify_client.current_user", id="1")
-    mock_redis_delete_by_pattern = mocker.patch(
-        "app.extensions.RedisClient.delete_by_pattern", new_callable=RedisClientMock
-    )
+    mocker.patch("app.notify_client.NotifyAdminRequestCache._make_generation", return_value="new-generation")
+    mock_redis_set = mocker.patch("app.extensions.RedisClient.set", new_callable=RedisClientMock)
     expected_data = {"archived": True, "created_by": "1"}
     expected_url = f"/service/{SERVICE_ONE_ID}/template/{FAKE_TEMPLATE_ID}"
 
@@ -28,7 +27,7 @@ def test_client_posts_archived_true_when_deleting_template(mocker):
 
     client.delete_service_template(SERVICE_ONE_ID, FAKE_TEMPLATE_ID)
     mock_post.assert_called_once_with(expected_url, data=expected_data)
-    mock_redis_delete_by_pattern.assert_called_with_args(f"service-{SERVICE_ONE_ID}-template-{FAKE_TEMPLATE_ID}*")
+    mock_redis_set.assert_called_with_args(f"service-{SERVICE_ONE_ID}-template-generation", "new-generation")
 
 
 def test_client_gets_service(mocker):
@@ -98,6 +97,7 @@ def test_client_creates_service_with_correct_data(
 
 
 def test_get_precompiled_template(mocker):
+    mocker.patch("app.notify_client.cache.get_generation", return_value="1234")
     mock_redis_set = mocker.patch("app.extensions.RedisClient.set")
 
     client = ServiceAPIClient(mocker.MagicMock())
@@ -106,7 +106,7 @@ def test_get_precompiled_template(mocker):
     client.get_precompiled_template(SERVICE_ONE_ID)
     mock_get.assert_called_once_with(f"/service/{SERVICE_ONE_ID}/template/precompiled")
     mock_redis_set.assert_called_once_with(
-        f"service-{SERVICE_ONE_ID}-template-precompiled",
+        f"service-{SERVICE_ONE_ID}-template-precompiled-generation-1234",
         '{"data": "foo"}',
         ex=2_419_200,
     )
@@ -201,7 +201,7 @@ def test_client_returns_count_of_service_templates(
         (
             "get_service_template",
             [SERVICE_ONE_ID, FAKE_TEMPLATE_ID],
-            [call(f"service-{SERVICE_ONE_ID}-template-{FAKE_TEMPLATE_ID}-version-None")],
+            [call(f"service-{SERVICE_ONE_ID}-template-{FAKE_TEMPLATE_ID}-version-None-generation-1234")],
             b'{"data_from": "cache"}',
             [],
             [],
@@ -211,13 +211,13 @@ def test_client_returns_count_of_service_templates(
             "get_service_template",
             [SERVICE_ONE_ID, FAKE_TEMPLATE_ID],
             [
-                call(f"service-{SERVICE_ONE_ID}-template-{FAKE_TEMPLATE_ID}-version-None"),
+                call(f"service-{SERVICE_ONE_ID}-template-{FAKE_TEMPLATE_ID}-version-None-generation-1234"),
             ],
             None,
             [call(f"/service/{SERVICE_ONE_ID}/template/{FAKE_TEMPLATE_ID}")],
             [
                 call(
-                    f"service-{SERVICE_ONE_ID}-template-{FAKE_TEMPLATE_ID}-version-None",
+                    f"service-{SERVICE_ONE_ID}-template-{FAKE_TEMPLATE_ID}-version-None-generation-1234",
                     '{"data_from": "api"}',
                     ex=2_419_200,
                 ),
@@ -227,7 +227,7 @@ def test_client_returns_count_of_service_templates(
         (
             "get_service_template",
             [SERVICE_ONE_ID, FAKE_TEMPLATE_ID, 1],
-            [call(f"service-{SERVICE_ONE_ID}-template-{FAKE_TEMPLATE_ID}-version-1")],
+            [call(f"service-{SERVICE_ONE_ID}-template-{FAKE_TEMPLATE_ID}-version-1-generation-1234")],
             b'{"data_from": "cache"}',
             [],
             [],
@@ -237,13 +237,13 @@ def test_client_returns_count_of_service_templates(
             "get_service_template",
             [SERVICE_ONE_ID, FAKE_TEMPLATE_ID, 1],
             [
-                call(f"service-{SERVICE_ONE_ID}-template-{FAKE_TEMPLATE_ID}-version-1"),
+                call(f"service-{SERVICE_ONE_ID}-template-{FAKE_TEMPLATE_ID}-version-1-generation-1234"),
             ],
             None,
             [call(f"/service/{SERVICE_ONE_ID}/template/{FAKE_TEMPLATE_ID}/version/1")],
             [
                 call(
-                    f"service-{SERVICE_ONE_ID}-template-{FAKE_TEMPLATE_ID}-version-1",
+                    f"service-{SERVICE_ONE_ID}-template-{FAKE_TEMPLATE_ID}-version-1-generation-1234",
                     '{"data_from": "api"}',
                     ex=2_419_200,
                 ),
@@ -277,7 +277,7 @@ def test_client_returns_count_of_service_templates(
         (
             "get_service_template_versions",
             [SERVICE_ONE_ID, FAKE_TEMPLATE_ID],
-            [call(f"service-{SERVICE_ONE_ID}-template-{FAKE_TEMPLATE_ID}-versions")],
+            [call(f"service-{SERVICE_ONE_ID}-template-{FAKE_TEMPLATE_ID}-versions-generation-1234")],
             b'{"data_from": "cache"}',
             [],
             [],
@@ -287,13 +287,13 @@ def test_client_returns_count_of_service_templates(
             "get_service_template_versions",
             [SERVICE_ONE_ID, FAKE_TEMPLATE_ID],
             [
-                call(f"service-{SERVICE_ONE_ID}-template-{FAKE_TEMPLATE_ID}-versions"),
+                call(f"service-{SERVICE_ONE_ID}-template-{FAKE_TEMPLATE_ID}-versions-generation-1234"),
             ],
             None,
             [call(f"/service/{SERVICE_ONE_ID}/template/{FAKE_TEMPLATE_ID}/versions")],
             [
                 call(
-                    f"service-{SERVICE_ONE_ID}-template-{FAKE_TEMPLATE_ID}-versions",
+                    f"service-{SERVICE_ONE_ID}-template-{FAKE_TEMPLATE_ID}-versions-generation-1234",
                     '{"data_from": "api"}',
                     ex=2_419_200,
                 ),
@@ -343,6 +343,7 @@ def test_returns_value_from_cache(
     expected_api_calls,
     expected_cache_set_calls,
 ):
+    mocker.patch("app.notify_client.cache.get_generation", return_value="1234")
     mock_redis_get = mocker.patch(
         "app.extensions.RedisClient.get",
         return_value=cache_value,
@@ -412,7 +413,7 @@ def test_deletes_service_cache(
 
 
 @pytest.mark.parametrize(
-    "method, extra_args, extra_kwargs, expected_cache_deletes, expected_cache_deletes_by_pattern",
+    "method, extra_args, extra_kwargs, expected_cache_deletes, expected_cache_sets",
     [
         (
             "create_service_template",
@@ -436,35 +437,39 @@ def test_deletes_service_cache(
                 "template_id": FAKE_TEMPLATE_ID,
             },
             [f"service-{SERVICE_ONE_ID}-templates"],
-            [f"service-{SERVICE_ONE_ID}-template-{FAKE_TEMPLATE_ID}*"],
+            [f"service-{SERVICE_ONE_ID}-template-generation", "new-generation"],
         ),
         (
             "redact_service_template",
             [SERVICE_ONE_ID, FAKE_TEMPLATE_ID],
             {},
             [f"service-{SERVICE_ONE_ID}-templates"],
-            [f"service-{SERVICE_ONE_ID}-template-{FAKE_TEMPLATE_ID}*"],
+            [f"service-{SERVICE_ONE_ID}-template-generation", "new-generation"],
         ),
         (
             "update_service_template_sender",
             [SERVICE_ONE_ID, FAKE_TEMPLATE_ID, "foo"],
             {},
             [f"service-{SERVICE_ONE_ID}-templates"],
-            [f"service-{SERVICE_ONE_ID}-template-{FAKE_TEMPLATE_ID}*"],
+            [f"service-{SERVICE_ONE_ID}-template-generation", "new-generation"],
         ),
         (
             "delete_service_template",
             [SERVICE_ONE_ID, FAKE_TEMPLATE_ID],
             {},
             [f"service-{SERVICE_ONE_ID}-templates"],
-            [f"service-{SERVICE_ONE_ID}-template-{FAKE_TEMPLATE_ID}*"],
+            [f"service-{SERVICE_ONE_ID}-template-generation", "new-generation"],
         ),
         (
             "archive_service",
             [SERVICE_ONE_ID, []],
             {},
-            [f"service-{SERVICE_ONE_ID}"],
-            [f"service-{SERVICE_ONE_ID}-template*"],
+            [
+                f"service-{SERVICE_ONE_ID}",
+                f"service-{SERVICE_ONE_ID}-templates",
+                f"service-{SERVICE_ONE_ID}-template-folders",
+            ],
+            [f"service-{SERVICE_ONE_ID}-template-generation", "new-generation"],
         ),
     ],
 )
@@ -475,13 +480,12 @@ def test_deletes_caches_when_modifying_templates(
     extra_args,
     extra_kwargs,
     expected_cache_deletes,
-    expected_cache_deletes_by_pattern,
+    expected_cache_sets,
 ):
     mocker.patch("app.notify_client.current_user", id="1")
+    mocker.patch("app.notify_client.NotifyAdminRequestCache._make_generation", return_value="new-generation")
     mock_redis_delete = mocker.patch("app.extensions.RedisClient.delete", new_callable=RedisClientMock)
-    mock_redis_delete_by_pattern = mocker.patch(
-        "app.extensions.RedisClient.delete_by_pattern", new_callable=RedisClientMock
-    )
+    mock_redis_set = mocker.patch("app.extensions.RedisClient.set", new_callable=RedisClientMock)
     mock_request = mocker.patch("notifications_python_client.base.BaseAPIClient.request")
 
     getattr(service_api_client, method)(*extra_args, **extra_kwargs)
@@ -489,7 +493,7 @@ def test_deletes_caches_when_modifying_templates(
     assert len(mock_request.call_args_list) == 1
 
     mock_redis_delete.assert_called_with_args(*expected_cache_deletes)
-    mock_redis_delete_by_pattern.assert_called_with_args(*expected_cache_deletes_by_pattern)
+    mock_redis_set.assert_called_with_args(*expected_cache_sets)
 
 
 def test_deletes_cached_users_when_archiving_service(
@@ -507,7 +511,7 @@ def test_deletes_cached_users_when_archiving_service(
     service_api_client.archive_service(SERVICE_ONE_ID, ["my-user-id1", "my-user-id2"])
 
     mock_redis_delete.assert_called_with_subset_of_args("user-my-user-id1", "user-my-user-id2")
-    mock_redis_delete_by_pattern.assert_called_with_args(f"service-{SERVICE_ONE_ID}-template*")
+    assert mock_redis_delete_by_pattern.called is False
 
 
 def test_client_gets_guest_list(mocker):
@@ -537,15 +541,14 @@ def test_client_updates_guest_list(mocker):
 def test_client_deletes_service_template_cache_when_service_is_updated(notify_admin, mock_get_user, mocker):
     mocker.patch("app.notify_client.current_user", id="1")
     mocker.patch("notifications_python_client.base.BaseAPIClient.request")
+    mocker.patch("app.notify_client.NotifyAdminRequestCache._make_generation", return_value="new-generation")
     mock_redis_delete = mocker.patch("app.extensions.RedisClient.delete", new_callable=RedisClientMock)
-    mock_redis_delete_by_pattern = mocker.patch(
-        "app.extensions.RedisClient.delete_by_pattern", new_callable=RedisClientMock
-    )
+    mock_redis_set = mocker.patch("app.extensions.RedisClient.set", new_callable=RedisClientMock)
 
     service_api_client.update_reply_to_email_address(SERVICE_ONE_ID, uuid4(), "foo@bar.com")
 
     mock_redis_delete.assert_called_with_args(f"service-{SERVICE_ONE_ID}")
-    mock_redis_delete_by_pattern.assert_called_with_args(f"service-{SERVICE_ONE_ID}-template-*")
+    mock_redis_set.assert_called_with_args(f"service-{SERVICE_ONE_ID}-template-generation", "new-generation")
 
 
 def test_client_updates_service_with_allowed_attributes(
@@ -660,14 +663,13 @@ def test_update_service_join_requests(notify_admin, mocker):
 
 def test_remove_service_inbound_sms_clears_cache(notify_admin, mocker):
     service_id = SERVICE_ONE_ID
+    mocker.patch("app.notify_client.NotifyAdminRequestCache._make_generation", return_value="new-generation")
     mock_redis_delete = mocker.patch("app.extensions.RedisClient.delete", new_callable=RedisClientMock)
-    mock_redis_delete_by_pattern = mocker.patch(
-        "app.extensions.RedisClient.delete_by_pattern", new_callable=RedisClientMock
-    )
+    mock_redis_set = mocker.patch("app.extensions.RedisClient.set", new_callable=RedisClientMock)
     mock_post = mocker.patch("app.notify_client.service_api_client.ServiceAPIClient.post")
 
     service_api_client.remove_service_inbound_sms(service_id=service_id, archive=True)
 
     mock_redis_delete.assert_called_with_args(f"service-{service_id}")
-    mock_redis_delete_by_pattern.assert_called_with_args(f"service-{service_id}-template-*")
+    mock_redis_set.assert_called_with_args(f"service-{service_id}-template-generation", "new-generation")
     mock_post.assert_called_once_with(f"/service/{service_id}/inbound-sms/remove", data={"archive": True})
@@ -1,3 +1,5 @@
+from unittest.mock import call
+
 from app.notify_client.status_api_client import StatusApiClient
 
 
@@ -27,7 +29,10 @@ def test_sets_value_in_cache(mocker):
 
     mock_redis_get.assert_called_once_with("live-service-and-organisation-counts")
     mock_api_get.assert_called_once_with("/_status/live-service-and-organisation-counts")
-    mock_redis_set.assert_called_once_with("live-service-and-organisation-counts", '{"data_from": "api"}', ex=3600)
+    assert mock_redis_set.call_args_list == [
+        call("live-service-and-organisation-counts", '{"data_from": "api"}', ex=86_400),
+        call("live-service-and-organisation-counts-fresh", "1", ex=3600),
+    ]
 
 
 def test_returns_value_from_cache(mocker):
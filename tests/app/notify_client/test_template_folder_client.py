@@ -48,7 +48,9 @@ def test_get_template_folders_calls_correct_api_endpoint(mocker):
 
 
 def test_move_templates_and_folders(mocker):
+    mocker.patch("app.notify_client.NotifyAdminRequestCache._make_generation", return_value="new-generation")
     mock_redis_delete = mocker.patch("app.extensions.RedisClient.delete", new_callable=RedisClientMock)
+    mock_redis_set = mocker.patch("app.extensions.RedisClient.set", new_callable=RedisClientMock)
     mock_api_post = mocker.patch("app.notify_client.NotifyAdminAPIClient.post")
 
     some_service_id = uuid.uuid4()
@@ -69,12 +71,10 @@ def test_move_templates_and_folders(mocker):
         },
     )
     mock_redis_delete.assert_called_with_args(
-        f"service-{some_service_id}-template-a-version-None",
-        f"service-{some_service_id}-template-b-version-None",
-        f"service-{some_service_id}-template-c-version-None",
         f"service-{some_service_id}-templates",
         f"service-{some_service_id}-template-folders",
     )
+    mock_redis_set.assert_called_with_args(f"service-{some_service_id}-template-generation", "new-generation")
 
 
 def test_move_templates_and_folders_to_root(mocker):
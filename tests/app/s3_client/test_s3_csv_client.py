@@ -1,6 +1,13 @@
-from unittest.mock import Mock
+from io import BytesIO
+from unittest.mock import Mock, call
 
-from app.s3_client.s3_csv_client import set_metadata_on_csv_upload
+import pytest
+
+from app.s3_client.s3_csv_client import (
+    get_csv_metadata,
+    s3download_first_rows,
+    set_metadata_on_csv_upload,
+)
 
 
 def test_sets_metadata(client_request, mocker):
@@ -19,3 +26,85 @@ def test_sets_metadata(client_request, mocker):
         MetadataDirective="REPLACE",
         ServerSideEncryption="AES256",
     )
+
+
+def test_get_csv_metadata_reads_metadata_once_per_request(client_request, mocker):
+    mocked_s3_object = Mock(metadata={"original_file_name": "example.csv"})
+    mocked_get_s3_object = mocker.patch(
+        "app.s3_client.s3_csv_client.get_csv_upload",
+        return_value=mocked_s3_object,
+    )
+
+    assert get_csv_metadata("1234", "5678") == {"original_file_name": "example.csv"}
+    assert get_csv_metadata("1234", "5678") == {"original_file_name": "example.csv"}
+
+    mocked_get_s3_object.assert_called_once_with("1234", "5678", None)
+    assert mocked_s3_object.get.called is False
+
+
+def test_get_csv_metadata_returns_metadata_set_during_request(client_request, mocker):
+    mocked_get_s3_object = mocker.patch(
+        "app.s3_client.s3_csv_client.get_csv_upload",
+        return_value=Mock(metadata={"original_file_name": "example.csv"}),
+    )
+
+    get_csv_metadata("1234", "5678")
+    set_metadata_on_csv_upload("1234", "5678", original_file_name="example.csv", notification_count=10)
+
+    assert get_csv_metadata("1234", "5678") == {"original_file_name": "example.csv", "notification_count": "10"}
+    assert mocked_get_s3_object.call_count == 2
+
+
+def _get_range(contents):
+    def get(Range):
+        start, end = map(int, Range.removeprefix("bytes=").split("-"))
+        return {
+            "Body": BytesIO(contents[start : end + 1]),
+            "ContentRange": f"bytes {start}-{min(end, len(contents) - 1)}/{len(contents)}",
+        }
+
+    return get
+
+
+@pytest.mark.parametrize(
+    "number_of_rows, expected_contents, expected_ranges",
+    (
+        (1, "phone number\n07700900001\n", ["bytes=0-19", "bytes=20-39"]),
+        (2, "phone number\n07700900001\n07700900002\n", ["bytes=0-19", "bytes=20-39"]),
+        (
+            10,
+            "phone number\n07700900001\n07700900002\n07700900003",
+            ["bytes=0-19", "bytes=20-39", "bytes=40-59"],
+        ),
+    ),
+)
+def test_s3download_first_rows_only_downloads_rows_needed(
+    client_request, mocker, number_of_rows, expected_contents, expected_ranges
+):
+    mocked_s3_object = Mock()
+    mocked_s3_object.get.side_effect = _get_range(b"phone number\n07700900001\n07700900002\n07700900003")
+    mocker.patch("app.s3_client.s3_csv_client.get_csv_upload", return_value=mocked_s3_object)
+
+    assert s3download_first_rows("1234", "5678", number_of_rows, chunk_size=20) == expected_contents
+    assert mocked_s3_object.get.call_args_list == [call(Range=expected_range) for expected_range in expected_ranges]
+
+
+def test_s3download_first_rows_counts_rows_with_line_breaks_in_cells(client_request, mocker):
+    mocked_s3_object = Mock()
+    mocked_s3_object.get.side_effect = _get_range(
+        b'phone number,address\n07700900001,"1 Street\nTown\nPostcode"\n07700900002,"2 Street"\n07700900003,x\n'
+    )
+    mocker.patch("app.s3_client.s3_csv_client.get_csv_upload", return_value=mocked_s3_object)
+
+    assert s3download_first_rows("1234", "5678", 2, chunk_size=20) == (
+        'phone number,address\n07700900001,"1 Street\nTown\nPostcode"\n07700900002,"2 Street"\n'
+    )
+
+
+def test_s3download_first_rows_handles_characters_split_between_ranges(client_request, mocker):
+    mocked_s3_object = Mock()
+    # ‘é’ is two bytes, and the first range ends between them
+    mocked_s3_object.get.side_effect = _get_range("name\nAndré\nZoë\n".encode())
+    mocker.patch("app.s3_client.s3_csv_client.get_csv_upload", return_value=mocked_s3_object)
+
+    assert s3download_first_rows("1234", "5678", 1, chunk_size=10) == "name\nAndré\n"
@@ -12,6 +12,7 @@ from app.s3_client.s3_letter_upload_client import (
     LetterNotFoundError,
     backup_original_letter_to_s3,
     get_letter_metadata,
+    get_letter_pdf_page_and_metadata,
     upload_letter_to_s3,
 )
 
@@ -117,3 +118,40 @@ def test_get_letter_s3_object_raises_custom_error(will_raise_custom_error, expec
 
     with pytest.raises(expected_exception):
         get_letter_metadata("service", "file")
+
+
+def test_get_letter_pdf_page_and_metadata_splits_and_caches_letter(notify_admin, mocker):
+    metadata = LetterMetadata({"status": "valid", "page_count": "2"})
+    mocker.patch("app.s3_client.s3_letter_upload_client.redis_client.get", return_value=None)
+    mock_get_letter = mocker.patch(
+        "app.s3_client.s3_letter_upload_client.get_letter_pdf_and_metadata", return_value=(b"pdf", metadata)
+    )
+    mock_split = mocker.patch(
+        "app.s3_client.s3_letter_upload_client.split_pdf_into_pages", return_value=[b"page 1", b"page 2"]
+    )
+    mock_cache = mocker.patch("app.s3_client.s3_letter_upload_client._cache_letter_pages_and_metadata")
+
+    assert get_letter_pdf_page_and_metadata("service", "file", 2) == (b"page 2", metadata)
+    assert get_letter_pdf_page_and_metadata("service", "file", 3) == (None, metadata)
+
+    mock_get_letter.assert_called_with("service", "file")
+    mock_split.assert_called_with(b"pdf")
+    mock_cache.assert_called_with("service", "file", [b"page 1", b"page 2"], metadata)
+
+
+def test_get_letter_pdf_page_and_metadata_reads_one_page_from_cache(notify_admin, mocker):
+    mock_redis_get = mocker.patch(
+        "app.s3_client.s3_letter_upload_client.redis_client.get",
+        side_effect=[b'{"status": "invalid", "invalid_pages": "[2]"}', b"page 2"],
+    )
+    mock_get_letter = mocker.patch("app.s3_client.s3_letter_upload_client.get_letter_pdf_and_metadata")
+
+    pdf_page, metadata = get_letter_pdf_page_and_metadata("service", "file", 2)
+
+    assert pdf_page == b"page 2"
+    assert metadata.get("invalid_pages") == "[2]"
+    assert mock_redis_get.call_args_list == [
+        mocker.call("service-service-uploaded-letter-file-metadata"),
+        mocker.call("service-service-uploaded-letter-file-page-2"),
+    ]
+    assert mock_get_letter.called is False
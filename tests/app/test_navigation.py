@@ -179,6 +179,7 @@ EXCLUDED_ENDPOINTS = set(
             "json_updates.conversation_updates",
             "json_updates.get_notifications_page_partials_as_json",
             "json_updates.inbox_updates",
+            "json_updates.report_request_status_json",
             "json_updates.service_dashboard_updates",
             "json_updates.service_verify_reply_to_address_updates",
             "json_updates.view_job_updates",
@@ -258,7 +259,6 @@ EXCLUDED_ENDPOINTS = set(
             "report_ready",
             "report_request",
             "report_request_download",
-            "report_request_status_json",
             "request_to_go_live",
             "request_to_go_live_old_path",
             "resend_email_link",
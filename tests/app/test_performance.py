@@ -0,0 +1,67 @@
+from collections import Counter
+
+import pytest
+from flask import g, request
+
+from app.notify_client.service_api_client import ServiceAPIClient
+from app.performance import backend_call, check_backend_call_budget
+
+
+def test_backend_call_counts_calls_against_the_request(notify_admin):
+    with notify_admin.test_request_context():
+
+        @backend_call("template-preview")
+        def get_preview():
+            return "preview"
+
+        with backend_call("api"):
+            pass
+        assert get_preview() == "preview"
+        assert get_preview() == "preview"
+
+        assert g.backend_calls == Counter({"api": 1, "template-preview": 2})
+
+
+def test_backend_call_counts_calls_which_raise(notify_admin):
+    with notify_admin.test_request_context():
+        with pytest.raises(ValueError), backend_call("api"):
+            raise ValueError
+
+        assert g.backend_calls == Counter({"api": 1})
+
+
+def test_api_client_requests_are_counted(notify_admin, mocker):
+    mocker.patch("app.notify_client.BaseAPIClient._perform_request")
+
+    with notify_admin.test_request_context():
+        g.user_id = None
+        client = ServiceAPIClient(notify_admin)
+        client.get("/service/1234")
+        client.get("/service/1234/templates")
+
+        assert g.backend_calls == Counter({"api": 2})
+
+
+@pytest.mark.parametrize(
+    "backend_calls, budgets, expected_warning",
+    (
+        (Counter({"api": 3}), {}, None),
+        (
+            Counter({"api": 3, "s3": 2}),
+            {},
+            "main.service_dashboard made 5 backend calls, more than its budget of 4 (api: 3, s3: 2)",
+        ),
+        (Counter({"api": 3, "s3": 2}), {"main.service_dashboard": 5}, None),
+    ),
+)
+def test_check_backend_call_budget(notify_admin, mocker, caplog, backend_calls, budgets, expected_warning):
+    mocker.patch.dict(notify_admin.config, {"BACKEND_CALL_BUDGET": 4, "BACKEND_CALL_BUDGETS": budgets})
+
+    with notify_admin.test_request_context(), caplog.at_level("WARNING", "app"):
+        request.url_rule = mocker.Mock(endpoint="main.service_dashboard")
+        g.backend_calls = backend_calls
+        response = mocker.Mock()
+
+        assert check_backend_call_budget(response) == response
+
+    assert [record.message for record in caplog.records] == ([expected_warning] if expected_warning else [])
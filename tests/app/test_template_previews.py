@@ -222,6 +222,23 @@ def test_get_png_for_valid_pdf_page_makes_request(
     )
 
 
+def test_get_png_for_valid_pdf_page_does_not_extract_page_if_already_extracted(
+    client_request,
+    mocker,
+    mock_onwards_request_headers,
+):
+    mock_extract_page = mocker.patch("app.template_previews.extract_page_from_pdf")
+    request_mock = mocker.patch(
+        "app.template_preview_client.requests_session.post",
+        return_value=Mock(content="a", status_code="b", headers={"content-type": "image/png"}),
+    )
+
+    template_preview_client.get_png_for_valid_pdf_page(b"pdf page", "2", page_already_extracted=True)
+
+    assert mock_extract_page.called is False
+    assert request_mock.call_args[1]["data"] == base64.b64encode(b"pdf page").decode("utf-8")
+
+
 def test_get_png_for_invalid_pdf_page_makes_request(
     client_request,
     mocker,
@@ -364,3 +381,133 @@ def test_sanitise_letter_calls_template_preview_sanitise_endpoint_with_file_for_
         },
         data="pdf_data",
     )
+
+
+def test_get_preview_for_templated_letter_caches_preview_by_content(
+    client_request,
+    mocker,
+    mock_onwards_request_headers,
+):
+    request_mock = mocker.patch(
+        "app.template_preview_client.requests_session.post",
+        return_value=Mock(content=b"png", status_code=200, headers={"content-type": "image/png"}),
+    )
+    mock_redis_get = mocker.patch("app.template_previews.redis_client.get", return_value=None)
+    mock_redis_set = mocker.patch("app.template_previews.redis_client.set")
+    service = mocker.Mock(spec=Service, letter_branding=LetterBranding({"filename": "hm-government"}))
+    template = create_notification(template_type="letter")["template"]
+
+    content, status_code, headers = template_preview_client.get_preview_for_templated_letter(
+        template, "png", page="1", service=service
+    )
+
+    assert (content, status_code) == (b"png", 200)
+    headers = dict(headers)
+    assert headers["Content-Type"] == "image/png"
+    assert headers["Cache-Control"] == "private, no-cache"
+    digest = headers["ETag"].strip('"')
+
+    assert request_mock.call_count == 1
+    mock_redis_get.assert_called_once_with(f"letter-preview-{digest}")
+    mock_redis_set.assert_called_once_with(f"letter-preview-{digest}", b"png", ex=86_400)
+
+    # a different page is a different preview
+    template_preview_client.get_preview_for_templated_letter(template, "png", page="2", service=service)
+    assert mock_redis_set.call_args_list[1][0][0] != f"letter-preview-{digest}"
+
+
+@pytest.mark.parametrize(
+    "filetype, content",
+    (
+        ("pdf", b"pdf"),
+        ("png", b"x" * (512 * 1024 + 1)),
+    ),
+)
+def test_get_preview_for_templated_letter_does_not_cache_pdfs_or_large_pages(
+    client_request,
+    mocker,
+    filetype,
+    content,
+):
+    mocker.patch(
+        "app.template_preview_client.requests_session.post",
+        return_value=Mock(content=content, status_code=200, headers={}),
+    )
+    mocker.patch("app.template_previews.redis_client.get", return_value=None)
+    mock_redis_set = mocker.patch("app.template_previews.redis_client.set")
+    service = mocker.Mock(spec=Service, letter_branding=LetterBranding({"filename": "hm-government"}))
+
+    response_content, status_code, headers = template_preview_client.get_preview_for_templated_letter(
+        create_notification(template_type="letter")["template"], filetype, service=service
+    )
+
+    assert (response_content, status_code) == (content, 200)
+    assert dict(headers)["Cache-Control"] == "private, no-cache"
+    assert mock_redis_set.called is False
+
+
+def test_get_preview_for_templated_letter_returns_cached_preview(
+    client_request,
+    mocker,
+):
+    request_mock = mocker.patch("app.template_preview_client.requests_session.post")
+    mocker.patch("app.template_previews.redis_client.get", return_value=b"cached png")
+    service = mocker.Mock(spec=Service, letter_branding=LetterBranding({"filename": "hm-government"}))
+
+    content, status_code, headers = template_preview_client.get_preview_for_templated_letter(
+        create_notification(template_type="letter")["template"], "png", page="1", service=service
+    )
+
+    assert (content, status_code) == (b"cached png", 200)
+    assert dict(headers)["Content-Type"] == "image/png"
+    assert request_mock.called is False
+
+
+def test_get_preview_for_templated_letter_returns_not_modified_if_browser_has_preview(
+    notify_admin,
+    mocker,
+):
+    request_mock = mocker.patch("app.template_preview_client.requests_session.post")
+    mock_redis_get = mocker.patch("app.template_previews.redis_client.get")
+    service = mocker.Mock(spec=Service, letter_branding=LetterBranding({"filename": "hm-government"}))
+    template = create_notification(template_type="letter")["template"]
+    digest = template_preview_client._get_preview_digest(
+        "preview",
+        "png",
+        "1",
+        {
+            "letter_contact_block": template.get("reply_to_text", ""),
+            "template": template,
+            "values": None,
+            "filename": "hm-government",
+        },
+    )
+
+    with notify_admin.test_request_context(headers={"If-None-Match": f'"{digest}"'}):
+        content, status_code, headers = template_preview_client.get_preview_for_templated_letter(
+            template, "png", page="1", service=service
+        )
+
+    assert (content, status_code) == (b"", 304)
+    assert dict(headers)["ETag"] == f'"{digest}"'
+    assert request_mock.called is False
+    assert mock_redis_get.called is False
+
+
+def test_get_png_for_valid_pdf_page_is_cached_by_file_contents(
+    client_request,
+    mocker,
+):
+    mocker.patch("app.template_previews.extract_page_from_pdf", return_value=b"pdf page")
+    mocker.patch(
+        "app.template_preview_client.requests_session.post",
+        return_value=Mock(content=b"png", status_code=200, headers={}),
+    )
+    mocker.patch("app.template_previews.redis_client.get", return_value=None)
+    mock_redis_set = mocker.patch("app.template_previews.redis_client.set")
+
+    template_preview_client.get_png_for_valid_pdf_page(b"pdf file", "1")
+    template_preview_client.get_png_for_valid_pdf_page(b"other pdf file", "1")
+
+    first_key, second_key = (call[0][0] for call in mock_redis_set.call_args_list)
+    assert first_key != second_key
@@ -1,4 +1,3 @@
-from collections import namedtuple
 from csv import DictReader
 from io import StringIO
 from unittest.mock import Mock
@@ -6,7 +5,13 @@ from unittest.mock import Mock
 import pytest
 from notifications_python_client.errors import HTTPError
 
-from app.utils.csv import generate_notifications_csv, get_errors_for_csv
+from app.utils.csv import (
+    OriginalUploadRows,
+    RowErrors,
+    generate_notifications_csv,
+    get_errors_for_csv,
+    stream_notifications_csv,
+)
 from tests import sample_uuid
 from tests.conftest import fake_uuid
 
@@ -286,16 +291,128 @@ def test_generate_notifications_csv_when_rows_number_divisible_by_page_size(
     assert mock_get_notifications.mock_calls[2][2]["page"] == 3
 
 
-MockRecipients = namedtuple(
-    "RecipientCSV",
-    [
-        "rows_with_bad_recipients",
-        "rows_with_missing_data",
-        "rows_with_message_too_long",
-        "rows_with_empty_message",
-        "rows_with_bad_qr_codes",
-    ],
-)
+def test_generate_notifications_csv_yields_one_chunk_per_page(
+    notify_admin,
+    mocker,
+):
+    service_id = "1234"
+    mocker.patch(
+        "app.models.notification.NotificationsForCSV._get_items",
+        side_effect=[
+            _get_notifications_csv(rows=3, job_id=None)(service_id),
+            _get_notifications_csv(rows=2, job_id=None, row_number=4)(service_id),
+        ],
+    )
+
+    csv_content = list(generate_notifications_csv(service_id=service_id, page_size=3))
+
+    assert len(csv_content) == 3
+    assert csv_content[1].count("\r\n") == 3
+    assert csv_content[2].count("\r\n") == 2
+
+
+def test_stream_notifications_csv_gets_first_page_before_streaming(notify_admin, mocker):
+    mock_get_items = mocker.patch(
+        "app.models.notification.NotificationsForCSV._get_items",
+        side_effect=[
+            _get_notifications_csv(rows=3, job_id=None)("1234"),
+            _get_notifications_csv(rows=2, job_id=None, row_number=4)("1234"),
+        ],
+    )
+
+    chunks = stream_notifications_csv(service_id="1234", page_size=3)
+    assert mock_get_items.call_count == 1
+
+    assert len(list(chunks)) == 3
+    assert mock_get_items.call_count == 2
+
+
+def test_stream_notifications_csv_raises_errors_from_first_page(notify_admin, mocker):
+    mocker.patch(
+        "app.models.notification.NotificationsForCSV._get_items",
+        side_effect=HTTPError(response=Mock(status_code=500), message="Internal server error"),
+    )
+
+    with pytest.raises(HTTPError):
+        stream_notifications_csv(service_id="1234", page_size=3)
+
+
+def test_stream_notifications_csv_logs_errors_after_first_page(notify_admin, mocker, caplog):
+    mocker.patch(
+        "app.models.notification.NotificationsForCSV._get_items",
+        side_effect=[
+            _get_notifications_csv(rows=3, job_id=None)("1234"),
+            HTTPError(response=Mock(status_code=500), message="Internal server error"),
+        ],
+    )
+    chunks = stream_notifications_csv(service_id="1234", page_size=3)
+
+    with pytest.raises(HTTPError):
+        list(chunks)
+
+    assert "Error generating notifications CSV, so the file sent was incomplete" in caplog.messages
+
+
+def test_original_upload_rows_matches_recipient_csv_row_numbers(notify_admin):
+    original_upload = OriginalUploadRows(
+        "\n".join(
+            [
+                "phone number, name",
+                "07700900002, Anne ",
+                "",
+                '07700900003,"Multi\nline",07700900004',
+                "07700900005",
+            ]
+        ),
+        "sms",
+    )
+
+    assert original_upload.column_headers == ["phone number", "name"]
+    assert len(original_upload) == 4
+    assert original_upload[0] == ["07700900002", "Anne"]
+    assert original_upload[1] == [None, None]
+    # Like RecipientCSV, cells past the last column header are ignored, and missing ones are empty
+    assert original_upload[2] == ["07700900003", "Multi\nline"]
+    assert original_upload[3] == ["07700900005", None]
+
+    with pytest.raises(IndexError):
+        original_upload[4]
+
+
+def _mock_recipients(
+    rows_with_bad_recipients,
+    rows_with_missing_data,
+    rows_with_message_too_long,
+    rows_with_empty_message,
+    rows_with_bad_qr_codes,
+    max_errors_shown=50,
+):
+    rows = []
+    for index in range(15):
+        row = Mock(
+            index=index,
+            has_bad_recipient=index in rows_with_bad_recipients,
+            has_missing_data=index in rows_with_missing_data,
+            message_too_long=index in rows_with_message_too_long,
+            message_empty=index in rows_with_empty_message,
+            qr_code_too_long=index in rows_with_bad_qr_codes,
+        )
+        row.has_error = any(
+            (
+                row.has_bad_recipient,
+                row.has_missing_data,
+                row.message_too_long,
+                row.message_empty,
+                row.qr_code_too_long,
+            )
+        )
+        rows.append(row)
+    return Mock(
+        rows=rows,
+        initial_rows=iter(rows[:3]),
+        max_errors_shown=max_errors_shown,
+        missing_column_headers=set(),
+    )
 
 
 @pytest.mark.parametrize(
@@ -330,7 +447,7 @@ def test_get_errors_for_csv(
 ):
     assert (
         get_errors_for_csv(
-            MockRecipients(
+            _mock_recipients(
                 rows_with_bad_recipients,
                 rows_with_missing_data,
                 rows_with_message_too_long,
@@ -341,3 +458,37 @@ def test_get_errors_for_csv(
         )
         == expected_errors
     )
+
+
+@pytest.mark.parametrize(
+    "rows_with_bad_recipients, max_errors_shown, expected_displayed_rows",
+    [
+        (set(), 50, [6]),
+        ({2, 4}, 50, [2, 4, 6]),
+        ({2, 4}, 2, [2, 4]),
+    ],
+)
+def test_row_errors_counts_errors_and_keeps_displayed_rows(
+    rows_with_bad_recipients,
+    max_errors_shown,
+    expected_displayed_rows,
+):
+    row_errors = RowErrors(
+        _mock_recipients(rows_with_bad_recipients, {6}, set(), set(), set(), max_errors_shown=max_errors_shown)
+    )
+
+    assert row_errors.counts == {
+        "has_bad_recipient": len(rows_with_bad_recipients),
+        "has_missing_data": 1,
+        "message_too_long": 0,
+        "message_empty": 0,
+        "qr_code_too_long": 0,
+    }
+    assert [row.index for row in row_errors.displayed_rows] == expected_displayed_rows
+
+
+def test_row_errors_shows_initial_rows_if_there_are_no_errors():
+    row_errors = RowErrors(_mock_recipients(set(), set(), set(), set(), set()))
+
+    assert row_errors.get_messages("sms") == []
+    assert [row.index for row in row_errors.displayed_rows] == [0, 1, 2]
@@ -0,0 +1,89 @@
+from http.client import HTTPMessage
+
+import requests
+from requests.cookies import extract_cookies_to_jar
+from urllib3 import HTTPConnectionPool, HTTPSConnectionPool
+
+from app.notify_client.service_api_client import ServiceAPIClient
+from app.template_previews import TemplatePreviewClient
+from app.utils.http import (
+    HTTP_POOL_CONNECTIONS_CREATED,
+    InstrumentedHTTPConnectionPool,
+    InstrumentedHTTPSConnectionPool,
+    PooledHTTPAdapter,
+    get_http_session,
+)
+
+
+def test_get_http_session_is_shared_between_clients(notify_admin):
+    session = get_http_session(notify_admin)
+
+    assert get_http_session(notify_admin) is session
+    assert ServiceAPIClient(notify_admin).request_session is session
+    assert TemplatePreviewClient(notify_admin).requests_session is session
+
+
+def test_get_http_session_configures_connection_pool(notify_admin, mocker):
+    mocker.patch.dict(notify_admin.extensions)
+    notify_admin.extensions.pop("http_session", None)
+    mocker.patch.dict(
+        notify_admin.config,
+        {
+            "HTTP_POOL_CONNECTIONS": 3,
+            "HTTP_POOL_MAXSIZE": 25,
+            "HTTP_POOL_BLOCK": True,
+            "HTTP_MAX_RETRIES": 4,
+            "HTTP_RETRY_BACKOFF_FACTOR": 0.5,
+        },
+    )
+
+    adapter = get_http_session(notify_admin).get_adapter("https://api.example.com")
+
+    assert isinstance(adapter, PooledHTTPAdapter)
+    assert adapter._pool_connections == 3
+    assert adapter._pool_maxsize == 25
+    assert adapter._pool_block is True
+    assert adapter.max_retries.total == 4
+    assert adapter.max_retries.backoff_factor == 0.5
+    assert "POST" not in adapter.max_retries.allowed_methods
+
+
+def test_get_http_session_does_not_keep_cookies(notify_admin, mocker):
+    mocker.patch.dict(notify_admin.extensions)
+    notify_admin.extensions.pop("http_session", None)
+    session = get_http_session(notify_admin)
+    headers = HTTPMessage()
+    headers["Set-Cookie"] = "session=user-1; Path=/"
+
+    # This is how `requests` stores the cookies from each response in the session
+    extract_cookies_to_jar(
+        session.cookies,
+        requests.Request("GET", "https://api.example.com/one").prepare(),
+        mocker.Mock(_original_response=mocker.Mock(msg=headers)),
+    )
+
+    assert len(session.cookies) == 0
+    assert "Cookie" not in session.prepare_request(requests.Request("GET", "https://api.example.com/two")).headers
+
+
+def test_pooled_http_adapter_only_records_stats_if_enabled():
+    assert PooledHTTPAdapter().poolmanager.pool_classes_by_scheme == {
+        "http": HTTPConnectionPool,
+        "https": HTTPSConnectionPool,
+    }
+    assert PooledHTTPAdapter(record_pool_stats=True).poolmanager.pool_classes_by_scheme == {
+        "http": InstrumentedHTTPConnectionPool,
+        "https": InstrumentedHTTPSConnectionPool,
+    }
+
+
+def test_instrumented_pool_counts_new_connections():
+    pool = InstrumentedHTTPConnectionPool("api.example.com", maxsize=1)
+    connections_created = HTTP_POOL_CONNECTIONS_CREATED.labels(host="api.example.com")
+    before = connections_created._value.get()
+
+    conn = pool._get_conn()
+    pool._put_conn(conn)
+    assert pool._get_conn() is conn
+
+    assert connections_created._value.get() == before + 1
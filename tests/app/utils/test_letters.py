@@ -1,11 +1,15 @@
+from io import BytesIO
+
 import pytest
 from flask import url_for
 from freezegun import freeze_time
+from pypdf import PdfReader
 
 from app.utils.letters import (
     get_letter_printing_statement,
     get_letter_validation_error,
     printing_today_or_tomorrow,
+    split_pdf_into_pages,
 )
 from tests import NotifyBeautifulSoup
 
@@ -232,3 +236,15 @@ def test_get_letter_validation_error_for_known_errors(
     assert summary.text == expected_summary
     if summary.select_one("a"):
         assert summary.select_one("a")["href"] == url_for("main.guidance_upload_a_letter")
+
+
+def test_split_pdf_into_pages():
+    with open("tests/test_pdf_files/multi_page_pdf.pdf", "rb") as file:
+        pdf_file = file.read()
+
+    pages = split_pdf_into_pages(pdf_file)
+
+    assert len(pages) == len(PdfReader(BytesIO(pdf_file)).pages)
+    for pdf_page, original_page in zip(pages, PdfReader(BytesIO(pdf_file)).pages, strict=True):
+        [page] = PdfReader(BytesIO(pdf_page)).pages
+        assert page.extract_text() == original_page.extract_text()
@@ -0,0 +1,68 @@
+import pytest
+from freezegun import freeze_time
+
+from app.models.job import Job
+from app.utils.polling import get_fingerprint, get_poll_interval, json_updates_response
+
+
+@freeze_time("2024-01-01 12:00:00")
+def test_get_fingerprint_only_changes_when_the_data_does():
+    assert get_fingerprint({"a": 1, "b": [2, 3]}) == get_fingerprint({"b": [2, 3], "a": 1})
+    assert get_fingerprint({"a": 1}) != get_fingerprint({"a": 2})
+    assert get_fingerprint(Job({"id": "1", "job_status": "in progress"})) == get_fingerprint(
+        {"id": "1", "job_status": "in progress"}
+    )
+    assert len(get_fingerprint({"a": 1})) == 32
+
+
+def test_get_fingerprint_changes_every_minute():
+    with freeze_time("2024-01-01 12:00:00"):
+        fingerprint = get_fingerprint({"a": 1})
+
+    with freeze_time("2024-01-01 12:00:59"):
+        assert get_fingerprint({"a": 1}) == fingerprint
+
+    with freeze_time("2024-01-01 12:01:00"):
+        assert get_fingerprint({"a": 1}) != fingerprint
+
+
+@pytest.mark.parametrize(
+    "unchanged, finished, expected_interval",
+    (
+        (False, False, 2),
+        (True, False, 10),
+        (False, True, 30),
+        (True, True, 30),
+    ),
+)
+def test_get_poll_interval(unchanged, finished, expected_interval):
+    assert get_poll_interval(unchanged=unchanged, finished=finished) == expected_interval
+
+
+def test_json_updates_response_renders_partials_if_the_browser_has_an_old_version(notify_admin, mocker):
+    get_partials = mocker.Mock(return_value={"counts": "<p>1</p>"})
+
+    with notify_admin.test_request_context(headers={"If-None-Match": '"old"'}):
+        response = json_updates_response("new", get_partials)
+
+    assert response.status_code == 200
+    assert response.json == {"counts": "<p>1</p>"}
+    assert response.headers["ETag"] == '"new"'
+    assert response.headers["X-Poll-Interval"] == "2000"
+    get_partials.assert_called_once_with()
+
+
+@pytest.mark.parametrize("finished, expected_interval", ((False, "10000"), (True, "30000")))
+def test_json_updates_response_is_empty_if_the_browser_has_the_latest_version(
+    notify_admin, mocker, finished, expected_interval
+):
+    get_partials = mocker.Mock()
+
+    with notify_admin.test_request_context(headers={"If-None-Match": '"new"'}):
+        response = json_updates_response("new", get_partials, finished=finished)
+
+    assert response.status_code == 304
+    assert response.get_data() == b""
+    assert response.headers["ETag"] == '"new"'
+    assert response.headers["X-Poll-Interval"] == expected_interval
+    assert get_partials.called is False
@@ -35,6 +35,7 @@ def test_get_page_counts_for_letter_caches(
 ):
     client_request.login(api_user_active, service_one)
 
+    mocker.patch("app.notify_client.cache.get_generation", return_value="1234")
     mock_redis_get = mocker.patch(
         "app.extensions.RedisClient.get",
         return_value=None,
@@ -56,9 +57,11 @@ def test_get_page_counts_for_letter_caches(
         assert template.page_count == 5
 
     # Redis and template preview only get called once each because the instance also caches the value
-    mock_redis_get.assert_called_once_with(f"service-{SERVICE_ONE_ID}-template-{fake_uuid}-version-1-all-page-counts")
+    mock_redis_get.assert_called_once_with(
+        f"service-{SERVICE_ONE_ID}-template-{fake_uuid}-version-1-all-page-counts-generation-1234"
+    )
     mock_redis_set.assert_called_once_with(
-        f"service-{SERVICE_ONE_ID}-template-{fake_uuid}-version-1-all-page-counts",
+        f"service-{SERVICE_ONE_ID}-template-{fake_uuid}-version-1-all-page-counts-generation-1234",
         '{"count": 5, "welsh_page_count": 0, "attachment_page_count": 0}',
         ex=2_419_200,
     )
@@ -74,6 +77,7 @@ def test_get_page_counts_for_letter_returns_cached_value(
 ):
     client_request.login(api_user_active, service_one)
 
+    mocker.patch("app.notify_client.cache.get_generation", return_value="1234")
     mock_redis_get = mocker.patch(
         "app.extensions.RedisClient.get",
         return_value=b'{"count": 5, "welsh_page_count": 0, "attachment_page_count": 0}',
@@ -91,7 +95,9 @@ def test_get_page_counts_for_letter_returns_cached_value(
         assert template.page_count == 5
 
     # Redis only gets called once because the instance also caches the value
-    mock_redis_get.assert_called_once_with(f"service-{SERVICE_ONE_ID}-template-{fake_uuid}-version-1-all-page-counts")
+    mock_redis_get.assert_called_once_with(
+        f"service-{SERVICE_ONE_ID}-template-{fake_uuid}-version-1-all-page-counts-generation-1234"
+    )
 
 
 def test_get_page_counts_for_letter_does_not_cache_for_personalised_letters(
@@ -3095,18 +3095,20 @@ def client_request(request, _logged_in_client, mocker, service_one, fake_nonce):
             return NotifyBeautifulSoup(resp.data.decode("utf-8"), "html.parser")
 
         @staticmethod
-        def get_response(endpoint, _expected_status=200, _optional_args="", **endpoint_kwargs):
+        def get_response(endpoint, _expected_status=200, _optional_args="", _headers=None, **endpoint_kwargs):
             return ClientRequest.get_response_from_url(
                 url_for(endpoint, **(endpoint_kwargs or {})) + _optional_args,
                 _expected_status=_expected_status,
+                _headers=_headers,
             )
 
         @staticmethod
         def get_response_from_url(
             url,
             _expected_status=200,
+            _headers=None,
         ):
-            resp = _logged_in_client.get(url)
+            resp = _logged_in_client.get(url, headers=_headers)
             assert resp.status_code == _expected_status
             return resp
 
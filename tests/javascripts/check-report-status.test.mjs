@@ -83,6 +83,29 @@ describe('CheckReportStatus', () => {
       expect(checkReportStatus.checkStatus).toHaveBeenCalledTimes(3);
     });
 
+    it('should send the status it already knows so the server can wait for it to change', async () => {
+      mockFetch.mockResolvedValue({
+        ok: true,
+        json: () => Promise.resolve({ status: 'pending' }),
+      });
+      await checkReportStatus.checkStatus();
+      jest.advanceTimersByTime(checkReportStatus.fetchInterval + 1);
+      await checkReportStatus.currentCheck;
+      expect(mockFetch).toHaveBeenLastCalledWith(`${route}/status.json?status=pending`);
+    });
+
+    it('should check again straight away if the server waited longer than the poll interval', async () => {
+      mockFetch.mockImplementationOnce(() => {
+        jest.setSystemTime(Date.now() + checkReportStatus.fetchInterval + 5000);
+        return Promise.resolve({
+          ok: true,
+          json: () => Promise.resolve({ status: 'pending' }),
+        });
+      });
+      await checkReportStatus.checkStatus();
+      expect(setTimeout).toHaveBeenLastCalledWith(expect.any(Function), 0);
+    });
+
     describe.each(['stored', 'failed'])("if the download status is '%s'", (status) => {
       beforeEach(async () => {
         mockFetch.mockResolvedValueOnce({
@@ -22,12 +22,19 @@ beforeAll(() => {
   serverResponse = {
     responseTimeInMilliseconds: 1000,
     statusCode: 200,
+    headers: {},
     complete: () => {
+      const jqXHR = {
+        getResponseHeader: name => serverResponse.headers[name] || null
+      };
       responseObj.status = serverResponse.statusCode
-      if (serverResponse.statusCode >= 300) {
+      if (serverResponse.statusCode === 304) {
+        // jQuery treats a 304 as a success, with no response body
+        jqueryAJAXReturnObj.callbacks.done(undefined, 'notmodified', jqXHR);
+      } else if (serverResponse.statusCode >= 300) {
         jqueryAJAXReturnObj.callbacks.fail(responseObj);
       } else {
-        jqueryAJAXReturnObj.callbacks.done(responseObj);
+        jqueryAJAXReturnObj.callbacks.done(responseObj, 'success', jqXHR);
       }
     }
   };
@@ -111,6 +118,13 @@ describe('Update content', () => {
 
       });
 
+      test("It should ask jQuery to send the ETag of the last response", () => {
+
+        jest.advanceTimersByTime(2000);
+        expect($.ajax.mock.calls[0][1].ifModified).toBe(true);
+
+      });
+
       test("It shouldn't send any data as part of the requests", () => {
 
         jest.advanceTimersByTime(2000);
@@ -159,6 +173,41 @@ describe('Update content', () => {
 
       });
 
+      test("It should wait for longer if the server asks it to", () => {
+
+        // Time from start of module: 2000ms
+        jest.advanceTimersByTime(2000);
+        expect($.ajax).toHaveBeenCalledTimes(1);
+
+        // Time from start of module: 3000ms
+        // Simulate server responding 1000ms after request is made, asking for a 10 second interval
+        jest.advanceTimersByTime(serverResponse.responseTimeInMilliseconds);
+        serverResponse.headers['X-Poll-Interval'] = '10000';
+        serverResponse.complete();
+
+        // Time from start of module: 4000ms
+        // Second call still uses the default interval
+        jest.advanceTimersByTime(1000);
+        expect($.ajax).toHaveBeenCalledTimes(2);
+
+        // Time from start of module: 5000ms
+        jest.advanceTimersByTime(serverResponse.responseTimeInMilliseconds);
+        serverResponse.complete();
+
+        // Time from start of module: 13999ms
+        // Third call happens 10000ms after the second, rather than the 6905ms the response time would give
+        jest.advanceTimersByTime(8999);
+        expect($.ajax).toHaveBeenCalledTimes(2);
+
+        // Time from start of module: 14000ms
+        jest.advanceTimersByTime(1);
+        expect($.ajax).toHaveBeenCalledTimes(3);
+
+        // Tidy up
+        delete serverResponse.headers['X-Poll-Interval'];
+
+      });
+
       each([
         [1000, 0],
         [1500, 100],
@@ -208,6 +257,13 @@ describe('Update content', () => {
 
       })
 
+      test("requests shouldn't ask jQuery to send the ETag of the last response", () => {
+
+        jest.advanceTimersByTime(2000);
+        expect($.ajax.mock.calls[0][1].ifModified).toBe(false);
+
+      })
+
       test("requests should use the data from the form", () => {
 
         jest.advanceTimersByTime(2000);
@@ -389,6 +445,28 @@ describe('Update content', () => {
       expect(updateEventCallbackSpy).not.toHaveBeenCalled()
     });
 
+    test("If the server responds that nothing has changed, the DOM should stay the same and no update event should fire", () => {
+
+      const updateEventCallbackSpy = jest.fn();
+      $(document).on('updateContent.onafterupdate', updateEventCallbackSpy);
+
+      // start the module
+      window.GOVUK.notifyModules.start();
+
+      // move to the time the first request is fired
+      jest.advanceTimersByTime(2000);
+
+      // simulate a 304 response
+      jest.advanceTimersByTime(serverResponse.responseTimeInMilliseconds);
+      serverResponse.statusCode = 304;
+      serverResponse.complete();
+      serverResponse.statusCode = 200;
+
+      // check a sample DOM node is unchanged
+      expect(document.querySelectorAll('.big-number-number')[0].textContent.trim()).toEqual("0");
+      expect(updateEventCallbackSpy).not.toHaveBeenCalled()
+    });
+
     test("If the response contains changes, it should update the DOM with them and fire an update event", () => {
 
       const updateEventCallbackSpy = jest.fn();